@@ -90,6 +90,239 @@ class GradTable(object):
             assert gx == []
 
 
+class RetainedArrayTable(object):
+
+    """Reference counts of arrays retained for backprop
+
+    The table counts the function nodes in the backward graph which use each
+    non-leaf variable node, i.e. its creator and the function nodes which take
+    it as an input. The array retained by the node is released when all of
+    them have been processed, instead of when the graph is released. Arrays
+    retained as outputs by a function node are released when it is
+    processed. The table also tracks the total size of the retained arrays
+    and gradients to record the peak during the backprop.
+
+    Args:
+        output_nodes (list of ~chainer.variable.VariableNode): Nodes that the
+            backprop starts from.
+
+    """
+
+    def __init__(self, output_nodes):
+        self.counts = {}
+        # Maps ids of the retained arrays to their sizes and the numbers of
+        # their holders.
+        self.arrays = {}
+        self.nbytes = 0
+        self.peak = 0
+
+        funcs = [y.creator_node for y in output_nodes
+                 if y.creator_node is not None]
+        seen = set(funcs)
+        while funcs:
+            func = funcs.pop()
+            self._add_holder(func._retained_output_data)
+            for y in func.outputs:
+                self._count(y())
+            for x in func.inputs:
+                self._count(x)
+                creator = x.creator_node
+                if creator is not None and creator not in seen:
+                    seen.add(creator)
+                    funcs.append(creator)
+
+    def _count(self, node):
+        if node is None or node.creator_node is None:
+            return
+        if node in self.counts:
+            self.counts[node] += 1
+        else:
+            self.counts[node] = 1
+            self._add_holder((node._data,))
+
+    def _add_holder(self, arrays):
+        for array in arrays or ():
+            if array is None:
+                continue
+            entry = self.arrays.get(id(array))
+            if entry is None:
+                self.arrays[id(array)] = [array.nbytes, 1]
+                self.nbytes += array.nbytes
+            else:
+                entry[1] += 1
+
+    def _remove_holder(self, arrays):
+        for array in arrays or ():
+            if array is None:
+                continue
+            entry = self.arrays[id(array)]
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self.arrays[id(array)]
+                self.nbytes -= entry[0]
+
+    def record(self, grad_table):
+        """Records the current size of arrays held by the backprop."""
+        nbytes = self.nbytes
+        for grads in grad_table.grads.values():
+            for g in grads:
+                if g is not None and g.array is not None:
+                    nbytes += g.array.nbytes
+        if nbytes > self.peak:
+            self.peak = nbytes
+
+    def release(self, func):
+        """Releases the arrays no longer needed after ``func`` is processed.
+        """
+        if (func._input_indexes_to_retain is not None or
+                func._output_indexes_to_retain is not None):
+            func._retained_arrays_released = True
+        self._remove_holder(func._retained_output_data)
+        func._retained_output_data = None
+        nodes = [y() for y in func.outputs]
+        nodes.extend(func.inputs)
+        for node in nodes:
+            count = self.counts.get(node)
+            if count is None:
+                continue
+            if count > 1:
+                self.counts[node] = count - 1
+                continue
+            del self.counts[node]
+            self._remove_holder((node._data,))
+            # Keep the shape and dtype of the node.
+            node._data = None
+            node._data_released = True
+
+
+def check_retained_arrays(func):
+    """Raises an error if arrays retained by ``func`` have been released.
+
+    They are released by backward with ``release_retained_arrays=True``
+    through the graph of ``func``, or through another graph sharing the
+    retained input variables with it.
+
+    """
+    if not func._retained_arrays_released:
+        indexes = func._input_indexes_to_retain
+        if indexes is None:
+            return
+        inputs = func.inputs
+        if not any(inputs[i]._data_released and inputs[i]._data is None and
+                   inputs[i].get_variable_or_none() is None
+                   for i in indexes):
+            return
+    raise RuntimeError(
+        'Cannot backprop through {} again since its retained arrays '
+        'have been released by backward with '
+        'release_retained_arrays=True.'.format(func.label))
+
+
+class DependencyTable(object):
+
+    """Dependency counts of function nodes in a backward graph
+
+    The table counts the function nodes in the backward graph which take each
+    variable node as an input. A node is complete when all of them have been
+    processed, and a function node is ready when all of its outputs are
+    complete, i.e. the gradients w.r.t. the outputs are final. The gradients
+    given to a node by different function nodes are kept until the node is
+    complete, and then they are returned in a fixed order that does not depend
+    on the order in which the function nodes are processed.
+
+    Args:
+        output_nodes (list of ~chainer.variable.VariableNode): Nodes that the
+            backprop starts from.
+
+    """
+
+    def __init__(self, output_nodes):
+        # Maps function nodes to the keys ordering them.
+        self.keys = {}
+        self.node_counts = {}
+        self.func_counts = {}
+        self.pending_grads = {}
+
+        funcs = []
+        for y in output_nodes:
+            func = y.creator_node
+            if func is not None and func not in self.keys:
+                self._add_func(func)
+                funcs.append(func)
+        while funcs:
+            func = funcs.pop()
+            for x in _unique(func.inputs):
+                self.node_counts[x] = self.node_counts.get(x, 0) + 1
+                creator = x.creator_node
+                if creator is not None and creator not in self.keys:
+                    self._add_func(creator)
+                    funcs.append(creator)
+
+        for func in self.keys:
+            self.func_counts[func] = sum(
+                1 for y in _unique([y() for y in func.outputs])
+                if y in self.node_counts)
+
+    def _add_func(self, func):
+        # The functions of higher ranks come first as in the sequential
+        # backprop.
+        self.keys[func] = (-func.rank, len(self.keys))
+
+    def initial_funcs(self):
+        """Returns the function nodes that are ready before any processing."""
+        return [func for func, count in six.iteritems(self.func_counts)
+                if count == 0]
+
+    def done(self, func, grad_inputs):
+        """Marks a function node as processed.
+
+        Args:
+            func (~chainer.FunctionNode): The processed function node.
+            grad_inputs (dict): Gradients w.r.t. the input nodes computed by
+                ``func``. Each value is a list of variables.
+
+        Returns:
+            tuple: A list of pairs of the newly completed nodes and the lists
+            of their gradients, and a list of the function nodes that have
+            become ready.
+
+        """
+        key = self.keys[func]
+        completed = []
+        ready = []
+        for x in _unique(func.inputs):
+            gx = grad_inputs.get(x)
+            if gx:
+                self.pending_grads.setdefault(x, []).append((key, gx))
+            count = self.node_counts[x] - 1
+            if count:
+                self.node_counts[x] = count
+                continue
+            del self.node_counts[x]
+            grads = self.pending_grads.pop(x, [])
+            grads.sort(key=lambda entry: entry[0])
+            completed.append((x, [g for _, gx in grads for g in gx]))
+
+            creator = x.creator_node
+            if creator is not None:
+                count = self.func_counts[creator] - 1
+                self.func_counts[creator] = count
+                if count == 0:
+                    ready.append(creator)
+        return completed, ready
+
+
+def _unique(nodes):
+    # Returns the distinct nodes except None, keeping the order.
+    seen = set()
+    ret = []
+    for node in nodes:
+        if node is not None and node not in seen:
+            seen.add(node)
+            ret.append(node)
+    return ret
+
+
 def backprop_step(
         func, target_input_indexes, grad_outputs, grad_inputs, is_debug):
     """Accumulates gradients of a FunctionNode
@@ -7,6 +7,7 @@ import six
 import chainer
 from chainer import backend
 from chainer.backends import cuda
+from chainer.dataset.tabular import _batch
 
 
 def converter():
@@ -192,7 +193,10 @@ def concat_examples(batch, device=None, padding=None):
 
     Args:
         batch (list): A list of examples. This is typically given by a dataset
-            iterator.
+            iterator. The batches of a :class:`~chainer.dataset.TabularDataset`
+            given by the iterators hold the examples column by column; the
+            columns which are already arrays are used without stacking the
+            examples.
         device (device specifier): A device to which each array is sent.
             If it is omitted, all arrays are left in their original devices.
             See :meth:`~chainer.dataset.convert.to_device` for more details.
@@ -211,6 +215,9 @@ def concat_examples(batch, device=None, padding=None):
     if not batch:
         raise ValueError('batch is empty')
 
+    if isinstance(batch, _batch.ColumnMajorBatch):
+        return _concat_columns(batch, device, padding)
+
     first_elem = batch[0]
 
     if isinstance(first_elem, tuple):
@@ -239,6 +246,38 @@ def concat_examples(batch, device=None, padding=None):
         return to_device(device, _concat_arrays(batch, padding))
 
 
+def _concat_columns(batch, device, padding):
+    # Concatenates a batch of a tabular dataset column by column. Columns
+    # given as arrays are already concatenated.
+    if batch.convert is not None:
+        result = batch.convert(batch.data)
+        if isinstance(result, tuple):
+            return tuple(to_device(device, x) for x in result)
+        elif isinstance(result, dict):
+            return {k: to_device(device, v) for k, v in six.iteritems(result)}
+        else:
+            return to_device(device, result)
+
+    if batch.mode is tuple:
+        if not isinstance(padding, tuple):
+            padding = [padding] * len(batch.columns)
+    elif batch.mode is dict:
+        if not isinstance(padding, dict):
+            padding = {key: padding for key in batch.keys}
+        padding = [padding[key] for key in batch.keys]
+
+    result = []
+    for column, pad in six.moves.zip(batch.columns, padding):
+        if not isinstance(column, chainer.get_array_types()):
+            column = _concat_arrays(column, pad)
+        result.append(to_device(device, column))
+
+    if batch.mode is tuple:
+        return tuple(result)
+    elif batch.mode is dict:
+        return dict(six.moves.zip(batch.keys, result))
+
+
 def _concat_arrays(arrays, padding):
     # Convert `arrays` to numpy.ndarray if `arrays` consists of the built-in
     # types such as int, float or list.
@@ -1,2 +1,9 @@
 from chainer.dataset.tabular import as_mode  # NOQA
+from chainer.dataset.tabular import concat  # NOQA
+from chainer.dataset.tabular import join  # NOQA
 from chainer.dataset.tabular import slice  # NOQA
+from chainer.dataset.tabular import transform  # NOQA
+from chainer.dataset.tabular import with_converter  # NOQA
+
+from chainer.dataset.tabular.numpy_dataset import from_memmap  # NOQA
+from chainer.dataset.tabular.numpy_dataset import from_numpy  # NOQA
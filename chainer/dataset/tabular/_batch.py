@@ -0,0 +1,71 @@
+import numpy as np
+import six
+
+from chainer.dataset.tabular import tabular_dataset
+from chainer.utils import collections_abc
+
+
+class ColumnMajorBatch(collections_abc.Sequence):
+    """A batch of examples of a tabular dataset in column-major layout.
+
+    This class behaves as a list of examples, while it keeps the columns
+    returned by :meth:`~chainer.dataset.TabularDataset.get_examples` as they
+    are. :func:`~chainer.dataset.concat_examples` uses the columns directly
+    instead of stacking the examples one by one, or passes them to
+    ``convert`` if it is given.
+
+    Args:
+        keys (tuple of strs): Names of columns.
+        mode (type): Mode of representation of each example.
+            :class:`tuple` and :class:`dict` are supported.
+        columns (tuple of lists/arrays): Data of each column.
+        length (int): Number of examples.
+        convert (callable): :meth:`~chainer.dataset.TabularDataset.convert`
+            of the dataset if it is overridden, or ``None``.
+
+    """
+
+    def __init__(self, keys, mode, columns, length, convert=None):
+        self.keys = keys
+        self.mode = mode
+        self.columns = tuple(columns)
+        self._length = length
+        self.convert = convert
+
+    @property
+    def data(self):
+        """Columns of the batch as a tuple or a dict, depending on the mode."""
+        if self.mode is tuple:
+            return self.columns
+        elif self.mode is dict:
+            return dict(six.moves.zip(self.keys, self.columns))
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in six.moves.range(
+                *index.indices(self._length))]
+        example = tuple(column[index] for column in self.columns)
+        if self.mode is tuple:
+            return example
+        elif self.mode is dict:
+            return dict(six.moves.zip(self.keys, example))
+
+
+def fetch_batch(dataset, indices):
+    # Fetches the examples of `indices` from `dataset`. Tabular datasets are
+    # read with a single `get_examples` call.
+    if isinstance(dataset, tabular_dataset.TabularDataset):
+        if isinstance(indices, np.ndarray):
+            indices = indices.tolist()
+        columns = dataset.get_examples(indices, None)
+        convert = None
+        default_convert = tabular_dataset.TabularDataset.convert
+        if six.get_method_function(dataset.convert) is not \
+                six.get_unbound_function(default_convert):
+            convert = dataset.convert
+        return ColumnMajorBatch(
+            dataset.keys, dataset.mode, columns, len(indices), convert)
+    return [dataset[index] for index in indices]
@@ -0,0 +1,114 @@
+import bisect
+import itertools
+
+import numpy as np
+import six
+
+from chainer.dataset.tabular import tabular_dataset
+
+
+class Concat(tabular_dataset.TabularDataset):
+
+    def __init__(self, *datasets):
+        for dataset in datasets[1:]:
+            if not dataset.keys == datasets[0].keys:
+                raise ValueError('All datasets must have the same keys')
+
+        self._datasets = datasets
+        self._offsets = [0]
+        for dataset in datasets:
+            self._offsets.append(self._offsets[-1] + len(dataset))
+
+    def __len__(self):
+        return self._offsets[-1]
+
+    @property
+    def keys(self):
+        return self._datasets[0].keys
+
+    @property
+    def mode(self):
+        return self._datasets[0].mode
+
+    def get_examples(self, indices, key_indices):
+        if key_indices is None:
+            n_cols = len(self.keys)
+        else:
+            n_cols = len(key_indices)
+
+        if indices is None:
+            indices = slice(None)
+        if isinstance(indices, slice):
+            start, stop, step = indices.indices(len(self))
+            if step > 0:
+                return self._get_examples_slice(
+                    start, stop, step, key_indices, n_cols)
+            indices = six.moves.range(start, stop, step)
+        if len(indices) == 0:
+            return self._datasets[0].get_examples([], key_indices)
+
+        # Group the requested rows by dataset and scatter them back.
+        positions = [[] for _ in self._datasets]
+        local_indices = [[] for _ in self._datasets]
+        len_ = len(self)
+        for position, index in enumerate(indices):
+            if index < 0:
+                index += len_
+            if index < 0 or len_ <= index:
+                raise IndexError(
+                    'index {} is out of bounds for dataset with size {}'
+                    .format(index, len_))
+            d = bisect.bisect_right(self._offsets, index) - 1
+            positions[d].append(position)
+            local_indices[d].append(index - self._offsets[d])
+
+        parts = []
+        for d, dataset in enumerate(self._datasets):
+            if local_indices[d]:
+                parts.append((positions[d], dataset.get_examples(
+                    local_indices[d], key_indices)))
+
+        return tuple(
+            _scatter([(pos, part[col]) for pos, part in parts], len(indices))
+            for col in six.moves.range(n_cols))
+
+    def _get_examples_slice(self, start, stop, step, key_indices, n_cols):
+        parts = []
+        for d, dataset in enumerate(self._datasets):
+            offset, end = self._offsets[d], self._offsets[d + 1]
+            if start < offset:
+                first = start + -(-(offset - start) // step) * step
+            else:
+                first = start
+            last = min(stop, end)
+            if first < last:
+                parts.append(dataset.get_examples(
+                    slice(first - offset, last - offset, step), key_indices))
+        if not parts:
+            return self._datasets[0].get_examples([], key_indices)
+
+        return tuple(
+            _concat([part[col] for part in parts])
+            for col in six.moves.range(n_cols))
+
+
+def _concat(columns):
+    if columns and all(isinstance(col, np.ndarray) for col in columns):
+        return np.concatenate(columns)
+    return list(itertools.chain.from_iterable(columns))
+
+
+def _scatter(parts, size):
+    if parts and all(isinstance(col, np.ndarray) for _, col in parts):
+        first = parts[0][1]
+        dtype = np.result_type(*[col for _, col in parts])
+        column = np.empty((size,) + first.shape[1:], dtype=dtype)
+        for positions, col in parts:
+            column[positions] = col
+        return column
+
+    column = [None] * size
+    for positions, col in parts:
+        for position, value in six.moves.zip(positions, col):
+            column[position] = value
+    return column
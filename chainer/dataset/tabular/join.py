@@ -0,0 +1,53 @@
+import six
+
+from chainer.dataset.tabular import tabular_dataset
+
+
+class Join(tabular_dataset.TabularDataset):
+
+    def __init__(self, *datasets):
+        keys = set(datasets[0].keys)
+        for dataset in datasets[1:]:
+            if not len(dataset) == len(datasets[0]):
+                raise ValueError('All datasets must have the same length')
+            if len(keys.intersection(dataset.keys)) > 0:
+                raise ValueError('All keys must be unique among all datasets')
+            keys = keys.union(dataset.keys)
+
+        self._datasets = datasets
+
+    def __len__(self):
+        return len(self._datasets[0])
+
+    @property
+    def keys(self):
+        return tuple(key for dataset in self._datasets for key in dataset.keys)
+
+    @property
+    def mode(self):
+        return self._datasets[0].mode
+
+    def get_examples(self, indices, key_indices):
+        if key_indices is None:
+            key_indices = six.moves.range(len(self.keys))
+
+        # Map each requested column to (dataset, column of the dataset).
+        key_map = []
+        for d, dataset in enumerate(self._datasets):
+            for k in six.moves.range(len(dataset.keys)):
+                key_map.append((d, k))
+
+        requested = [[] for _ in self._datasets]
+        for key_index in key_indices:
+            d, k = key_map[key_index]
+            if k not in requested[d]:
+                requested[d].append(k)
+
+        examples = {}
+        for d, dataset in enumerate(self._datasets):
+            if requested[d]:
+                columns = dataset.get_examples(indices, tuple(requested[d]))
+                for k, column in six.moves.zip(requested[d], columns):
+                    examples[d, k] = column
+
+        return tuple(examples[key_map[key_index]] for key_index in key_indices)
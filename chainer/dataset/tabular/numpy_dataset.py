@@ -0,0 +1,100 @@
+import numpy as np
+import six
+
+from chainer.dataset.tabular import tabular_dataset
+
+
+class NumpyDataset(tabular_dataset.TabularDataset):
+
+    def __init__(self, keys, mode, arrays):
+        for array in arrays[1:]:
+            if not len(array) == len(arrays[0]):
+                raise ValueError('All arrays must have the same length')
+
+        self._keys = tuple(keys)
+        self._mode = mode
+        self._arrays = tuple(arrays)
+
+    def __len__(self):
+        return len(self._arrays[0])
+
+    @property
+    def keys(self):
+        return self._keys
+
+    @property
+    def mode(self):
+        return self._mode
+
+    def get_examples(self, indices, key_indices):
+        if key_indices is None:
+            arrays = self._arrays
+        else:
+            arrays = [self._arrays[key_index] for key_index in key_indices]
+
+        if indices is None:
+            return tuple(arrays)
+        elif isinstance(indices, slice):
+            return tuple(array[indices] for array in arrays)
+        else:
+            indices = np.asarray(indices, dtype=np.intp)
+            return tuple(array[indices] for array in arrays)
+
+
+def from_numpy(arrays, keys=None):
+    """Create a tabular dataset from arrays.
+
+    The arrays are used as the columns of the dataset without being copied.
+    Rows are fetched from them by NumPy indexing, so batches of the dataset
+    are sliced out of the arrays at once.
+
+    Args:
+        arrays (tuple or dict of arrays): Columns of the dataset. All arrays
+            must have the same length. If a tuple is given, the :attr:`mode`
+            of the dataset is :class:`tuple`. If a dict is given, the
+            :attr:`mode` is :class:`dict` and the keys of the dict are used as
+            the names of columns.
+        keys (tuple of strs): Names of columns. If ``arrays`` is a dict, this
+            specifies the order of columns. If ``arrays`` is a tuple and this
+            is omitted, ``('0', '1', ...)`` are used.
+
+    Returns:
+        A :class:`~chainer.dataset.TabularDataset`.
+
+    """
+    if isinstance(arrays, dict):
+        if keys is None:
+            keys = sorted(arrays)
+        return NumpyDataset(keys, dict, [arrays[key] for key in keys])
+    else:
+        if keys is None:
+            keys = tuple(str(i) for i in six.moves.range(len(arrays)))
+        elif not len(keys) == len(arrays):
+            raise ValueError('The number of keys does not match '
+                             'the number of arrays')
+        return NumpyDataset(keys, tuple, arrays)
+
+
+def from_memmap(filenames, keys=None):
+    """Create a tabular dataset from ``.npy`` files.
+
+    Each file is opened with :func:`numpy.load` with ``mmap_mode='r'``, so the
+    data is read from the page cache only when rows are fetched.
+
+    Args:
+        filenames (tuple or dict of strs): Paths of ``.npy`` files holding
+            the columns. The structure is the same as ``arrays`` of
+            :func:`from_numpy`.
+        keys (tuple of strs): Names of columns. See :func:`from_numpy`.
+
+    Returns:
+        A :class:`~chainer.dataset.TabularDataset`.
+
+    """
+    if isinstance(filenames, dict):
+        arrays = {key: np.load(filename, mmap_mode='r')
+                  for key, filename in six.iteritems(filenames)}
+    else:
+        arrays = tuple(np.load(filename, mmap_mode='r')
+                       for filename in filenames)
+    return from_numpy(arrays, keys)
@@ -1,3 +1,4 @@
+import numpy as np
 import six
 
 import chainer
@@ -158,6 +159,94 @@ class TabularDataset(dataset_mixin.DatasetMixin):
         """
         return chainer.dataset.tabular.as_mode.AsDict(self)
 
+    def concat(self, *datasets):
+        """Stack datasets along rows.
+
+        Args:
+            datasets (iterable of :class:`TabularDataset`):
+                Datasets to be concatenated.
+                All datasets must have the same :attr:`keys`.
+
+        Returns:
+            A concatenated dataset.
+        """
+        return chainer.dataset.tabular.concat.Concat(self, *datasets)
+
+    def join(self, *datasets):
+        """Stack datasets along columns.
+
+        Args:
+            datasets (iterable of :class:`TabularDataset`):
+                Datasets to be joined.
+                All datasets must have the same length and
+                all keys must be unique among all datasets.
+
+        Returns:
+            A joined dataset.
+        """
+        return chainer.dataset.tabular.join.Join(self, *datasets)
+
+    def transform_batch(self, keys, transform_batch):
+        """Apply a transform to batches of examples.
+
+        The transform is applied lazily, once per
+        :meth:`get_examples` call, to the whole columns of the requested rows.
+        Vectorized operations on the columns are therefore done once per
+        batch instead of once per example.
+
+        Args:
+            keys (tuple of strs or str): Names of the columns of the
+                transformed dataset. If a string is given, the transformed
+                dataset has a single column.
+            transform_batch (callable): A callable that takes the columns of
+                this dataset (as positional arguments if :attr:`mode` is
+                :class:`tuple`, or as keyword arguments if :attr:`mode` is
+                :class:`dict`) and returns the new columns as a tuple or a
+                dict of lists/arrays. If ``keys`` is a string, it returns a
+                single list/array.
+
+        Returns:
+            A view of the transformed dataset.
+        """
+        return chainer.dataset.tabular.transform.TransformBatch(
+            self, keys, transform_batch)
+
+    def convert(self, data):
+        """Convert fetched data.
+
+        This method takes column-major data (e.g. the data returned by
+        :meth:`fetch`) and converts each column into an array.
+        It is used by :func:`~chainer.dataset.concat_examples` for the batches
+        of this dataset if overridden, e.g. by :meth:`with_converter`.
+
+        Args:
+            data (tuple or dict): Column-major data.
+
+        Returns:
+            A tuple or a dict of arrays.
+        """
+        if isinstance(data, tuple):
+            return tuple(_as_array(d) for d in data)
+        elif isinstance(data, dict):
+            return {k: _as_array(v) for k, v in six.iteritems(data)}
+        else:
+            return _as_array(data)
+
+    def with_converter(self, converter):
+        """Override the behaviour of :meth:`convert`.
+
+        Args:
+            converter (callable): A callable that takes the columns (as
+                positional arguments if :attr:`mode` is :class:`tuple`, or as
+                keyword arguments if :attr:`mode` is :class:`dict`) and
+                returns converted data.
+
+        Returns:
+            A view whose :meth:`convert` uses ``converter``.
+        """
+        return chainer.dataset.tabular.with_converter.WithConverter(
+            self, converter)
+
     def get_example(self, i):
         example = self.get_examples([i], None)
         example = tuple(col[0] for col in example)
@@ -165,3 +254,9 @@ class TabularDataset(dataset_mixin.DatasetMixin):
             return example
         elif self.mode is dict:
             return dict(six.moves.zip(self.keys, example))
+
+
+def _as_array(data):
+    if isinstance(data, chainer.get_array_types()):
+        return data
+    return np.asarray(data)
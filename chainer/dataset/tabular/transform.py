@@ -0,0 +1,52 @@
+import six
+
+from chainer.dataset.tabular import tabular_dataset
+
+
+class TransformBatch(tabular_dataset.TabularDataset):
+
+    def __init__(self, dataset, keys, transform_batch):
+        if isinstance(keys, six.string_types):
+            keys = keys,
+            self._unary = True
+        else:
+            self._unary = False
+
+        self._dataset = dataset
+        self._keys = tuple(keys)
+        self._transform_batch = transform_batch
+
+    def __len__(self):
+        return len(self._dataset)
+
+    @property
+    def keys(self):
+        return self._keys
+
+    @property
+    def mode(self):
+        return self._dataset.mode
+
+    def get_examples(self, indices, key_indices):
+        in_examples = self._dataset.get_examples(indices, None)
+        if self._dataset.mode is tuple:
+            out_examples = self._transform_batch(*in_examples)
+        elif self._dataset.mode is dict:
+            out_examples = self._transform_batch(
+                **dict(six.moves.zip(self._dataset.keys, in_examples)))
+
+        if self._unary:
+            out_examples = out_examples,
+        elif isinstance(out_examples, dict):
+            out_examples = tuple(out_examples[key] for key in self._keys)
+        else:
+            out_examples = tuple(out_examples)
+        if not len(out_examples) == len(self._keys):
+            raise ValueError(
+                'transform_batch returned {} columns, but {} keys are '
+                'given'.format(len(out_examples), len(self._keys)))
+
+        if key_indices is None:
+            return out_examples
+        else:
+            return tuple(out_examples[key_index] for key_index in key_indices)
@@ -1,6 +1,10 @@
 # import classes and functions
 from chainer.datasets.cifar import get_cifar10  # NOQA
 from chainer.datasets.cifar import get_cifar100  # NOQA
+from chainer.datasets.columnar_dataset import ColumnarDataset  # NOQA
+from chainer.datasets.columnar_dataset import ColumnarDatasetWriter  # NOQA
+from chainer.datasets.columnar_dataset import open_columnar_dataset  # NOQA
+from chainer.datasets.columnar_dataset import open_columnar_dataset_writer  # NOQA
 from chainer.datasets.concatenated_dataset import ConcatenatedDataset  # NOQA
 from chainer.datasets.dict_dataset import DictDataset  # NOQA
 from chainer.datasets.fashion_mnist import get_fashion_mnist  # NOQA
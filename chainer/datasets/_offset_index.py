@@ -0,0 +1,80 @@
+import os
+import shutil
+import tempfile
+import warnings
+
+import numpy
+
+
+# Layout of an index file: a header of `_HEADER_SIZE` int64 values
+# (magic number, version, size and mtime of the indexed file, number of
+# offsets) followed by the offsets as int64 values.
+_MAGIC = 0x5844494e4943  # b'CINIDX' in little endian
+_VERSION = 1
+_HEADER_SIZE = 5
+
+
+def file_signature(stat):
+    """Returns the size and the modification time of a file in nanoseconds.
+
+    Args:
+        stat: Result of :func:`os.stat` or :func:`os.fstat`.
+
+    """
+    mtime_ns = getattr(stat, 'st_mtime_ns', None)
+    if mtime_ns is None:
+        mtime_ns = int(stat.st_mtime * 1e9)
+    return stat.st_size, mtime_ns
+
+
+def load(index_path, signature):
+    """Memory-maps the offsets stored in an index file.
+
+    Returns ``None`` if the index file does not exist, is broken, or was made
+    for a file whose size or modification time differs from ``signature``.
+
+    """
+    try:
+        header = numpy.fromfile(
+            index_path, dtype=numpy.int64, count=_HEADER_SIZE)
+    except (IOError, OSError):
+        return None
+    if len(header) != _HEADER_SIZE:
+        return None
+    magic, version, size, mtime_ns, length = header.tolist()
+    if (magic, version, (size, mtime_ns)) != (_MAGIC, _VERSION, signature):
+        return None
+    expected_size = (_HEADER_SIZE + length) * 8
+    if os.path.getsize(index_path) != expected_size:
+        return None
+
+    if length == 0:
+        return numpy.empty((0,), dtype=numpy.int64)
+    return numpy.memmap(index_path, dtype=numpy.int64, mode='r',
+                        offset=_HEADER_SIZE * 8, shape=(length,))
+
+
+def save(index_path, signature, offsets):
+    """Writes offsets to an index file atomically.
+
+    If the index file cannot be written (e.g. its directory is read-only), a
+    warning is issued and the offsets are not saved.
+
+    """
+    size, mtime_ns = signature
+    header = numpy.array(
+        [_MAGIC, _VERSION, size, mtime_ns, len(offsets)], dtype=numpy.int64)
+    dirname = os.path.dirname(os.path.abspath(index_path))
+    try:
+        fd, tmppath = tempfile.mkstemp(prefix='tmp', dir=dirname)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                header.tofile(f)
+                numpy.asarray(offsets, dtype=numpy.int64).tofile(f)
+            shutil.move(tmppath, index_path)
+        except Exception:
+            os.remove(tmppath)
+            raise
+    except (IOError, OSError) as e:
+        warnings.warn(
+            'Failed to save the index file {}: {}'.format(index_path, e))
@@ -0,0 +1,333 @@
+import io
+import json
+import os
+
+import numpy
+import six
+
+from chainer.dataset.tabular import tabular_dataset
+
+
+_META_FILE = 'meta.json'
+_FORMAT_VERSION = 1
+
+
+def _data_file(path, column):
+    return os.path.join(path, 'column{}.data'.format(column))
+
+
+def _offsets_file(path, column):
+    return os.path.join(path, 'column{}.offsets'.format(column))
+
+
+def _open_memmap(filename, dtype, shape):
+    if numpy.prod(shape, dtype=numpy.int64) == 0:
+        # numpy.memmap cannot map an empty file.
+        return numpy.empty(shape, dtype=dtype)
+    return numpy.memmap(filename, dtype=dtype, mode='r', shape=shape)
+
+
+class ColumnarDatasetWriter(object):
+
+    """Writer class that makes ColumnarDataset.
+
+    To make :class:`ColumnarDataset`, a user needs to prepare data using
+    :class:`ColumnarDatasetWriter`. Each example must be a tuple or a dict of
+    arrays (or scalars) which have the same dtype and the same number of
+    dimensions as those of the first example. Only the length of the first
+    axis may differ among examples; such columns are stored with an index of
+    offsets.
+
+    The dataset is complete only after :meth:`close` is called.
+
+    Args:
+        path (str): Path to a directory to store the dataset. It is created
+            if it does not exist.
+        keys (tuple of strs): Names of columns. If omitted, the keys of the
+            first example are used if it is a dict, and ``('0', '1', ...)``
+            otherwise.
+
+    .. seealso: chainer.datasets.ColumnarDataset
+
+    """
+
+    def __init__(self, path, keys=None):
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        self._path = path
+        self._keys = None if keys is None else tuple(keys)
+        self._mode = None
+        self._columns = None
+        self._closed = False
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._columns is None:
+            raise ValueError('no example has been written')
+
+        meta = {
+            'version': _FORMAT_VERSION,
+            'mode': 'dict' if self._mode is dict else 'tuple',
+            'keys': list(self._keys),
+            'length': len(self._columns[0]['offsets']) - 1,
+            'columns': [],
+        }
+        for i, column in enumerate(self._columns):
+            column['file'].close()
+            offsets = column['offsets']
+            row_shapes = column['row_shapes']
+            fixed = len(row_shapes) == 1
+            if fixed:
+                shape = list(row_shapes.pop())
+            else:
+                numpy.asarray(offsets, dtype=numpy.int64).tofile(
+                    _offsets_file(self._path, i))
+                shape = [None] + list(column['trailing'])
+            meta['columns'].append({
+                'dtype': column['dtype'].str,
+                'shape': shape,
+                'size': offsets[-1],
+            })
+
+        with io.open(os.path.join(self._path, _META_FILE), 'w') as f:
+            f.write(six.text_type(json.dumps(meta)))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, x):
+        if isinstance(x, dict):
+            mode = dict
+            if self._keys is None:
+                self._keys = tuple(x)
+            values = [x[key] for key in self._keys]
+        else:
+            mode = tuple
+            if self._keys is None:
+                self._keys = tuple(str(i) for i in six.moves.range(len(x)))
+            values = list(x)
+        values = [numpy.asarray(value) for value in values]
+
+        if self._columns is None:
+            self._mode = mode
+            if not len(values) == len(self._keys):
+                raise ValueError('The number of keys does not match '
+                                 'the number of elements')
+            self._columns = [{
+                'file': open(_data_file(self._path, i), 'wb'),
+                'dtype': value.dtype,
+                'ndim': value.ndim,
+                'trailing': value.shape[1:],
+                'row_shapes': set(),
+                'offsets': [0],
+            } for i, value in enumerate(values)]
+        elif not (mode is self._mode and len(values) == len(self._columns)):
+            raise ValueError('All examples must have the same structure')
+
+        for key, value, column in six.moves.zip(
+                self._keys, values, self._columns):
+            if not (value.dtype == column['dtype'] and
+                    value.ndim == column['ndim'] and
+                    value.shape[1:] == column['trailing']):
+                raise ValueError(
+                    'Column {} expects an array of dtype {} with trailing '
+                    'shape {}, but got {} {}'.format(
+                        key, column['dtype'], column['trailing'],
+                        value.dtype, value.shape))
+
+        # Write after all the columns are validated so that a rejected
+        # example is not partially written.
+        for value, column in six.moves.zip(values, self._columns):
+            column['file'].write(numpy.ascontiguousarray(value).tobytes())
+            column['row_shapes'].add(value.shape)
+            column['offsets'].append(column['offsets'][-1] + value.size)
+
+    def flush(self):
+        if self._columns is not None:
+            for column in self._columns:
+                column['file'].flush()
+
+
+class ColumnarDataset(tabular_dataset.TabularDataset):
+
+    """Dataset stored in a columnar format with random access.
+
+    This dataset reads data written by :class:`ColumnarDatasetWriter`. Each
+    column is memory-mapped with :class:`numpy.memmap`, so opening the dataset
+    does not read the data, and reads go through the page cache shared by all
+    the processes which open the same dataset (e.g. the workers of
+    :class:`~chainer.iterators.MultiprocessIterator`). Reads do not take any
+    lock.
+
+    Columns whose examples have the same shape are returned as arrays by
+    :meth:`get_examples`. Columns of variable-length examples are located with
+    a memory-mapped index of offsets and returned as lists of arrays.
+
+    .. testsetup::
+
+        import tempfile
+        path_to_data = tempfile.mkdtemp()
+
+    >>> with chainer.datasets.open_columnar_dataset_writer(
+    ...         path_to_data) as w:
+    ...     w.write({'x': np.array([1, 2], np.int32), 'y': 0})
+    ...     w.write({'x': np.array([3], np.int32), 'y': 1})
+    ...
+    >>> dataset = chainer.datasets.open_columnar_dataset(path_to_data)
+    >>> dataset.keys
+    ('x', 'y')
+    >>> dataset[1]['x']
+    memmap([3], dtype=int32)
+
+    Args:
+        path (str): Path to a directory made by
+            :class:`ColumnarDatasetWriter`.
+
+    """
+
+    def __init__(self, path):
+        with io.open(os.path.join(path, _META_FILE)) as f:
+            meta = json.load(f)
+        if meta['version'] != _FORMAT_VERSION:
+            raise ValueError(
+                'Unsupported format version: {}'.format(meta['version']))
+
+        self._path = path
+        self._keys = tuple(meta['keys'])
+        self._mode = dict if meta['mode'] == 'dict' else tuple
+        self._length = meta['length']
+
+        self._data = []
+        self._offsets = []
+        self._trailing = []
+        for i, column in enumerate(meta['columns']):
+            dtype = numpy.dtype(column['dtype'])
+            shape = column['shape']
+            if shape and shape[0] is None:
+                self._data.append(_open_memmap(
+                    _data_file(path, i), dtype, (column['size'],)))
+                self._offsets.append(_open_memmap(
+                    _offsets_file(path, i), numpy.int64,
+                    (self._length + 1,)))
+                self._trailing.append(tuple(shape[1:]))
+            else:
+                self._data.append(_open_memmap(
+                    _data_file(path, i), dtype,
+                    (self._length,) + tuple(shape)))
+                self._offsets.append(None)
+                self._trailing.append(None)
+
+    def __getstate__(self):
+        # Reopen the memory maps instead of pickling their contents.
+        return self._path
+
+    def __setstate__(self, path):
+        self.__init__(path)
+
+    def close(self):
+        """Closes the memory maps.
+
+        After a user calls this method, the dataset will no longer be
+        accessible.
+        """
+        self._data = None
+        self._offsets = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def keys(self):
+        return self._keys
+
+    @property
+    def mode(self):
+        return self._mode
+
+    def get_examples(self, indices, key_indices):
+        if key_indices is None:
+            key_indices = six.moves.range(len(self._keys))
+        return tuple(self._get_column(indices, key_index)
+                     for key_index in key_indices)
+
+    def _get_column(self, indices, key_index):
+        data = self._data[key_index]
+        offsets = self._offsets[key_index]
+        if offsets is None:
+            if indices is None:
+                return data
+            elif isinstance(indices, slice):
+                return data[indices]
+            else:
+                return data[numpy.asarray(indices, dtype=numpy.intp)]
+
+        if indices is None:
+            indices = six.moves.range(self._length)
+        elif isinstance(indices, slice):
+            indices = six.moves.range(*indices.indices(self._length))
+        trailing = self._trailing[key_index]
+        length = self._length
+        column = []
+        for i in indices:
+            if i < 0:
+                i += length
+            if i < 0 or length <= i:
+                raise IndexError(
+                    'index {} is out of bounds for dataset with size {}'
+                    .format(i, length))
+            column.append(
+                data[offsets[i]:offsets[i + 1]].reshape((-1,) + trailing))
+        return column
+
+
+def open_columnar_dataset(path):
+    """Opens a dataset stored in a given path.
+
+    This is a helper function to open :class:`ColumnarDataset`.
+
+    Args:
+        path (str): Path to a dataset.
+
+    Returns:
+        chainer.datasets.ColumnarDataset: Opened dataset.
+
+    .. seealso: chainer.datasets.ColumnarDataset
+
+    """
+    return ColumnarDataset(path)
+
+
+def open_columnar_dataset_writer(path, keys=None):
+    """Opens a writer to make a ColumnarDataset.
+
+    This is a helper function to open :class:`ColumnarDatasetWriter`. A user
+    needs to call :func:`ColumnarDatasetWriter.close` or use `with`:
+
+    .. code-block:: python
+
+        with chainer.datasets.open_columnar_dataset_writer('path') as writer:
+            pass  # use writer
+
+    Args:
+        path (str): Path to a directory to store a dataset.
+        keys (tuple of strs): Names of columns.
+
+    Returns:
+        chainer.datasets.ColumnarDatasetWriter: Opened writer.
+
+    .. seealso: chainer.datasets.ColumnarDataset
+
+    """
+    return ColumnarDatasetWriter(path, keys=keys)
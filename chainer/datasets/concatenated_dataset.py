@@ -1,4 +1,11 @@
+import bisect
+
+import numpy
+import six
+
 from chainer.dataset import dataset_mixin
+from chainer.dataset.tabular import _batch
+from chainer.dataset.tabular import tabular_dataset
 
 
 class ConcatenatedDataset(dataset_mixin.DatasetMixin):
@@ -10,6 +17,12 @@ class ConcatenatedDataset(dataset_mixin.DatasetMixin):
     another base dataset with 20 samples are given, this dataset works as
     a dataset which has 30 samples.
 
+    The lengths of the base datasets are read once in the constructor, so
+    they must not change afterwards. When examples are fetched with a slice,
+    a list or an array of indices, the indices are grouped by the base
+    dataset, and each group is fetched from the base dataset at once (e.g.
+    with a single :meth:`~chainer.dataset.TabularDataset.get_examples` call).
+
     Args:
         datasets: The underlying datasets. Each dataset has to support
             :meth:`__len__` and :meth:`__getitem__`.
@@ -18,15 +31,52 @@ class ConcatenatedDataset(dataset_mixin.DatasetMixin):
 
     def __init__(self, *datasets):
         self._datasets = datasets
+        self._offsets = [0]
+        for dataset in datasets:
+            self._offsets.append(self._offsets[-1] + len(dataset))
+        self._offsets_array = numpy.array(self._offsets, dtype=numpy.int64)
 
     def __len__(self):
-        return sum(len(dataset) for dataset in self._datasets)
+        return self._offsets[-1]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            indices = numpy.arange(*index.indices(len(self)))
+        elif isinstance(index, (list, numpy.ndarray)):
+            indices = numpy.asarray(index, dtype=numpy.int64)
+        else:
+            return self.get_example(index)
+        return self._get_examples(indices)
 
     def get_example(self, i):
-        if i < 0:
+        if i < 0 or i >= len(self):
             raise IndexError
-        for dataset in self._datasets:
-            if i < len(dataset):
-                return dataset[i]
-            i -= len(dataset)
-        raise IndexError
+        k = bisect.bisect_right(self._offsets, i) - 1
+        return self._datasets[k][i - self._offsets[k]]
+
+    def _get_examples(self, indices):
+        if len(indices) == 0:
+            return []
+        if indices.min() < 0 or indices.max() >= len(self):
+            raise IndexError
+
+        ks = numpy.searchsorted(self._offsets_array, indices, side='right') - 1
+        examples = [None] * len(indices)
+        for k in numpy.unique(ks):
+            positions = numpy.nonzero(ks == k)[0]
+            local_indices = indices[positions] - self._offsets[k]
+            for position, example in six.moves.zip(
+                    positions.tolist(),
+                    _fetch(self._datasets[k], local_indices)):
+                examples[position] = example
+        return examples
+
+
+def _fetch(dataset, indices):
+    if isinstance(dataset, tabular_dataset.TabularDataset):
+        return _batch.fetch_batch(dataset, indices)
+    elif isinstance(dataset, numpy.ndarray):
+        return dataset[indices]
+    elif isinstance(dataset, dataset_mixin.DatasetMixin):
+        return dataset[indices.tolist()]
+    return [dataset[i] for i in indices.tolist()]
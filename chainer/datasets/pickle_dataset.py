@@ -1,9 +1,11 @@
+import os
 import threading
 
 import six
 import six.moves.cPickle as pickle
 
 from chainer.dataset import dataset_mixin
+from chainer.datasets import _offset_index
 
 
 class PickleDatasetWriter(object):
@@ -75,23 +77,54 @@ class PickleDataset(dataset_mixin.DatasetMixin):
 
     Args:
         reader: File like object. `reader` must support random access.
+        index_path (str): Path to an index file of the positions of the
+            objects. If the index file exists and was made for the current
+            size and modification time of the file of ``reader``, the
+            positions are memory-mapped from it instead of being computed by
+            unpickling all objects. Otherwise, the positions are computed and
+            the index file is (re)written; if it cannot be written, a warning
+            is issued and the dataset is used without it. ``reader`` must be
+            a real file (i.e. support ``fileno``) to use this option.
+        lock_free (bool): If ``True``, objects are read with positional reads
+            (:func:`os.pread`) of the file of ``reader`` instead of seeking
+            it under a lock, so that multiple threads (e.g.
+            :class:`~chainer.iterators.MultithreadIterator`) can read objects
+            concurrently. ``reader`` must be a real file, which must not be
+            modified while the dataset is in use. On platforms without
+            :func:`os.pread`, this option is ignored.
 
     """
 
-    def __init__(self, reader):
+    def __init__(self, reader, index_path=None, lock_free=False):
         # Only py3 supports `seekable` method
         if six.PY3 and not reader.seekable():
             raise ValueError('reader must support random access')
         self._reader = reader
-        self._positions = []
-        reader.seek(0)
-        while True:
-            position = reader.tell()
-            try:
-                pickle.load(reader)
-            except EOFError:
-                break
-            self._positions.append(position)
+
+        positions = None
+        if index_path is not None:
+            signature = _offset_index.file_signature(
+                os.fstat(reader.fileno()))
+            positions = _offset_index.load(index_path, signature)
+
+        if positions is None:
+            positions = []
+            reader.seek(0)
+            while True:
+                position = reader.tell()
+                try:
+                    pickle.load(reader)
+                except EOFError:
+                    break
+                positions.append(position)
+            if index_path is not None:
+                _offset_index.save(index_path, signature, positions)
+        self._positions = positions
+
+        self._fd = None
+        if lock_free and hasattr(os, 'pread'):
+            self._fd = reader.fileno()
+            self._size = os.fstat(self._fd).st_size
 
         self._lock = threading.RLock()
 
@@ -114,16 +147,40 @@ class PickleDataset(dataset_mixin.DatasetMixin):
         return len(self._positions)
 
     def get_example(self, index):
+        if self._fd is not None:
+            return self._pread_example(index)
         with self._lock:
-            self._reader.seek(self._positions[index])
+            self._reader.seek(int(self._positions[index]))
             return pickle.load(self._reader)
 
-
-def open_pickle_dataset(path):
+    def _pread_example(self, index):
+        n = len(self._positions)
+        if index < -n or index >= n:
+            raise IndexError('index {} is out of range'.format(index))
+        if index < 0:
+            index += n
+        start = int(self._positions[index])
+        end = int(self._positions[index + 1]) if index + 1 < n else self._size
+
+        chunks = []
+        while start < end:
+            chunk = os.pread(self._fd, end - start, start)
+            if not chunk:
+                raise EOFError('file has been truncated')
+            chunks.append(chunk)
+            start += len(chunk)
+        return pickle.loads(b''.join(chunks))
+
+
+def open_pickle_dataset(path, cache_index=False, lock_free=False):
     """Opens a dataset stored in a given path.
 
     This is a helper function to open :class:`PickleDataset`. It opens a given
     file in binary mode, and creates a :class:`PickleDataset` instance.
+    If ``cache_index`` is ``True``, the positions of the objects are stored in
+    ``path + '.index'`` so that they are computed only once.
+    If ``lock_free`` is ``True``, multiple threads can read objects
+    concurrently.
 
     This method does not close the opened file. A user needs to call
     :func:`PickleDataset.close` or use `with`:
@@ -135,6 +192,10 @@ def open_pickle_dataset(path):
 
     Args:
         path (str): Path to a dataset.
+        cache_index (bool): If ``True``, an index file of the positions of
+            the objects is used. See ``index_path`` of :class:`PickleDataset`.
+        lock_free (bool): If ``True``, objects are read without a lock.
+            See ``lock_free`` of :class:`PickleDataset`.
 
     Returns:
         chainer.datasets.PickleDataset: Opened dataset.
@@ -143,7 +204,9 @@ def open_pickle_dataset(path):
 
     """
     reader = open(path, 'rb')
-    return PickleDataset(reader)
+    index_path = path + '.index' if cache_index else None
+    return PickleDataset(
+        reader, index_path=index_path, lock_free=lock_free)
 
 
 def open_pickle_dataset_writer(path, protocol=pickle.HIGHEST_PROTOCOL):
@@ -1,10 +1,13 @@
 import io
+import os
 import sys
 import threading
 
+import numpy
 import six
 
 from chainer.dataset import dataset_mixin
+from chainer.datasets import _offset_index
 
 
 class TextDataset(dataset_mixin.DatasetMixin):
@@ -54,12 +57,25 @@ class TextDataset(dataset_mixin.DatasetMixin):
             the number of files. Arguments are lines loaded from each file.
             The filter function must return True to accept the line, or
             return False to skip the line.
+        cache_index (bool):
+            If ``True``, the positions of line boundaries of each text file
+            are stored in an index file next to it (``path + '.index'``).
+            The index file is memory-mapped instead of scanning the text file
+            as long as the size and the modification time of the text file
+            are unchanged. It is ignored if ``filter_func`` is given.
+        lock_free (bool):
+            If ``True``, each thread reads lines with its own handles of the
+            text files, which are opened on the first read of the thread,
+            instead of sharing the handles under a lock. This lets multiple
+            threads (e.g. :class:`~chainer.iterators.MultithreadIterator`)
+            read lines concurrently. Handles opened by the threads are kept
+            until :meth:`close` is called.
 
     """
 
     def __init__(
             self, paths, encoding=None, errors=None, newline=None,
-            filter_func=None):
+            filter_func=None, cache_index=False, lock_free=False):
         if isinstance(paths, six.string_types):
             paths = [paths]
         elif not paths:
@@ -82,9 +98,20 @@ class TextDataset(dataset_mixin.DatasetMixin):
         self._errors = errors
         self._newline = newline
         self._fps = None
+        self._lock_free = lock_free
 
         self._open()
 
+        self._index_paths = None
+        if cache_index and filter_func is None:
+            self._index_paths = [path + '.index' for path in paths]
+            bounds = self._load_index()
+            if bounds is not None:
+                self._bounds = bounds
+                self._lines = six.moves.range(len(bounds[0]) - 1)
+                self._lock = threading.Lock()
+                return
+
         # Line number is 0-origin.
         # `lines` is a list of line numbers not filtered; if no filter_func is
         # given, it is range(linenum)).
@@ -109,26 +136,68 @@ class TextDataset(dataset_mixin.DatasetMixin):
         if filter_func is None:
             lines = six.moves.range(linenum)
 
+        if self._index_paths is not None:
+            self._save_index(bounds)
+
         self._bounds = bounds
         self._lines = lines
         self._lock = threading.Lock()
 
+    def _load_index(self):
+        bounds = []
+        for path, index_path in six.moves.zip(self._paths, self._index_paths):
+            signature = _offset_index.file_signature(os.stat(path))
+            b = _offset_index.load(index_path, signature)
+            if b is None or (bounds and len(b) != len(bounds[0])):
+                return None
+            bounds.append(b)
+        return tuple(bounds)
+
+    def _save_index(self, bounds):
+        for path, index_path, b in six.moves.zip(
+                self._paths, self._index_paths, bounds):
+            # Positions of text files are opaque numbers, which may not fit
+            # in int64 for stateful encodings.
+            if b[-1] >= 2 ** 63:
+                continue
+            signature = _offset_index.file_signature(os.stat(path))
+            _offset_index.save(index_path, signature, b)
+
     def __getstate__(self):
         state = self.__dict__.copy()
         del state['_fps']
         del state['_lock']
+        if self._lock_free:
+            del state['_local']
+            del state['_local_fps']
+        if self._index_paths is not None and \
+                all(isinstance(b, numpy.memmap) for b in self._bounds):
+            # Memory-map the index files again instead of pickling them.
+            del state['_bounds']
         return state
 
     def __setstate__(self, state):
         self.__dict__ = state
+        self.__dict__.setdefault('_lock_free', False)
         self._open()
         self._lock = threading.Lock()
+        if '_bounds' not in state:
+            self._bounds = self._load_index()
+            if self._bounds is None:
+                raise RuntimeError('text files have been modified')
 
     def __len__(self):
         return len(self._lines)
 
     def _open(self):
-        self._fps = [
+        self._fps = self._open_files()
+        if self._lock_free:
+            self._local = threading.local()
+            self._local.fps = self._fps
+            self._local_fps = []
+
+    def _open_files(self):
+        return [
             io.open(
                 path,
                 mode='rt',
@@ -147,7 +216,13 @@ class TextDataset(dataset_mixin.DatasetMixin):
         automatically be closed after TextDataset instance goes out of scope.
         """
         exc = None
-        for fp in self._fps:
+        fps = list(self._fps)
+        if self._lock_free:
+            with self._lock:
+                for local_fps in self._local_fps:
+                    fps.extend(local_fps)
+                self._local_fps = []
+        for fp in fps:
             try:
                 fp.close()
             except Exception:
@@ -160,13 +235,28 @@ class TextDataset(dataset_mixin.DatasetMixin):
             raise IndexError
         linenum = self._lines[idx]
 
+        if self._lock_free:
+            return self._read_lines(self._thread_fps(), linenum)
+
         self._lock.acquire()
         try:
-            for k, fp in enumerate(self._fps):
-                fp.seek(self._bounds[k][linenum])
-            lines = [fp.readline() for fp in self._fps]
-            if len(lines) == 1:
-                return lines[0]
-            return tuple(lines)
+            return self._read_lines(self._fps, linenum)
         finally:
             self._lock.release()
+
+    def _thread_fps(self):
+        fps = getattr(self._local, 'fps', None)
+        if fps is None:
+            fps = self._open_files()
+            self._local.fps = fps
+            with self._lock:
+                self._local_fps.append(fps)
+        return fps
+
+    def _read_lines(self, fps, linenum):
+        for k, fp in enumerate(fps):
+            fp.seek(int(self._bounds[k][linenum]))
+        lines = [fp.readline() for fp in fps]
+        if len(lines) == 1:
+            return lines[0]
+        return tuple(lines)
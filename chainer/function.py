@@ -69,6 +69,38 @@ def no_backprop_mode():
     return _BackpropModeContext((c,))
 
 
+def inference_mode():
+    """Make a context manager which enables the graph-free inference mode.
+
+    In this context, back-propagation is disabled as in
+    :func:`~chainer.no_backprop_mode`, and
+    :meth:`FunctionNode.apply() <chainer.FunctionNode.apply>` takes a
+    shortcut which skips everything needed only for computational graphs or
+    debugging: the validation of input and output arrays, the dispatch to
+    function hooks, and the wiring of nodes. It reduces the per-function
+    overhead of small-tensor inference.
+
+    The shortcut is not taken when any function hook is registered, in debug
+    mode, with static graph optimizations, or for ChainerX arrays; in these
+    cases, functions behave as in :func:`~chainer.no_backprop_mode`. Type
+    checks are still done unless the ``type_check`` :ref:`configuration
+    <configuration>` is ``False``.
+
+    Unlike :func:`~chainer.no_backprop_mode`, output variables of functions
+    created in this context never require gradients.
+
+    >>> x = chainer.Variable(np.array([1,], np.float32))
+    >>> with chainer.inference_mode():
+    ...     y = x + 1
+    >>> y.requires_grad
+    False
+
+    """
+    return _BackpropModeContext((
+        no_backprop_mode(),
+        configuration.using_config('inference_mode', True)))
+
+
 def force_backprop_mode():
     """Make a context manager which enables back-propagation.
 
@@ -109,6 +141,10 @@ def force_backprop_mode():
     return _BackpropModeContext((c,))
 
 
+# Attributes of functions that do not affect the type check
+_type_check_ignored_attributes = frozenset(['_node', '_owned_node'])
+
+
 class FunctionAdapter(function_node.FunctionNode):
 
     """Adapter class to wrap Function with FunctionNode.
@@ -170,6 +206,11 @@ class FunctionAdapter(function_node.FunctionNode):
     def check_type_forward(self, in_types):
         self._function.check_type_forward(in_types)
 
+    def _get_type_check_params(self):
+        function = self._function
+        return type(function), function_node._get_hashable_attributes(
+            function, _type_check_ignored_attributes)
+
     def forward(self, inputs):
         # Retain all inputs by default in old-style functions.
         self.retain_inputs(six.moves.range(len(inputs)))
@@ -5,6 +5,7 @@ import inspect
 import traceback
 import weakref
 
+import numpy
 import six
 
 import chainer
@@ -32,6 +33,47 @@ def _to_variable_with_chainerx_fallback_array(chainerx_array, fallback_array):
     return var
 
 
+# Maps function classes to the sets of the keys of successful type checks.
+# The classes defined dynamically (e.g. in tests) are not kept alive.
+_type_check_cache = weakref.WeakKeyDictionary()
+# Maximum number of keys cached for each function class
+_type_check_cache_size = 1024
+# Attributes of function nodes that do not affect the type check
+_type_check_ignored_attributes = frozenset([
+    'stack', 'chainerx_device', '_is_chainerx_fallback_mode',
+    '_local_function_hooks'])
+_hashable_scalar_types = six.integer_types + (
+    bool, float, complex, str, six.text_type, bytes, type(None),
+    numpy.dtype, numpy.generic)
+
+
+def _get_input_signature(in_data):
+    return tuple([
+        None if x is None else (type(x), x.shape, x.dtype) for x in in_data])
+
+
+def _get_hashable_value(value):
+    # Returns a hashable representation of an attribute value, or raises
+    # TypeError if it may not be compared by value. The type is included as
+    # equal values of different types (e.g. 1, 1.0 and True) may be checked
+    # differently.
+    if isinstance(value, _hashable_scalar_types):
+        return type(value), value
+    if isinstance(value, (tuple, list)):
+        return type(value), tuple([_get_hashable_value(v) for v in value])
+    raise TypeError
+
+
+def _get_hashable_attributes(obj, ignored):
+    try:
+        return tuple(sorted([
+            (name, _get_hashable_value(value))
+            for name, value in six.iteritems(vars(obj))
+            if name not in ignored]))
+    except TypeError:
+        return None
+
+
 class FunctionNode(object):
 
     """Function node of the computational graph.
@@ -144,6 +186,8 @@ class FunctionNode(object):
     _input_indexes_to_retain = None
     _output_indexes_to_retain = None
     _retained_output_data = None
+    # True if the retained arrays are released by backprop
+    _retained_arrays_released = False
     _local_function_hooks = None
     _supports_static_optimizations = False
     # True if the function node is operating on ChainerX arrays and it falls
@@ -254,6 +298,12 @@ Use apply() method instead.\
             A tuple of output :class:`~chainer.Variable` objects.
 
         """
+        config = configuration.config
+        if config.inference_mode and not config.enable_backprop:
+            outputs = self._apply_inference(inputs)
+            if outputs is not None:
+                return outputs
+
         chainerx_in_data = None
         chainerx_device = None
         is_chainerx, in_data = _extract_apply_in_data(inputs)
@@ -384,19 +434,77 @@ Use apply() method instead.\
 
         return ret
 
+    def _apply_inference(self, inputs):
+        # Shortcut of apply() in the inference mode, which returns None if it
+        # cannot be taken.
+        if (chainer.get_function_hooks() or self._n_local_function_hooks
+                or chainer.is_debug()
+                or chainer.config.schedule_func is not None):
+            return None
+
+        in_data = tuple([
+            x.array if isinstance(x, variable.Variable) else x
+            for x in inputs])
+        on_numpy = True
+        for x in in_data:
+            if type(x) is not numpy.ndarray:
+                if isinstance(x, chainerx.ndarray):
+                    return None
+                on_numpy = False
+
+        if configuration.config.type_check:
+            self._check_data_type_forward(in_data)
+
+        self._input_indexes_to_retain = None
+        self._output_indexes_to_retain = None
+        if on_numpy:
+            outputs = self.forward(in_data)
+        else:
+            with chainer.using_device(
+                    backend.get_device_from_array(*in_data)):
+                outputs = self.forward(in_data)
+
+        if not isinstance(outputs, tuple):
+            raise TypeError(
+                'forward output must be a tuple ({})\n'
+                'Actual: {}'.format(self.label, type(outputs)))
+
+        self._output_count = len(outputs)
+        return tuple([
+            variable.Variable._init_unchecked(
+                y, requires_grad=False, is_chainerx_array=False)
+            for y in outputs])
+
     def _check_data_type_forward(self, in_data):
+        # The result of a successful check is cached by the input signature
+        # and the parameters of the function.
+        cls, params = self._get_type_check_params()
+        if params is not None:
+            key = (_get_input_signature(in_data), params)
+            cache = _type_check_cache.get(cls)
+            if cache is None:
+                cache = _type_check_cache.setdefault(cls, set())
+            elif key in cache:
+                return
+
         in_type = type_check.get_light_types(in_data)
         try:
             with type_check.light_mode:
                 self.check_type_forward(in_type)
-            return
         except type_check.InvalidType:
             # Ignore errors on first run
-            pass
+            in_type = type_check.get_types(in_data, 'in_types', False)
+            with type_check.get_function_check_context(self):
+                self.check_type_forward(in_type)
 
-        in_type = type_check.get_types(in_data, 'in_types', False)
-        with type_check.get_function_check_context(self):
-            self.check_type_forward(in_type)
+        if params is not None and len(cache) < _type_check_cache_size:
+            cache.add(key)
+
+    def _get_type_check_params(self):
+        # Returns the class and the hashable parameters that the type check
+        # depends on, or ``None`` as the parameters if they cannot be hashed.
+        return type(self), _get_hashable_attributes(
+            self, _type_check_ignored_attributes)
 
     def check_type_forward(self, in_types):
         """Checks types of input data before forward propagation.
@@ -405,6 +513,12 @@ Use apply() method instead.\
         input variables using
         :ref:`the type checking utilities <type-check-utils>`.
 
+        A successful check is cached by the function class, the types, shapes
+        and dtypes of the inputs and the attributes of the function, and the
+        method is not called again for the same combination. The check is
+        not cached if any attribute is not a scalar, a string, a dtype or a
+        tuple or list of them. Hence, the check should only depend on them.
+
         Args:
             in_types (~chainer.utils.type_check.TypeInfoTuple): The type
                 information of input variables for :meth:`forward`.
@@ -0,0 +1,760 @@
+import functools
+
+import numpy
+import six
+
+import chainer
+from chainer import function_node
+from chainer.functions.activation import leaky_relu
+from chainer.functions.activation import relu
+from chainer.functions.activation import sigmoid
+from chainer.functions.activation import tanh
+from chainer.functions.array import where
+from chainer.functions.math import basic_math
+from chainer.functions.math import clip
+from chainer.functions.math import exponential
+from chainer.functions.math import sqrt
+from chainer.functions.math import square
+from chainer.functions.math import trigonometric
+from chainer import variable
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _scalar(value):
+    if not numpy.isscalar(value):
+        raise _Unsupported
+    return value
+
+
+# Kernels of the supported function nodes. Each builder takes a function node
+# and returns the arguments of the kernel, i.e. the input variable nodes or
+# arrays, and two functions:
+#
+# - forward(xs, y) computes the output of the blocks ``xs`` of the
+#   arguments into the block ``y``.
+# - backward(xs, y, gy) returns the gradients w.r.t. the arguments, where
+#   ``None`` means that the argument is not differentiable.
+#
+# ``xs``, ``y`` and ``gy`` are one-dimensional arrays of the same length.
+def _neg(node):
+    def forward(xs, y):
+        numpy.negative(xs[0], out=y)
+
+    def backward(xs, y, gy):
+        return -gy,
+    return node.inputs, forward, backward
+
+
+def _absolute(node):
+    def forward(xs, y):
+        numpy.absolute(xs[0], out=y)
+
+    def backward(xs, y, gy):
+        return gy * numpy.sign(xs[0]),
+    return node.inputs, forward, backward
+
+
+def _add(node):
+    def forward(xs, y):
+        numpy.add(xs[0], xs[1], out=y)
+
+    def backward(xs, y, gy):
+        return gy, gy
+    return node.inputs, forward, backward
+
+
+def _multi_add(node):
+    def forward(xs, y):
+        numpy.add(xs[0], xs[1], out=y)
+        for x in xs[2:]:
+            y += x
+
+    def backward(xs, y, gy):
+        return (gy,) * len(xs)
+    if len(node.inputs) < 2:
+        raise _Unsupported
+    return node.inputs, forward, backward
+
+
+def _add_constant(node):
+    value = _scalar(node.value)
+
+    def forward(xs, y):
+        numpy.add(xs[0], xs[0].dtype.type(value), out=y)
+
+    def backward(xs, y, gy):
+        return gy,
+    return node.inputs, forward, backward
+
+
+def _sub(node):
+    def forward(xs, y):
+        numpy.subtract(xs[0], xs[1], out=y)
+
+    def backward(xs, y, gy):
+        return gy, -gy
+    return node.inputs, forward, backward
+
+
+def _sub_from_constant(node):
+    value = _scalar(node.value)
+
+    def forward(xs, y):
+        numpy.subtract(xs[0].dtype.type(value), xs[0], out=y)
+
+    def backward(xs, y, gy):
+        return -gy,
+    return node.inputs, forward, backward
+
+
+def _mul(node):
+    def forward(xs, y):
+        numpy.multiply(xs[0], xs[1], out=y)
+
+    def backward(xs, y, gy):
+        return gy * xs[1], gy * xs[0]
+    return node.inputs, forward, backward
+
+
+def _mul_constant(node):
+    value = _scalar(node.value)
+
+    def forward(xs, y):
+        numpy.multiply(xs[0], xs[0].dtype.type(value), out=y)
+
+    def backward(xs, y, gy):
+        return gy * gy.dtype.type(value),
+    return node.inputs, forward, backward
+
+
+def _div(node):
+    def forward(xs, y):
+        numpy.divide(xs[0], xs[1], out=y)
+
+    def backward(xs, y, gy):
+        gx0 = gy / xs[1]
+        return gx0, -gx0 * y
+    return node.inputs, forward, backward
+
+
+def _div_from_constant(node):
+    value = _scalar(node.value)
+
+    def forward(xs, y):
+        numpy.divide(xs[0].dtype.type(value), xs[0], out=y)
+
+    def backward(xs, y, gy):
+        return -gy * y / xs[0],
+    return node.inputs, forward, backward
+
+
+def _pow_var_const(node):
+    value = _scalar(node.value)
+
+    def forward(xs, y):
+        numpy.power(xs[0], xs[0].dtype.type(value), out=y)
+
+    def backward(xs, y, gy):
+        x = xs[0]
+        return gy * x.dtype.type(value) * x ** x.dtype.type(value - 1),
+    return node.inputs, forward, backward
+
+
+def _exp(node):
+    def forward(xs, y):
+        numpy.exp(xs[0], out=y)
+
+    def backward(xs, y, gy):
+        return gy * y,
+    return node.inputs, forward, backward
+
+
+def _log(node):
+    def forward(xs, y):
+        numpy.log(xs[0], out=y)
+
+    def backward(xs, y, gy):
+        return gy / xs[0],
+    return node.inputs, forward, backward
+
+
+def _sqrt(node):
+    def forward(xs, y):
+        numpy.sqrt(xs[0], out=y)
+
+    def backward(xs, y, gy):
+        return gy / (y * y.dtype.type(2)),
+    return node.inputs, forward, backward
+
+
+def _square(node):
+    def forward(xs, y):
+        numpy.square(xs[0], out=y)
+
+    def backward(xs, y, gy):
+        return gy * xs[0] * xs[0].dtype.type(2),
+    return node.inputs, forward, backward
+
+
+def _sin(node):
+    def forward(xs, y):
+        numpy.sin(xs[0], out=y)
+
+    def backward(xs, y, gy):
+        return gy * numpy.cos(xs[0]),
+    return node.inputs, forward, backward
+
+
+def _cos(node):
+    def forward(xs, y):
+        numpy.cos(xs[0], out=y)
+
+    def backward(xs, y, gy):
+        return -gy * numpy.sin(xs[0]),
+    return node.inputs, forward, backward
+
+
+def _sigmoid(node):
+    def forward(xs, y):
+        half = y.dtype.type(0.5)
+        numpy.multiply(xs[0], half, out=y)
+        numpy.tanh(y, out=y)
+        y *= half
+        y += half
+
+    def backward(xs, y, gy):
+        return gy * y * (1 - y),
+    return node.inputs, forward, backward
+
+
+def _tanh(node):
+    def forward(xs, y):
+        numpy.tanh(xs[0], out=y)
+
+    def backward(xs, y, gy):
+        return gy * (1 - y * y),
+    return node.inputs, forward, backward
+
+
+def _relu(node):
+    def forward(xs, y):
+        numpy.maximum(xs[0], 0, out=y)
+
+    def backward(xs, y, gy):
+        return gy * (y > 0),
+    return node.inputs, forward, backward
+
+
+def _leaky_relu(node):
+    slope = _scalar(node.slope)
+
+    def forward(xs, y):
+        x = xs[0]
+        numpy.multiply(x, x.dtype.type(slope), out=y)
+        numpy.copyto(y, x, where=x > 0)
+
+    def backward(xs, y, gy):
+        return numpy.where(xs[0] > 0, gy, gy * gy.dtype.type(slope)),
+    return node.inputs, forward, backward
+
+
+def _clip(node):
+    x_min = _scalar(node.x_min)
+    x_max = _scalar(node.x_max)
+
+    def forward(xs, y):
+        numpy.clip(xs[0], x_min, x_max, out=y)
+
+    def backward(xs, y, gy):
+        x = xs[0]
+        return gy * ((x_min <= x) & (x <= x_max)),
+    return node.inputs, forward, backward
+
+
+def _where(node):
+    def forward(xs, y):
+        condition, a, b = xs
+        numpy.copyto(y, b)
+        numpy.copyto(y, a, where=condition)
+
+    def backward(xs, y, gy):
+        condition = xs[0]
+        zero = gy.dtype.type(0)
+        return (None, numpy.where(condition, gy, zero),
+                numpy.where(condition, zero, gy))
+    return (node.condition,) + tuple(node.inputs), forward, backward
+
+
+_kernels = {
+    basic_math.Neg: _neg,
+    basic_math.Absolute: _absolute,
+    basic_math.Add: _add,
+    basic_math.MultiAdd: _multi_add,
+    basic_math.AddConstant: _add_constant,
+    basic_math.Sub: _sub,
+    basic_math.SubFromConstant: _sub_from_constant,
+    basic_math.Mul: _mul,
+    basic_math.MulConstant: _mul_constant,
+    basic_math.Div: _div,
+    basic_math.DivFromConstant: _div_from_constant,
+    basic_math.PowVarConst: _pow_var_const,
+    exponential.Exp: _exp,
+    exponential.Log: _log,
+    sqrt.Sqrt: _sqrt,
+    square.Square: _square,
+    trigonometric.Sin: _sin,
+    trigonometric.Cos: _cos,
+    sigmoid.Sigmoid: _sigmoid,
+    tanh.Tanh: _tanh,
+    relu.ReLU: _relu,
+    leaky_relu.LeakyReLU: _leaky_relu,
+    clip.Clip: _clip,
+    where.Where: _where,
+}
+
+
+class _Program(object):
+
+    """Elementwise computation traced from a function
+
+    The values are held in registers. The first registers are the inputs and
+    each of the rest is computed by an operation. All the registers have the
+    same shape as the inputs.
+
+    Args:
+        n_inputs (int): Number of the inputs.
+        ops (list of tuple): Operations in the order of execution. Each
+            operation is a tuple of the forward and backward functions of the
+            kernel, the registers of the arguments and the register of the
+            output.
+        outputs (tuple of int): Registers of the outputs.
+        dtypes (list of numpy.dtype): Dtypes of the registers.
+
+    """
+
+    def __init__(self, n_inputs, ops, outputs, dtypes):
+        self.n_inputs = n_inputs
+        self.ops = ops
+        self.outputs = outputs
+        self.dtypes = dtypes
+
+        # Maps the registers written directly to the output arrays to the
+        # output indexes.
+        self.output_regs = {}
+        for i, reg in enumerate(outputs):
+            if reg >= n_inputs and reg not in self.output_regs:
+                self.output_regs[reg] = i
+
+        # Assign the other registers to the buffers reused once the values
+        # are no longer used. The output buffer of an operation is taken
+        # before its arguments are released so that kernels may read the
+        # arguments after writing the output.
+        last_use = {}
+        for i, (_, _, args, out) in enumerate(ops):
+            last_use[out] = i
+            for reg in args:
+                last_use[reg] = i
+        self.buffer_dtypes = []
+        self.buffer_of = {}
+        free = {}
+        for i, (_, _, args, out) in enumerate(ops):
+            if out not in self.output_regs:
+                dtype = dtypes[out]
+                if free.get(dtype):
+                    self.buffer_of[out] = free[dtype].pop()
+                else:
+                    self.buffer_of[out] = len(self.buffer_dtypes)
+                    self.buffer_dtypes.append(dtype)
+            for reg in set(args) | {out}:
+                if reg in self.buffer_of and last_use[reg] == i:
+                    free.setdefault(dtypes[reg], []).append(
+                        self.buffer_of[reg])
+
+    def _evaluate(self, regs, buffers, n):
+        for forward, _, args, out in self.ops:
+            y = buffers[out][:n]
+            forward([regs[reg] for reg in args], y)
+            regs[out] = y
+
+    def forward(self, inputs, block_size):
+        n_inputs = self.n_inputs
+        shape = inputs[0].shape
+        size = inputs[0].size
+        xs = [x.reshape(-1) for x in inputs]
+        ys = [numpy.empty(shape, self.dtypes[reg]) for reg in self.outputs]
+        ys_flat = [y.reshape(-1) for y in ys]
+        block_size = max(min(block_size, size), 1)
+        buffers = [numpy.empty(block_size, dtype)
+                   for dtype in self.buffer_dtypes]
+        reg_buffers = [None] * len(self.dtypes)
+        for reg, i in six.iteritems(self.buffer_of):
+            reg_buffers[reg] = buffers[i]
+
+        for start in six.moves.range(0, size, block_size):
+            end = min(start + block_size, size)
+            regs = [x[start:end] for x in xs]
+            regs += [None] * (len(self.dtypes) - n_inputs)
+            for reg, i in six.iteritems(self.output_regs):
+                reg_buffers[reg] = ys_flat[i][start:end]
+            self._evaluate(regs, reg_buffers, end - start)
+            for i, reg in enumerate(self.outputs):
+                if self.output_regs.get(reg) != i:
+                    ys_flat[i][start:end] = regs[reg]
+        return tuple(ys)
+
+    def backward(self, inputs, grad_outputs, indexes, block_size):
+        n_inputs = self.n_inputs
+        size = inputs[0].size
+        xs = [x.reshape(-1) for x in inputs]
+        gys = [None if gy is None else gy.reshape(-1) for gy in grad_outputs]
+        gxs = [numpy.zeros(inputs[i].shape, inputs[i].dtype)
+               for i in indexes]
+        gxs_flat = [gx.reshape(-1) for gx in gxs]
+        block_size = max(min(block_size, size), 1)
+        # The values of all the registers are recomputed in each block.
+        buffers = [None] * n_inputs + [
+            numpy.empty(block_size, dtype) for dtype in self.dtypes[n_inputs:]]
+
+        for start in six.moves.range(0, size, block_size):
+            end = min(start + block_size, size)
+            regs = [x[start:end] for x in xs]
+            regs += [None] * (len(self.dtypes) - n_inputs)
+            self._evaluate(regs, buffers, end - start)
+
+            grads = {}
+            for reg, gy in six.moves.zip(self.outputs, gys):
+                if gy is not None:
+                    _accumulate(grads, reg, gy[start:end])
+            for _, backward, args, out in reversed(self.ops):
+                gy = grads.pop(out, None)
+                if gy is None:
+                    continue
+                g_args = backward([regs[reg] for reg in args], regs[out], gy)
+                for reg, g in six.moves.zip(args, g_args):
+                    if g is not None:
+                        _accumulate(grads, reg, g)
+            for i, gx in six.moves.zip(indexes, gxs_flat):
+                g = grads.get(i)
+                if g is not None:
+                    gx[start:end] = g
+        return tuple(gxs)
+
+
+def _accumulate(grads, reg, g):
+    # Gradients may be shared between registers, hence never updated in place.
+    if reg in grads:
+        grads[reg] = grads[reg] + g
+    else:
+        grads[reg] = g
+
+
+def _is_scalar(value):
+    return isinstance(value, _scalar_types)
+
+
+_scalar_types = (bool, float, numpy.bool_, numpy.number) + six.integer_types
+
+
+def _constants(func_node):
+    # Scalar attributes of a function node, which include the constants
+    # embedded in its kernel.
+    return tuple(sorted(
+        [(name, type(value), value)
+         for name, value in six.iteritems(vars(func_node))
+         if _is_scalar(value)]))
+
+
+def _perturb(x):
+    # Returns an array of the same shape and dtype with different values.
+    with numpy.errstate(all='ignore'):
+        if x.dtype.kind == 'f':
+            return x * x.dtype.type(0.5) + x.dtype.type(0.25)
+        if x.dtype.kind == 'b':
+            return ~x
+        return x + x.dtype.type(1)
+
+
+def _trace(func, args):
+    # Builds a program from the function, and returns it and whether the
+    # function returns a tuple. ``args`` are the arguments of the function,
+    # each of which is an array or a scalar. The function is run twice with
+    # different values of the arrays so that the constants which depend on
+    # the data (e.g. ``x * float(x.array.max())``) are detected.
+    program, is_tuple, signature = _build(func, args)
+    perturbed = [_perturb(x) if isinstance(x, numpy.ndarray) else x
+                 for x in args]
+    if _build(func, perturbed)[1:] != (is_tuple, signature):
+        raise _Unsupported
+    return program, is_tuple
+
+
+def _build(func, args):
+    # Runs the function once to build the computational graph, and converts
+    # it to a program. Raises _Unsupported if the graph contains anything
+    # other than the supported elementwise operations on the arguments. Also
+    # returns the signature of the program, i.e. the types, arguments and
+    # constants of the operations, to compare programs built from different
+    # data.
+    shape = None
+    reg_of = {}
+    trace_args = []
+    dtypes = []
+    for x in args:
+        if isinstance(x, numpy.ndarray):
+            if shape is None:
+                shape = x.shape
+            elif x.shape != shape:
+                raise _Unsupported
+            reg_of[id(x)] = len(dtypes)
+            if x.dtype.kind == 'f':
+                x = variable.Variable(x)
+                reg_of[x.node] = len(dtypes)
+            dtypes.append(x.dtype)
+        trace_args.append(x)
+    n_inputs = len(dtypes)
+
+    with chainer.using_config('enable_backprop', True), \
+            chainer.using_config('inference_mode', False):
+        outputs = func(*trace_args)
+    is_tuple = not isinstance(outputs, variable.Variable)
+    if not is_tuple:
+        outputs = outputs,
+    if not (isinstance(outputs, (tuple, list)) and outputs and all(
+            isinstance(y, variable.Variable) for y in outputs)):
+        raise _Unsupported
+
+    # Collect the function nodes from the outputs to the arguments in a
+    # topological order which does not depend on the data.
+    funcs = []
+    seen = set()
+    stack = [(y.node, False) for y in reversed(outputs)]
+    while stack:
+        node, expanded = stack.pop()
+        if node in reg_of:
+            continue
+        func_node = node.creator_node
+        if func_node is None:
+            raise _Unsupported
+        if expanded:
+            funcs.append(func_node)
+        elif func_node not in seen:
+            seen.add(func_node)
+            stack.append((node, True))
+            stack.extend([(x, False) for x in reversed(func_node.inputs)])
+
+    ops = []
+    signature = []
+    for func_node in funcs:
+        builder = _kernels.get(type(func_node))
+        if builder is None or len(func_node.outputs) != 1:
+            raise _Unsupported
+        kernel_args, forward, backward = builder(func_node)
+        y = func_node.outputs[0]()
+        if y is None or y.shape != shape:
+            raise _Unsupported
+        try:
+            regs = [reg_of[x if isinstance(x, variable.VariableNode)
+                           else id(x)] for x in kernel_args]
+        except KeyError:
+            raise _Unsupported
+        reg_of[y] = len(dtypes)
+        dtypes.append(y.dtype)
+        ops.append((forward, backward, regs, reg_of[y]))
+        signature.append(
+            (type(func_node), tuple(regs), _constants(func_node)))
+
+    output_regs = tuple([reg_of[y.node] for y in outputs])
+    signature.append(output_regs)
+    program = _Program(n_inputs, ops, output_regs, dtypes)
+    return program, is_tuple, signature
+
+
+def _closure_key(func):
+    # Values of the scalars in the closure of the function.
+    key = []
+    for cell in getattr(func, '__closure__', None) or ():
+        try:
+            value = cell.cell_contents
+        except ValueError:  # empty cell
+            continue
+        if _is_scalar(value):
+            key.append((type(value), value))
+    return tuple(key)
+
+
+class FusedElementwise(function_node.FunctionNode):
+
+    """Elementwise function nodes fused into one
+
+    The forward computation is done block by block so that the temporary
+    values stay in the cache. The backward computation recomputes the forward
+    values of each block instead of retaining them.
+
+    ``args`` are the arguments of the original function, where the arrays,
+    which are the inputs of this function node, are replaced with ``None``.
+
+    """
+
+    def __init__(self, func, args, program, block_size):
+        self.func = func
+        self.args = args
+        self.program = program
+        self.block_size = block_size
+
+    @property
+    def label(self):
+        return 'FusedElementwise({})'.format(
+            getattr(self.func, '__name__', 'function'))
+
+    def forward(self, inputs):
+        self.retain_inputs(tuple(six.moves.range(len(inputs))))
+        return self.program.forward(inputs, self.block_size)
+
+    def backward(self, indexes, grad_outputs):
+        inputs = self.get_retained_inputs()
+        if chainer.config.enable_backprop:
+            # Fall back to the original function for double backprop.
+            it = iter(inputs)
+            ys = self.func(*[next(it) if arg is None else arg
+                             for arg in self.args])
+            if isinstance(ys, variable.Variable):
+                ys = ys,
+            pairs = [(y, gy) for y, gy in six.moves.zip(ys, grad_outputs)
+                     if gy is not None]
+            return tuple(chainer.grad(
+                [y for y, _ in pairs], [inputs[i] for i in indexes],
+                [gy for _, gy in pairs], enable_double_backprop=True))
+
+        gxs = self.program.backward(
+            [x.array for x in inputs],
+            [None if gy is None else gy.array for gy in grad_outputs],
+            indexes, self.block_size)
+        return tuple([variable.Variable(gx) for gx in gxs])
+
+
+def fuse_elementwise(*args, **kwargs):
+    """fuse_elementwise(func=None, block_size=8192)
+
+    Decorator to fuse elementwise functions on NumPy arrays.
+
+    The decorated function takes :class:`~chainer.Variable` objects or NumPy
+    arrays of the same shape, and optionally Python or NumPy scalars, as
+    positional arguments and returns a variable or a tuple of variables. On
+    the first call for each combination of the shapes and the dtypes of the
+    arrays and the values of the scalars, it is traced by running it. If it
+    only consists of the elementwise functions listed below applied to the
+    arguments and scalar constants, the computation is replaced with a
+    single function node, ``FusedElementwise``.
+
+    The fused function node evaluates the computation in blocks of
+    ``block_size`` elements, reusing small temporary buffers instead of
+    allocating an array of the full size for each intermediate value. It only
+    retains the inputs and computes the gradients with one backward
+    computation, which recomputes the intermediate values block by block.
+    Double backprop is done through the original function.
+
+    The supported functions are the arithmetic operators of variables
+    (except for ``//``, ``@`` and the power with a variable exponent),
+    :func:`~chainer.functions.absolute`, :func:`~chainer.functions.clip`,
+    :func:`~chainer.functions.cos`, :func:`~chainer.functions.exp`,
+    :func:`~chainer.functions.leaky_relu`, :func:`~chainer.functions.log`,
+    :func:`~chainer.functions.relu`, :func:`~chainer.functions.sigmoid`,
+    :func:`~chainer.functions.sin`, :func:`~chainer.functions.sqrt`,
+    :func:`~chainer.functions.square`, :func:`~chainer.functions.tanh` and
+    :func:`~chainer.functions.where`. The condition of
+    :func:`~chainer.functions.where` must be one of the arguments.
+
+    Otherwise, or if any argument is neither a NumPy array nor a scalar, the
+    original function is called as is. The function is also called as is if
+    the constants differ when it is traced again with other values of the
+    arrays, i.e. if they are computed from the data.
+
+    .. warning::
+
+       The traced program is reused for all the calls with the same
+       signature of the arguments, so the constants are frozen at the time
+       of tracing. Scalars which may change between calls must be passed as
+       arguments. The values of scalars in the closure of the function are
+       also included in the signature, but global variables and attributes
+       of objects (e.g. ``self.beta``) are not, and changing them after the
+       first call does not affect the fused function.
+
+    Args:
+        func (callable): Function to fuse.
+        block_size (int): Number of elements computed at once.
+
+    .. admonition:: Example
+
+        >>> @chainer.fuse_elementwise
+        ... def swish(x, beta):
+        ...     return x * F.sigmoid(beta * x)
+        >>> x = np.arange(-2, 2, dtype=np.float32)
+        >>> y = swish(x, 1.0)
+        >>> y.creator.label
+        'FusedElementwise(swish)'
+
+    .. seealso::
+       :func:`chainer.backends.cuda.fuse` for the fusion on GPU.
+
+    """
+    block_size = kwargs.pop('block_size', 8192)
+    if kwargs:
+        raise TypeError(
+            'unexpected keyword arguments: {}'.format(', '.join(kwargs)))
+    if block_size <= 0:
+        raise ValueError('block_size must be positive.')
+
+    def decorator(func):
+        # Maps the signatures of the arguments to the traced programs, or
+        # None if the function cannot be fused.
+        programs = {}
+
+        @functools.wraps(func)
+        def wrapper(*inputs):
+            args = []
+            arrays = []
+            key = []
+            for x in inputs:
+                if isinstance(x, variable.Variable):
+                    x = x.array
+                if type(x) is numpy.ndarray:
+                    args.append(x)
+                    arrays.append(x)
+                    key.append((x.shape, x.dtype))
+                elif _is_scalar(x):
+                    args.append(x)
+                    key.append((type(x), x))
+                else:
+                    return func(*inputs)
+            if not arrays:
+                return func(*inputs)
+
+            key.append(_closure_key(func))
+            key = tuple(key)
+            if key not in programs:
+                try:
+                    programs[key] = _trace(func, args)
+                except _Unsupported:
+                    programs[key] = None
+            traced = programs[key]
+            if traced is None:
+                return func(*inputs)
+
+            program, is_tuple = traced
+            template = [None if isinstance(x, numpy.ndarray) else x
+                        for x in args]
+            ys = FusedElementwise(func, template, program, block_size).apply(
+                [x for x in inputs if not _is_scalar(x)])
+            return ys if is_tuple else ys[0]
+
+        return wrapper
+
+    if len(args) == 1 and not kwargs and callable(args[0]):
+        return decorator(args[0])
+    if args:
+        raise TypeError('fuse_elementwise takes no positional arguments '
+                        'other than the function to fuse.')
+    return decorator
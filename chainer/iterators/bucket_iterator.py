@@ -0,0 +1,198 @@
+from __future__ import division
+
+import numpy
+import six
+
+from chainer.dataset import iterator
+from chainer.dataset.tabular import _batch
+from chainer import serializer as serializer_module
+
+
+def _default_length(example):
+    if isinstance(example, dict):
+        example = list(example.values())
+    if isinstance(example, (tuple, list)):
+        return max(len(x) for x in example)
+    return len(example)
+
+
+class BucketIterator(iterator.Iterator):
+
+    """Dataset iterator that makes batches of examples of similar lengths.
+
+    This iterator is intended for datasets of variable-length sequences,
+    whose batches are padded to the longest example (e.g. by
+    :func:`~chainer.dataset.concat_examples` with the ``padding`` option).
+    At the beginning of each epoch, examples are grouped into buckets of
+    lengths, and batches are made only from the examples in the same bucket,
+    so that little computation is spent on padding. The examples are
+    shuffled within each bucket, and the batches are shuffled among all the
+    buckets.
+
+    The size of each batch is limited by ``max_tokens``, i.e. the number of
+    examples times the length of the longest example in the batch, and/or by
+    ``batch_size``. An example longer than ``max_tokens`` makes a batch by
+    itself. Unlike :class:`~chainer.iterators.SerialIterator`, a batch never
+    spans two epochs.
+
+    Args:
+        dataset: Dataset to iterate.
+        lengths (sequence of ints or callable): Length of each example, or a
+            function that takes an example and returns its length. By default,
+            the length of an example is that of the longest element of it if
+            it is a tuple, a list or a dict, and its own length otherwise.
+            Examples are read only once in the constructor to compute the
+            lengths.
+        max_tokens (int): Maximum number of tokens (including padding) in
+            each batch.
+        batch_size (int): Maximum number of examples in each batch.
+        bucket_width (int): Width of length of each bucket. Examples whose
+            lengths divided by ``bucket_width`` are the same belong to the
+            same bucket.
+        repeat (bool): If ``True``, it infinitely loops over the dataset.
+            Otherwise, it stops iteration at the end of the first epoch.
+        shuffle (bool): If ``True``, the examples in each bucket and the
+            batches are shuffled at the beginning of each epoch. Otherwise,
+            batches are made in ascending order of lengths.
+        random_state (numpy.random.RandomState): Pseudo-random number
+            generator.
+
+    """
+
+    def __init__(self, dataset, lengths=None, max_tokens=None,
+                 batch_size=None, bucket_width=1, repeat=True, shuffle=True,
+                 random_state=None):
+        if max_tokens is None and batch_size is None:
+            raise ValueError(
+                'either max_tokens or batch_size must be specified')
+        if bucket_width < 1:
+            raise ValueError('bucket_width must be positive')
+
+        if lengths is None:
+            lengths = _default_length
+        if callable(lengths):
+            lengths = [lengths(dataset[i])
+                       for i in six.moves.range(len(dataset))]
+        lengths = numpy.asarray(lengths, dtype=numpy.int64)
+        if lengths.shape != (len(dataset),):
+            raise ValueError(
+                'the number of lengths must be the same as that of examples')
+
+        if random_state is None:
+            random_state = numpy.random.random.__self__
+
+        self.dataset = dataset
+        self.max_tokens = max_tokens
+        self.batch_size = batch_size
+        self.bucket_width = bucket_width
+        self._lengths = lengths
+        self._repeat = repeat
+        self._shuffle = shuffle
+        self._random = random_state
+
+        self.reset()
+
+    def __next__(self):
+        if not self._repeat and self.epoch > 0:
+            raise StopIteration
+        if len(self._offsets) == 1:
+            if self._repeat:
+                raise ValueError('Epoch size must be positive for an '
+                                 'iterator that repeats.')
+            self.epoch += 1
+            self.is_new_epoch = True
+            raise StopIteration
+
+        self._previous_epoch_detail = self.epoch_detail
+        i = self.current_position
+        indices = self._order[self._offsets[i]:self._offsets[i + 1]]
+
+        self.current_position = i + 1
+        self.is_new_epoch = self.current_position == len(self._offsets) - 1
+        if self.is_new_epoch:
+            self.epoch += 1
+            self.current_position = 0
+            if self._repeat:
+                self._order, self._offsets = self._make_batches()
+
+        return _batch.fetch_batch(self.dataset, indices)
+
+    next = __next__
+
+    @property
+    def epoch_detail(self):
+        n = len(self._order)
+        if n == 0:
+            return float(self.epoch)
+        return self.epoch + self._offsets[self.current_position] / n
+
+    @property
+    def previous_epoch_detail(self):
+        # use -1 instead of None internally.
+        if self._previous_epoch_detail < 0:
+            return None
+        return self._previous_epoch_detail
+
+    @property
+    def repeat(self):
+        return self._repeat
+
+    def _make_batches(self):
+        # Returns the order of examples and the offsets of batches in it.
+        n = len(self._lengths)
+        if self._shuffle:
+            perm = self._random.permutation(n)
+        else:
+            perm = numpy.arange(n)
+        # Stable sort keeps the shuffled order among examples of the same
+        # length.
+        order = perm[numpy.argsort(self._lengths[perm], kind='mergesort')]
+        lengths = self._lengths[order]
+        buckets = lengths // self.bucket_width
+
+        offsets = [0]
+        max_length = 0
+        for i in six.moves.range(n):
+            start = offsets[-1]
+            max_length = max(max_length, lengths[i])
+            count = i - start + 1
+            if i > start and (
+                    buckets[i] != buckets[start] or
+                    (self.batch_size is not None and
+                     count > self.batch_size) or
+                    (self.max_tokens is not None and
+                     count * max_length > self.max_tokens)):
+                offsets.append(i)
+                max_length = lengths[i]
+        if n > 0:
+            offsets.append(n)
+
+        if self._shuffle and len(offsets) > 2:
+            batch_perm = self._random.permutation(len(offsets) - 1)
+            batches = [order[offsets[j]:offsets[j + 1]] for j in batch_perm]
+            order = numpy.concatenate(batches)
+            offsets = numpy.cumsum(
+                [0] + [len(batch) for batch in batches])
+        return order, numpy.asarray(offsets, dtype=numpy.int64)
+
+    def serialize(self, serializer):
+        self.current_position = serializer(
+            'current_position', self.current_position)
+        self.epoch = serializer('epoch', self.epoch)
+        self.is_new_epoch = serializer('is_new_epoch', self.is_new_epoch)
+        if isinstance(serializer, serializer_module.Deserializer):
+            # The number of batches may differ from the current one.
+            self._order = numpy.asarray(serializer('order', None))
+            self._offsets = numpy.asarray(serializer('offsets', None))
+        else:
+            serializer('order', self._order)
+            serializer('offsets', self._offsets)
+        self._previous_epoch_detail = serializer(
+            'previous_epoch_detail', self._previous_epoch_detail)
+
+    def reset(self):
+        self.current_position = 0
+        self.epoch = 0
+        self.is_new_epoch = False
+        self._order, self._offsets = self._make_batches()
+        self._previous_epoch_detail = -1.
@@ -1,5 +1,7 @@
 from __future__ import division
+import collections
 import datetime
+import functools
 import multiprocessing
 from multiprocessing import sharedctypes  # type: ignore
 import signal
@@ -10,7 +12,10 @@ import warnings
 import numpy
 import six
 
+from chainer.dataset import convert
 from chainer.dataset import iterator
+from chainer.dataset.tabular import _batch
+from chainer.dataset.tabular import tabular_dataset
 from chainer.iterators import _statemachine
 from chainer.iterators.order_samplers import ShuffleOrderSampler
 
@@ -68,8 +73,9 @@ class MultiprocessIterator(iterator.Iterator):
         n_processes (int): Number of worker processes. The number of CPUs is
             used by default.
         n_prefetch (int): Number of prefetch batches.
-        shared_mem (int): The size of using shared memory per data.
-            If ``None``, size is adjusted automatically.
+        shared_mem (int): The initial size of using shared memory per data.
+            If ``None``, size is adjusted automatically. The shared memory
+            is grown on demand when an example does not fit in it.
         dataset_timeout (float): :class:`MultiprocessIterator.TimeoutWarning`
             will be issued after this time in seconds elapsed in each dataset
             realization. ``None`` to disable the warning. You can turn this
@@ -90,6 +96,23 @@ class MultiprocessIterator(iterator.Iterator):
             can complete before it will exit and be replaced with a fresh
             worker process, to enable unused resources to be freed. If
             ``None``, worker processes will live as long as the pool.
+        zero_copy (bool): If ``True``, arrays in the examples are returned as
+            views of a ring buffer of shared memory slots which the worker
+            processes write into directly, instead of being copied out of the
+            shared memory. The arrays of a batch are only valid until the
+            next call of :meth:`next`; copy them if they are needed longer.
+        converter (callable): If given, each batch is collated by this
+            converter inside the worker processes, and the resulting arrays
+            are written into the shared memory instead of the examples. It is
+            called in the same way as the converter of an updater, with
+            ``None`` as the device. Each worker process then assembles a whole
+            batch, and up to ``n_processes`` batches are fetched
+            concurrently. The iterator returns the converted batches, so the
+            converter of the updater should only transfer them to the device.
+            Batches of a :class:`~chainer.dataset.TabularDataset` are always
+            fetched this way, with a single
+            :meth:`~chainer.dataset.TabularDataset.get_examples` call. In this
+            mode, ``shared_mem`` is the size per batch.
 
     """
 
@@ -104,7 +127,7 @@ class MultiprocessIterator(iterator.Iterator):
     def __init__(self, dataset, batch_size, repeat=True, shuffle=None,
                  n_processes=None, n_prefetch=1, shared_mem=None,
                  order_sampler=None, dataset_timeout=30.0,
-                 maxtasksperchild=None):
+                 maxtasksperchild=None, zero_copy=False, converter=None):
         self.dataset = dataset
         self.batch_size = batch_size
         self.repeat = repeat
@@ -114,6 +137,9 @@ class MultiprocessIterator(iterator.Iterator):
         self.shared_mem = shared_mem
         self.dataset_timeout = dataset_timeout
         self._maxtasksperchild = maxtasksperchild
+        self.zero_copy = zero_copy
+        self.converter = converter
+        self._release_slot = None
 
         if self.shuffle is not None:
             if order_sampler is not None:
@@ -136,11 +162,18 @@ class MultiprocessIterator(iterator.Iterator):
             self.dataset, self.batch_size, self.repeat,
             self.n_processes, self.n_prefetch, self.shared_mem,
             self._comm, self.order_sampler,
-            self._interruption_testing, self._maxtasksperchild)
+            self._interruption_testing, self._maxtasksperchild,
+            self.zero_copy, self.converter)
         # defer launching prefetch thread until creating the worker pool,
         # not to leave a background thread in forked processes.
 
     def __next__(self):
+        # The slot holding the previous batch is no longer used by the
+        # caller once the next batch is requested.
+        if self._release_slot is not None:
+            self._release_slot()
+            self._release_slot = None
+
         measure_mode = False
         if self._prefetch_loop.thread is None:
             if self._prefetch_loop.measure_required():
@@ -150,7 +183,7 @@ class MultiprocessIterator(iterator.Iterator):
             self._prefetch_loop.launch_thread()
 
         if not measure_mode:
-            batch, state = self._comm.get()
+            batch, state, self._release_slot = self._comm.get()
 
         self._previous_epoch_detail = self.epoch_detail
         self._state = state
@@ -182,7 +215,8 @@ class MultiprocessIterator(iterator.Iterator):
         other = MultiprocessIterator(
             self.dataset, self.batch_size, self.repeat, shuffle=None,
             n_processes=self.n_processes, n_prefetch=self.n_prefetch,
-            shared_mem=self.shared_mem, order_sampler=self.order_sampler)
+            shared_mem=self.shared_mem, order_sampler=self.order_sampler,
+            zero_copy=self.zero_copy, converter=self.converter)
 
         other._reset_state(self.current_position, self.epoch,
                            self.is_new_epoch, self._state.order)
@@ -295,16 +329,16 @@ class _Communicator(object):
                         and dt > datetime.timedelta(
                             seconds=self.dataset_timeout)):
                     _raise_timeout_warning()
-            batch, prefetch_state = self._batch_queue.pop(0)
+            batch, prefetch_state, release = self._batch_queue.pop(0)
             self._not_full_cond.notify()
-            return batch, prefetch_state
+            return batch, prefetch_state, release
 
     # called from iterator
     def reset(self, prefetch_state):
         with self._lock:
             self._status = _Communicator.STATUS_RESET
             self._prefetch_state = prefetch_state
-            self._batch_queue = []
+            self._clear_queue()
             self._not_full_cond.notify()
             self._reset_count += 1
 
@@ -312,10 +346,16 @@ class _Communicator(object):
     def terminate(self):
         with self._lock:
             self._status = _Communicator.STATUS_TERMINATE
-            self._batch_queue = []
+            self._clear_queue()
             self._not_full_cond.notify()
             self._reset_count += 1
 
+    def _clear_queue(self):
+        for _, _, release in self._batch_queue:
+            if release is not None:
+                release()
+        self._batch_queue = []
+
     # called from thread
     def check(self):
         with self._lock:
@@ -327,13 +367,46 @@ class _Communicator(object):
             return status, prefetch_state, self._reset_count
 
     # called from thread
-    def put(self, batch, prefetch_state, reset_count):
+    def put(self, batch, prefetch_state, reset_count, release=None):
         with self._lock:
             if len(self._batch_queue) == self.n_prefetch:
                 self._not_full_cond.wait()
             if reset_count == self._reset_count:
-                self._batch_queue.append((batch, prefetch_state))
+                self._batch_queue.append((batch, prefetch_state, release))
                 self._not_empty_cond.notify()
+            elif release is not None:
+                release()
+
+
+class _SharedMemoryRing(object):
+
+    """Fixed number of shared memory slots each of which holds a batch.
+
+    Worker processes pack the examples of a batch directly into a slot. A slot
+    is acquired by the prefetch thread before dispatching a batch and released
+    once the arrays in it are no longer referred to.
+
+    """
+
+    def __init__(self, n_slots, slot_size):
+        self.slots = [sharedctypes.RawArray('b', slot_size)
+                      for _ in six.moves.range(n_slots)]
+        self._free_cond = threading.Condition(threading.Lock())
+        self._free = list(six.moves.range(n_slots))
+
+    def acquire(self, timeout):
+        # Returns the index of a free slot, or None on timeout.
+        with self._free_cond:
+            if not self._free:
+                self._free_cond.wait(timeout)
+                if not self._free:
+                    return None
+            return self._free.pop(0)
+
+    def release(self, index):
+        with self._free_cond:
+            self._free.append(index)
+            self._free_cond.notify()
 
 
 class _PrefetchLoop(object):
@@ -345,7 +418,8 @@ class _PrefetchLoop(object):
     def __init__(self, dataset, batch_size, repeat,
                  n_processes, n_prefetch, mem_size, comm,
                  order_sampler,
-                 _interruption_testing, maxtasksperchild):
+                 _interruption_testing, maxtasksperchild, zero_copy=False,
+                 converter=None):
         self.dataset = dataset
         self.batch_size = batch_size
         self.repeat = repeat
@@ -354,6 +428,21 @@ class _PrefetchLoop(object):
         self._comm = comm
         self.order_sampler = order_sampler
         self.maxtasksperchild = maxtasksperchild
+        self.zero_copy = zero_copy
+        self.converter = converter
+        self.collate = (converter is not None or
+                        isinstance(dataset, tabular_dataset.TabularDataset))
+        # In the zero-copy mode, the slots of the batches in the queue and
+        # the one held by the caller must not be overwritten while the next
+        # batches are being fetched.
+        if not self.collate:
+            self.n_slots = n_prefetch + 2 if zero_copy else 1
+        else:
+            # Each worker process collates a whole batch.
+            self.n_slots = n_processes
+            if zero_copy:
+                self.n_slots += n_prefetch + 2
+        self._pending = collections.deque()
 
         self._allocate_shared_memory()
 
@@ -396,7 +485,10 @@ class _PrefetchLoop(object):
             batch_ret = [None]
 
             def fetch_batch():
-                batch_ret[0] = [self.dataset[idx] for idx in indices]
+                if self.collate:
+                    batch_ret[0] = _batch.fetch_batch(self.dataset, indices)
+                else:
+                    batch_ret[0] = [self.dataset[idx] for idx in indices]
 
             if dataset_timeout is None:
                 # Timeout is not set: fetch synchronously
@@ -412,24 +504,46 @@ class _PrefetchLoop(object):
                 thr.join()
 
             batch = batch_ret[0]
-            self.mem_size = max(map(_measure, batch))
+            if not self.collate:
+                self.mem_size = max(map(_measure, batch))
+            else:
+                if self.converter is not None:
+                    batch = convert._call_converter(
+                        self.converter, batch, None)
+                self.mem_size = _measure(batch)
             self._allocate_shared_memory()
 
         return batch, self.prefetch_state
 
     def _allocate_shared_memory(self):
         if self.measure_required():
-            self.mem_bulk = None
+            self.ring = None
         else:
-            self.mem_bulk = \
-                sharedctypes.RawArray('b', self.batch_size * self.mem_size)
+            slot_size = self.mem_size
+            if not self.collate:
+                slot_size *= self.batch_size
+            self.ring = _SharedMemoryRing(self.n_slots, slot_size)
 
-    def launch_thread(self):
+    def _launch_pool(self):
         self._pool = multiprocessing.Pool(
             processes=self.n_processes,
             initializer=_fetch_setup,
-            initargs=(self.dataset, self.mem_size, self.mem_bulk),
+            initargs=(self.dataset, self.mem_size, self.ring.slots,
+                      self.converter),
             maxtasksperchild=self.maxtasksperchild)
+
+    def _grow_shared_memory(self, mem_size):
+        # The workers only see the shared memory given at their start-up, so
+        # the pool is relaunched with the new ring. The slots of the old ring
+        # remain valid as long as the batches using them are referred to.
+        self._pool.close()
+        self._pool.join()
+        self.mem_size = mem_size
+        self._allocate_shared_memory()
+        self._launch_pool()
+
+    def launch_thread(self):
+        self._launch_pool()
         if self._interruption_testing:
             pids = self._pool.map(_report_pid, range(self.n_processes))
             print(' '.join(map(str, pids)))
@@ -449,7 +563,10 @@ class _PrefetchLoop(object):
             while alive:
                 if self._terminating:
                     break
-                alive = self._task()
+                if not self.collate:
+                    alive = self._task()
+                else:
+                    alive = self._collate_task()
         finally:
             self._pool.close()
             self._pool.join()
@@ -467,23 +584,114 @@ class _PrefetchLoop(object):
         self.prefetch_state, indices = _statemachine.iterator_statemachine(
             self.prefetch_state, self.batch_size, self.repeat,
             self.order_sampler, len(self.dataset))
+        release = None
         if indices is None:  # stop iteration
             batch = None
         else:
-            future = self._pool.map_async(_fetch_run, enumerate(indices))
+            ring = self.ring
+            while True:
+                slot = ring.acquire(_response_time)
+                if slot is not None:
+                    break
+                if self._comm.is_terminated:
+                    return False
+
+            future = self._pool.map_async(
+                _fetch_run, [(slot, i, index)
+                             for i, index in enumerate(indices)])
             while True:
                 try:
                     data_all = future.get(_response_time)
                 except multiprocessing.TimeoutError:
                     if self._comm.is_terminated:
+                        ring.release(slot)
                         return False
                 else:
                     break
-            batch = [_unpack(data, self.mem_bulk) for data in data_all]
 
-        self._comm.put(batch, self.prefetch_state, reset_count)
+            mem = ring.slots[slot]
+            batch = [_unpack(data, mem, copy=not self.zero_copy)
+                     for data in data_all]
+            if self.zero_copy:
+                release = functools.partial(ring.release, slot)
+            else:
+                ring.release(slot)
+
+            oversized = [data.nbytes for data in data_all
+                         if isinstance(data, _OversizedData)]
+            if oversized:
+                self._grow_shared_memory(max(oversized))
+
+        self._comm.put(batch, self.prefetch_state, reset_count, release)
         return True
 
+    def _collate_task(self):
+        # Do a single task in the prefetch thread when the batches are
+        # collated by the workers. Unlike `_task`, up to one batch per worker
+        # is kept in flight and the batches are delivered in order.
+        # Returns a bool indicating whether the loop should continue running.
+
+        status, prefetch_state, reset_count = self._comm.check()
+        if status == _Communicator.STATUS_RESET:
+            self.prefetch_state = prefetch_state
+            self._discard_pending()
+        elif status == _Communicator.STATUS_TERMINATE:
+            return False  # stop loop
+
+        while len(self._pending) < self.n_processes:
+            ring = self.ring
+            slot = ring.acquire(0 if self._pending else _response_time)
+            if slot is None:
+                break
+            self.prefetch_state, indices = \
+                _statemachine.iterator_statemachine(
+                    self.prefetch_state, self.batch_size, self.repeat,
+                    self.order_sampler, len(self.dataset))
+            if indices is None:  # stop iteration
+                ring.release(slot)
+                future = None
+            else:
+                future = self._pool.apply_async(
+                    _collate_run, ((slot, indices),))
+            self._pending.append((future, ring, slot, self.prefetch_state))
+        if not self._pending:
+            return not self._comm.is_terminated
+
+        future, ring, slot, prefetch_state = self._pending.popleft()
+        release = None
+        if future is None:
+            batch = None
+        else:
+            while True:
+                try:
+                    data = future.get(_response_time)
+                except multiprocessing.TimeoutError:
+                    if self._comm.is_terminated:
+                        return False
+                else:
+                    break
+
+            batch = _unpack(data, ring.slots[slot], copy=not self.zero_copy)
+            if self.zero_copy:
+                release = functools.partial(ring.release, slot)
+            else:
+                ring.release(slot)
+
+            if isinstance(data, _OversizedData):
+                self._grow_shared_memory(data.nbytes)
+
+        self._comm.put(batch, prefetch_state, reset_count, release)
+        return True
+
+    def _discard_pending(self):
+        # Drops the batches fetched for the state before reset. Their slots
+        # can be reused only after the workers finish writing into them.
+        while self._pending:
+            future, ring, slot, _ = self._pending.popleft()
+            if future is not None:
+                future.wait()
+                ring.release(slot)
+
 
 # Using `parameterized` function (e.g. bound method) with Pool is tricky due to
 # restrictions imposed by Pickle. Picklable types differ across versions.
@@ -493,24 +701,44 @@ class _PrefetchLoop(object):
 # To make static linter happy, we first initialize global variables.
 _fetch_dataset = None
 _fetch_mem_size = None
-_fetch_mem_bulk = None
+_fetch_mem_slots = None
+_fetch_converter = None
 
 
-def _fetch_setup(dataset, mem_size, mem_bulk):
-    global _fetch_dataset, _fetch_mem_size, _fetch_mem_bulk
+def _fetch_setup(dataset, mem_size, mem_slots, converter):
+    global _fetch_dataset, _fetch_mem_size, _fetch_mem_slots, \
+        _fetch_converter
     signal.signal(signal.SIGINT, signal.SIG_IGN)
     _fetch_dataset = dataset
     _fetch_mem_size = mem_size
-    _fetch_mem_bulk = mem_bulk
+    _fetch_mem_slots = mem_slots
+    _fetch_converter = converter
 
 
 def _fetch_run(inputs):
-    i, index = inputs
+    slot, i, index = inputs
     data = _fetch_dataset[index]
-    if _fetch_mem_bulk is not None:
+    nbytes = _measure(data)
+    if nbytes > _fetch_mem_size:
+        # Send the example through the pool this time and let the prefetch
+        # thread grow the shared memory for the following batches.
+        return _OversizedData(data, nbytes)
+    if nbytes > 0:
         offset = i * _fetch_mem_size
-        limit = offset + _fetch_mem_size
-        data = _pack(data, _fetch_mem_bulk, offset, limit)
+        data = _pack(data, _fetch_mem_slots[slot], offset)
+    return data
+
+
+def _collate_run(inputs):
+    slot, indices = inputs
+    data = _batch.fetch_batch(_fetch_dataset, indices)
+    if _fetch_converter is not None:
+        data = convert._call_converter(_fetch_converter, data, None)
+    nbytes = _measure(data)
+    if nbytes > _fetch_mem_size:
+        return _OversizedData(data, nbytes)
+    if nbytes > 0:
+        data = _pack(data, _fetch_mem_slots[slot], 0)
     return data
 
 
@@ -518,6 +746,13 @@ def _report_pid(_):  # for testing
     return multiprocessing.current_process().pid
 
 
+class _OversizedData(object):
+
+    def __init__(self, data, nbytes):
+        self.data = data
+        self.nbytes = nbytes
+
+
 class _PackedNdarray(object):
 
     def __init__(self, array, mem, offset):
@@ -534,84 +769,80 @@ class _PackedNdarray(object):
         target = numpy.frombuffer(mem, self.dtype, self.size, self.offset)
         target[...] = array.ravel()
 
-    def unpack(self, mem):
+    def unpack(self, mem, copy=True):
         ret = numpy.frombuffer(mem, self.dtype, self.size, self.offset)
-        ret = ret.reshape(self.shape).copy()
+        ret = ret.reshape(self.shape)
+        if copy:
+            ret = ret.copy()
         return ret
 
 
 def _measure(data):
     expect = 0
     t = type(data)
-    if t is tuple or t is list or t is dict:
-        for v in data:
-            if isinstance(v, numpy.ndarray):
-                expect += v.nbytes
+    if t is _batch.ColumnMajorBatch:
+        values = data.columns
+    elif t is tuple or t is list:
+        values = data
+    elif t is dict:
+        values = six.itervalues(data)
+    else:
+        values = (data,)
+    for v in values:
+        if isinstance(v, numpy.ndarray):
+            expect += v.nbytes
     return expect
 
 
-def _pack(data, mem, offset, limit):
-    if len(mem) == 0:
-        return data
+def _pack(data, mem, offset):
     t = type(data)
-    over = False
-    if t is tuple or t is list:
+    if t is _batch.ColumnMajorBatch:
+        data = _batch.ColumnMajorBatch(
+            data.keys, data.mode, _pack(data.columns, mem, offset), len(data),
+            data.convert)
+    elif t is tuple or t is list:
         ret = []
         for v in data:
             if isinstance(v, numpy.ndarray):
-                if v.nbytes + offset > limit:
-                    over = True
-                else:
-                    v = _PackedNdarray(v, mem, offset)
-                    offset += v.nbytes
+                v = _PackedNdarray(v, mem, offset)
+                offset += v.nbytes
             ret.append(v)
         data = t(ret)
     elif t is dict:
         ret = {}
         for k, v in six.iteritems(data):
             if isinstance(v, numpy.ndarray):
-                if v.nbytes + offset > limit:
-                    over = True
-                else:
-                    v = _PackedNdarray(v, mem, offset)
-                    offset += v.nbytes
+                v = _PackedNdarray(v, mem, offset)
+                offset += v.nbytes
             ret[k] = v
         data = ret
-    elif t is numpy.ndarray:
-        if data.nbytes + offset > limit:
-            over = True
-        else:
-            data = _PackedNdarray(data, mem, offset)
-            offset += data.nbytes
-    if over:
-        expect = _measure(data)
-        warnings.warn(
-            'Shared memory size is too small.\n' +
-            'Please set shared_mem option for MultiprocessIterator.\n' +
-            'Expect shared memory size: {} bytes.\n'.format(expect) +
-            'Actual shared memory size: {} bytes.'.format(limit - offset),
-            UserWarning)
+    elif isinstance(data, numpy.ndarray):
+        data = _PackedNdarray(data, mem, offset)
     return data
 
 
-def _unpack(data, mem):
-    if len(mem) == 0:
-        return data
+def _unpack(data, mem, copy=True):
     t = type(data)
-    if t is tuple or t is list:
+    if t is _OversizedData:
+        data = data.data
+    elif t is _batch.ColumnMajorBatch:
+        data = _batch.ColumnMajorBatch(
+            data.keys, data.mode, _unpack(data.columns, mem, copy),
+            len(data), data.convert)
+    elif t is tuple or t is list:
         ret = []
         for v in data:
             if isinstance(v, _PackedNdarray):
-                v = v.unpack(mem)
+                v = v.unpack(mem, copy)
             ret.append(v)
         data = t(ret)
     elif t is dict:
         ret = {}
         for k, v in six.iteritems(data):
             if isinstance(v, _PackedNdarray):
-                v = v.unpack(mem)
+                v = v.unpack(mem, copy)
             ret[k] = v
         data = ret
     elif t is _PackedNdarray:
-        data = data.unpack(mem)
+        data = data.unpack(mem, copy)
     return data
@@ -4,6 +4,8 @@ from multiprocessing import pool
 import numpy
 
 from chainer.dataset import iterator
+from chainer.dataset.tabular import _batch
+from chainer.dataset.tabular import tabular_dataset
 from chainer.iterators import _statemachine
 from chainer.iterators.order_samplers import ShuffleOrderSampler
 
@@ -152,8 +154,14 @@ class MultithreadIterator(iterator.Iterator):
         else:
             if self._pool is None:
                 self._pool = pool.ThreadPool(self.n_threads)
-            args = [(self.dataset, index) for index in indices]
-            self._next = self._pool.map_async(MultithreadIterator._read, args)
+            if isinstance(self.dataset, tabular_dataset.TabularDataset):
+                # A tabular dataset reads the whole batch at once.
+                self._next = self._pool.apply_async(
+                    _batch.fetch_batch, (self.dataset, indices))
+            else:
+                args = [(self.dataset, index) for index in indices]
+                self._next = self._pool.map_async(
+                    MultithreadIterator._read, args)
 
     def _get(self):
         self._previous_epoch_detail = self.epoch_detail
@@ -167,7 +175,7 @@ class MultithreadIterator(iterator.Iterator):
         while not next.ready():
             next.wait(0.5)  # To avoid interruption bug in Python2
 
-        batch = [data for data in next.get()]
+        batch = next.get()
         return batch
 
     @property
@@ -3,6 +3,7 @@ from __future__ import division
 import numpy
 
 from chainer.dataset import iterator
+from chainer.dataset.tabular import _batch
 from chainer.iterators import _statemachine
 from chainer.iterators.order_samplers import ShuffleOrderSampler
 
@@ -74,7 +75,7 @@ class SerialIterator(iterator.Iterator):
         if indices is None:
             raise StopIteration
 
-        batch = [self.dataset[index] for index in indices]
+        batch = _batch.fetch_batch(self.dataset, indices)
         return batch
 
     next = __next__
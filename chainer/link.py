@@ -659,6 +659,14 @@ class Link(device_resident.DeviceResident):
                 # Initialize the parameter here
                 param.initialize(data.shape)
                 param.data[:] = param.device.send(data)
+            elif (isinstance(data, numpy.ndarray) and
+                    isinstance(param.data, numpy.ndarray) and
+                    data is not param.data and
+                    data.shape == param.data.shape and
+                    data.dtype == param.data.dtype):
+                # The deserializer provides a new storage of the parameter
+                # (e.g. a memory-mapped array).
+                param.array = data
         for name in self._persistent:
             d[name] = serializer(name, d[name])
 
@@ -315,6 +315,24 @@ class Summary(object):
             warnings.warn('The previous statistics are not saved.')
 
 
+def _scalar_entries(d):
+    # Yields the scalar values in the dictionary with their weights.
+    for k, v in six.iteritems(d):
+        w = 1
+        if isinstance(v, tuple):
+            w = v[1]
+            v = v[0]
+            if isinstance(w, variable.Variable):
+                w = w.array
+            if not numpy.isscalar(w) and not getattr(w, 'ndim', -1) == 0:
+                raise ValueError(
+                    'Given weight to {} was not scalar.'.format(k))
+        if isinstance(v, variable.Variable):
+            v = v.array
+        if numpy.isscalar(v) or getattr(v, 'ndim', -1) == 0:
+            yield k, v, w
+
+
 class DictSummary(object):
 
     """Online summarization of a sequence of dictionaries.
@@ -339,20 +357,8 @@ class DictSummary(object):
 
         """
         summaries = self._summaries
-        for k, v in six.iteritems(d):
-            w = 1
-            if isinstance(v, tuple):
-                w = v[1]
-                v = v[0]
-                if isinstance(w, variable.Variable):
-                    w = w.array
-                if not numpy.isscalar(w) and not getattr(w, 'ndim', -1) == 0:
-                    raise ValueError(
-                        'Given weight to {} was not scalar.'.format(k))
-            if isinstance(v, variable.Variable):
-                v = v.array
-            if numpy.isscalar(v) or getattr(v, 'ndim', -1) == 0:
-                summaries[k].add(v, weight=w)
+        for k, v, w in _scalar_entries(d):
+            summaries[k].add(v, weight=w)
 
     def compute_mean(self):
         """Creates a dictionary of mean values.
@@ -404,3 +410,227 @@ class DictSummary(object):
             for index, name in enumerate(names):
                 self._summaries[name].serialize(
                     serializer['_summaries'][str(index)])
+
+
+class _PackedSummary(object):
+
+    # Sums of values, squared values and weights of the entries on a device,
+    # each of which is packed into a one-dimensional array.
+
+    def __init__(self, device):
+        self.device = device
+        self.names = []
+        self._index = {}
+        xp = device.xp
+        with chainer.using_device(device):
+            self.x = xp.zeros((0,), dtype=numpy.float64)
+            self.x2 = xp.zeros((0,), dtype=numpy.float64)
+            self.n = xp.zeros((0,), dtype=numpy.float64)
+            self._zero = xp.zeros((), dtype=numpy.float64)
+        self._weights_cache = None
+
+    def _extend(self, names):
+        xp = self.device.xp
+        for name in names:
+            self._index[name] = len(self.names)
+            self.names.append(name)
+        with chainer.using_device(self.device):
+            zeros = xp.zeros((len(names),), dtype=numpy.float64)
+            self.x = xp.concatenate((self.x, zeros))
+            self.x2 = xp.concatenate((self.x2, zeros))
+            self.n = xp.concatenate((self.n, zeros))
+
+    def _pack(self, values):
+        xp = self.device.xp
+        values = [xp.asarray(v) for v in values]
+        if len(set(v.dtype for v in values)) > 1:
+            values = [v.astype(numpy.float64) for v in values]
+        return xp.stack(values).astype(numpy.float64)
+
+    def _pack_weights(self, weights):
+        if not all(numpy.isscalar(w) for w in weights):
+            return self._pack([
+                self._zero + w if numpy.isscalar(w) else w for w in weights])
+        # Weights given as Python scalars are transferred to the device only
+        # when they change.
+        weights = tuple(weights)
+        if self._weights_cache is None or self._weights_cache[0] != weights:
+            packed = self.device.send(numpy.array(weights, numpy.float64))
+            self._weights_cache = weights, packed
+        return self._weights_cache[1]
+
+    def add(self, entries):
+        new_names = [k for k, _, _ in entries if k not in self._index]
+        if new_names:
+            self._extend(new_names)
+        values = [self._zero] * len(self.names)
+        weights = [0] * len(self.names)
+        for k, v, w in entries:
+            if isinstance(v, chainerx.ndarray):
+                v = v.as_grad_stopped()
+            index = self._index[k]
+            values[index] = v
+            weights[index] = w
+
+        with chainer.using_device(self.device):
+            v = self._pack(values)
+            w = self._pack_weights(weights)
+            self.x += w * v
+            self.x2 += w * v * v
+            self.n += w
+
+    def to_cpu(self):
+        with chainer.using_device(self.device):
+            stacked = self.device.xp.stack((self.x, self.x2, self.n))
+        return backend.CpuDevice().send(stacked)
+
+    def make_statistics(self, with_std):
+        xp = self.device.xp
+        with chainer.using_device(self.device):
+            # The statistics of the entries of zero weights are NaN.
+            n = xp.where(self.n == 0, numpy.nan, self.n)
+            mean = self.x / n
+            std = xp.sqrt(self.x2 / n - mean * mean) if with_std else None
+        return mean, std
+
+
+class PackedDictSummary(object):
+
+    """Online summarization of dictionaries packing the values on each device.
+
+    ``PackedDictSummary`` computes the same statistics as
+    :class:`~chainer.DictSummary`. Instead of accumulating each entry
+    separately, it packs the scalars of a dictionary on each device into one
+    array and accumulates them at once, so that the number of operations per
+    dictionary does not grow with the number of entries. The statistics of all
+    entries on a device are also transferred to the host with a single copy
+    when ``to_cpu=True`` is given to :meth:`compute_mean` or
+    :meth:`make_statistics`, instead of synchronizing with the device for each
+    entry.
+
+    The values are accumulated in double precision. If a value of the same
+    name is given on different devices, the statistics of the name are
+    computed on the host. The statistics of a name whose total weight is zero
+    are NaN.
+
+    """
+
+    def __init__(self):
+        self._summaries = []
+
+    def _get_summary(self, device):
+        for summary in self._summaries:
+            if summary.device == device:
+                return summary
+        summary = _PackedSummary(device)
+        self._summaries.append(summary)
+        return summary
+
+    def add(self, d):
+        """Adds a dictionary of scalars.
+
+        Args:
+            d (dict): Dictionary of scalars to accumulate. Only elements of
+               scalars, zero-dimensional arrays, and variables of
+               zero-dimensional arrays are accumulated. When the value
+               is a tuple, the second element is interpreted as a weight.
+
+        """
+        groups = []
+        for k, v, w in _scalar_entries(d):
+            device = backend.get_device_from_array(v)
+            for group_device, entries in groups:
+                if group_device == device:
+                    entries.append((k, v, w))
+                    break
+            else:
+                groups.append((device, [(k, v, w)]))
+        for device, entries in groups:
+            self._get_summary(device).add(entries)
+
+    def _sum_on_cpu(self):
+        sums = collections.OrderedDict()
+        for summary in self._summaries:
+            x, x2, n = summary.to_cpu()
+            for i, name in enumerate(summary.names):
+                s = sums.setdefault(name, [0.0, 0.0, 0.0])
+                s[0] += float(x[i])
+                s[1] += float(x2[i])
+                s[2] += float(n[i])
+        return sums
+
+    def _compute(self, to_cpu, with_std):
+        stats = {}
+        names = [name for s in self._summaries for name in s.names]
+        if to_cpu or len(names) != len(set(names)):
+            for name, (x, x2, n) in six.iteritems(self._sum_on_cpu()):
+                if n == 0:
+                    stats[name] = float('nan'), float('nan')
+                    continue
+                mean = x / n
+                std = numpy.sqrt(x2 / n - mean * mean) if with_std else None
+                stats[name] = mean, std
+            return stats
+        for summary in self._summaries:
+            mean, std = summary.make_statistics(with_std)
+            for i, name in enumerate(summary.names):
+                stats[name] = mean[i], None if std is None else std[i]
+        return stats
+
+    def compute_mean(self, to_cpu=False):
+        """Creates a dictionary of mean values.
+
+        Args:
+            to_cpu (bool): If ``True``, the mean values are returned as
+                Python floats. Otherwise, they are zero-dimensional arrays on
+                the devices of the values.
+
+        Returns:
+            dict: Dictionary of mean values.
+
+        """
+        return {name: mean for name, (mean, _)
+                in six.iteritems(self._compute(to_cpu, False))}
+
+    def make_statistics(self, to_cpu=False):
+        """Creates a dictionary of statistics.
+
+        It returns a single dictionary that holds mean and standard deviation
+        values for every entry added to the summary. For an entry of name
+        ``'key'``, these values are added to the dictionary by names ``'key'``
+        and ``'key.std'``, respectively.
+
+        Args:
+            to_cpu (bool): If ``True``, the statistics are returned as Python
+                floats. Otherwise, they are zero-dimensional arrays on the
+                devices of the values.
+
+        Returns:
+            dict: Dictionary of statistics of all entries.
+
+        """
+        stats = {}
+        for name, (mean, std) in six.iteritems(self._compute(to_cpu, True)):
+            stats[name] = mean
+            stats[name + '.std'] = std
+        return stats
+
+    def serialize(self, serializer):
+        if isinstance(serializer, serializer_module.Serializer):
+            sums = self._sum_on_cpu()
+            serializer('_names', json.dumps(list(sums)))
+            for i, key in enumerate(('_x', '_x2', '_n')):
+                serializer(key, numpy.array(
+                    [s[i] for s in sums.values()], dtype=numpy.float64))
+        else:
+            self._summaries = []
+            try:
+                names = json.loads(serializer('_names', ''))
+            except KeyError:
+                warnings.warn('The names of statistics are not saved.')
+                return
+            summary = self._get_summary(backend.CpuDevice())
+            summary._extend(names)
+            summary.x = serializer('_x', summary.x)
+            summary.x2 = serializer('_x2', summary.x2)
+            summary.n = serializer('_n', summary.n)
@@ -1,7 +1,113 @@
 import copy
 import inspect
+import math
 
+import six
+
+import chainer
+from chainer.functions.util import forget as _forget
 from chainer import link as _link
+from chainer import reporter as _reporter
+from chainer import variable as _variable
+
+
+def _call_layer(layer, x):
+    if isinstance(x, tuple):
+        return layer(*x)
+    return layer(x)
+
+
+def _nbytes(x):
+    if isinstance(x, tuple):
+        return sum(_nbytes(y) for y in x)
+    if isinstance(x, _variable.Variable):
+        x = x.array
+    return getattr(x, 'nbytes', 0)
+
+
+def _split_uniformly(n_layers, n_segments):
+    # Splits the layers into segments of almost the same number of layers.
+    # Each segment is represented by a tuple of (start, stop, forget).
+    n_segments = max(1, min(n_segments, n_layers))
+    bounds = [n_layers * i // n_segments for i in six.moves.range(
+        n_segments + 1)]
+    return _make_plan(bounds)
+
+
+def _split_by_size(sizes, n_segments):
+    # Splits the layers into at most `n_segments` segments whose activations
+    # have almost the same size.
+    total = sum(sizes)
+    bounds = [0]
+    accumulated = 0
+    for i, size in enumerate(sizes[:-1]):
+        accumulated += size
+        if accumulated * n_segments >= total * len(bounds):
+            bounds.append(i + 1)
+    bounds.append(len(sizes))
+    return _make_plan(bounds)
+
+
+def _make_plan(bounds):
+    # The last segment is not recomputed, since its backward computation
+    # runs first.
+    plan = [(start, stop, True) for start, stop in zip(bounds, bounds[1:])]
+    start, stop, _ = plan[-1]
+    plan[-1] = start, stop, False
+    return plan
+
+
+def _estimate_memory(sizes, plan):
+    # Returns the size of the activations kept after the forward computation
+    # and the estimated peak size of the activations during the backward
+    # computation, which processes the segments in the reverse order.
+    stored = 0
+    peak = 0
+    for start, stop, forget in plan:
+        peak = max(peak, stored + sum(sizes[start:stop]))
+        if forget:
+            stored += sizes[stop - 1]
+        else:
+            stored += sum(sizes[start:stop])
+    return stored, peak
+
+
+def _split_within_budget(sizes, n_forgotten, memory_budget):
+    # Splits the first `n_forgotten` layers into segments to be recomputed,
+    # each of which is made as long as the budget allows, and keeps the
+    # activations of the rest. Returns None if the plan exceeds the budget.
+    bounds = [0]
+    stored = 0
+    segment = 0
+    for i in six.moves.range(n_forgotten):
+        if stored + segment + sizes[i] > memory_budget and i > bounds[-1]:
+            stored += sizes[i - 1]
+            bounds.append(i)
+            segment = 0
+        segment += sizes[i]
+    if n_forgotten > 0:
+        bounds.append(n_forgotten)
+    bounds.append(len(sizes))
+    plan = _make_plan(bounds)
+    _, peak = _estimate_memory(sizes, plan)
+    if peak > memory_budget:
+        return None
+    return plan
+
+
+def _plan_for_budget(sizes, memory_budget):
+    # Chooses the plan which recomputes the fewest layers within the budget.
+    # If there is no such plan, the one with the lowest estimated peak is
+    # chosen.
+    n_layers = len(sizes)
+    for n_forgotten in six.moves.range(n_layers):
+        plan = _split_within_budget(sizes, n_forgotten, memory_budget)
+        if plan is not None:
+            return plan
+    return min(
+        (_split_by_size(sizes, n_segments)
+         for n_segments in six.moves.range(1, n_layers + 1)),
+        key=lambda plan: _estimate_memory(sizes, plan)[1])
 
 
 class Sequential(_link.ChainList):
@@ -121,6 +227,8 @@ class Sequential(_link.ChainList):
     def __init__(self, *layers):
         super(Sequential, self).__init__()
         self._layers = []
+        self._checkpoint = None
+        self._activation_sizes = None
         for layer in layers:
             self.append(layer)
 
@@ -208,13 +316,126 @@ class Sequential(_link.ChainList):
         if not self._layers:
             raise RuntimeError('Sequential does not have any layer.')
 
+        if self._checkpoint is not None and chainer.config.enable_backprop:
+            return self._forward_checkpoint(x)
+
         for layer in self._layers:
-            if isinstance(x, tuple):
-                x = layer(*x)
+            x = _call_layer(layer, x)
+        return x
+
+    def enable_checkpointing(self, memory_budget=None, n_segments=None):
+        """Enables activation checkpointing of the forward computation.
+
+        With checkpointing enabled, the layers are split into segments, and
+        only the outputs of the segments are kept on the forward computation
+        while the computational graph is built. The intermediate results in
+        each segment are recomputed on the backward computation by
+        :func:`~chainer.functions.forget`, which reduces the memory usage at
+        the cost of computing the forward of the segments twice. The last
+        segment is never recomputed, since its backward computation runs
+        first.
+
+        The layers are split into about :math:`\\sqrt{n}` segments of the
+        same number of layers by default, where :math:`n` is the number of
+        the layers. If ``memory_budget`` is given, the segments are chosen
+        from the sizes of the outputs of the layers measured in the previous
+        call, so that the fewest layers are recomputed while the estimated
+        peak size of the activations fits in the budget. The first call uses
+        the default segments.
+
+        On each call with checkpointing, the size of the activations kept
+        after the forward computation and the estimated peak size of the
+        activations during the backward computation are reported as
+        ``activation_memory`` and ``peak_memory`` in bytes, if this link is
+        registered to the current reporter as an observer. The sizes are
+        estimated from the outputs of the layers; the arrays internally
+        retained by the layers are not counted.
+
+        .. note::
+           As :func:`~chainer.functions.forget`, checkpointing does not
+           support double backpropagation, nor layers which behave
+           differently in multiple calls with the same inputs, such as
+           :func:`~chainer.functions.dropout`.
+
+        Checkpointing is skipped if backpropagation is disabled, e.g. in
+        :func:`~chainer.no_backprop_mode`.
+
+        Args:
+            memory_budget (int): The budget of the peak size of the
+                activations in bytes.
+            n_segments (int): The number of the segments. The layers are
+                split into segments of the same number of layers.
+                ``memory_budget`` and ``n_segments`` cannot be specified
+                together.
+
+        .. admonition:: Example
+
+            >>> model = chainer.Sequential(
+            ...     *[L.Linear(10, 10) for _ in range(16)])
+            >>> model.enable_checkpointing(memory_budget=4 * 1024 * 1024)
+
+        """
+        if memory_budget is not None and n_segments is not None:
+            raise ValueError(
+                'memory_budget and n_segments cannot be specified together.')
+        if n_segments is not None and n_segments < 1:
+            raise ValueError('n_segments must be positive.')
+        self._checkpoint = memory_budget, n_segments
+        self._activation_sizes = None
+
+    def disable_checkpointing(self):
+        """Disables activation checkpointing of the forward computation."""
+        self._checkpoint = None
+        self._activation_sizes = None
+
+    def _plan_checkpoint(self):
+        memory_budget, n_segments = self._checkpoint
+        n_layers = len(self._layers)
+        sizes = self._activation_sizes
+        if (memory_budget is not None and sizes is not None and
+                len(sizes) == n_layers):
+            return _plan_for_budget(sizes, memory_budget)
+        if n_segments is None:
+            n_segments = int(math.ceil(math.sqrt(n_layers)))
+        return _split_uniformly(n_layers, n_segments)
+
+    def _forward_checkpoint(self, x):
+        plan = self._plan_checkpoint()
+        sizes = [0] * len(self._layers)
+
+        def run_segment(start, stop):
+            def f(*xs):
+                y = xs if len(xs) > 1 else xs[0]
+                for i in six.moves.range(start, stop):
+                    y = _call_layer(self._layers[i], y)
+                    if not chainer.config.in_recomputing:
+                        sizes[i] = _nbytes(y)
+                return y
+            return f
+
+        for start, stop, forget in plan:
+            f = run_segment(start, stop)
+            if not forget:
+                x = f(*x) if isinstance(x, tuple) else f(x)
+            elif isinstance(x, tuple):
+                x = _forget.forget(f, *x)
             else:
-                x = layer(x)
+                x = _forget.forget(f, x)
+
+        self._activation_sizes = sizes
+        self._report_memory(sizes, plan)
         return x
 
+    def _report_memory(self, sizes, plan):
+        if not _reporter._reporters:
+            return
+        current = _reporter.get_current_reporter()
+        if id(self) not in current._observer_names:
+            return
+        stored, peak = _estimate_memory(sizes, plan)
+        current.report(
+            {'activation_memory': stored, 'peak_memory': peak}, self)
+
     def __reduce__(self):
         n_lambda = 0
         for layer in self._layers:
@@ -366,6 +587,7 @@ class Sequential(_link.ChainList):
                 ret.append(layer.copy(mode))
             else:
                 ret.append(copy.copy(layer))
+        ret._checkpoint = self._checkpoint
         return ret
 
     def copyparams(self, link, copy_persistent=True):
@@ -5,4 +5,9 @@ from chainer.serializers.hdf5 import save_hdf5  # NOQA
 from chainer.serializers.npz import DictionarySerializer  # NOQA
 from chainer.serializers.npz import load_npz  # NOQA
 from chainer.serializers.npz import NpzDeserializer  # NOQA
+from chainer.serializers.npz import NpzSerializer  # NOQA
 from chainer.serializers.npz import save_npz  # NOQA
+from chainer.serializers.raw import load_raw  # NOQA
+from chainer.serializers.raw import open_raw  # NOQA
+from chainer.serializers.raw import RawDeserializer  # NOQA
+from chainer.serializers.raw import save_raw  # NOQA
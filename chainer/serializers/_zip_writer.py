@@ -0,0 +1,143 @@
+import struct
+import zlib
+
+
+# Minimal writer of ZIP archives whose entries are compressed by the caller.
+# :mod:`zipfile` compresses the data of each entry by itself while it holds
+# the archive, which makes it impossible to compress several entries in
+# parallel.
+
+_LOCAL_HEADER = struct.Struct('<IHHHHHIIIHH')
+_CENTRAL_HEADER = struct.Struct('<IHHHHHHIIIHHHHHII')
+_END_RECORD = struct.Struct('<IHHHHIIH')
+_END_RECORD64 = struct.Struct('<IQHHIIQQQQ')
+_END_LOCATOR64 = struct.Struct('<IIQI')
+
+_ZIP64_LIMIT = 0xFFFFFFFF
+_ZIP_FILECOUNT_LIMIT = 0xFFFF
+_VERSION = 20
+_VERSION64 = 45
+_UTF8_FLAG = 0x800
+# 1980-01-01 00:00:00, the same as the entries written by numpy.savez.
+_DOS_TIME = 0
+_DOS_DATE = (0 << 9) | (1 << 5) | 1
+
+STORED = 0
+DEFLATED = 8
+
+
+def deflate(data, level=zlib.Z_DEFAULT_COMPRESSION):
+    """Compresses data for an entry of method :data:`DEFLATED`."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush()
+
+
+class ZipWriter(object):
+
+    def __init__(self, file):
+        self._file = file
+        self._position = 0
+        # Maps names to central directory records. A name written twice
+        # refers to the last entry.
+        self._entries = {}
+
+    def _write(self, data):
+        self._file.write(data)
+        self._position += len(data)
+
+    def write(self, name, data, compressed=None, crc=None, method=STORED):
+        """Writes an entry.
+
+        Args:
+            name (str): Name of the entry.
+            data (bytes): Uncompressed data. Only its length is used if
+                ``compressed`` and ``crc`` are given.
+            compressed (bytes): Data compressed by ``method``.
+            crc (int): CRC-32 of ``data``.
+            method (int): :data:`STORED` or :data:`DEFLATED`.
+
+        """
+        if compressed is None:
+            if method == STORED:
+                compressed = data
+            else:
+                compressed = deflate(data)
+        if crc is None:
+            crc = zlib.crc32(data)
+        crc &= 0xFFFFFFFF
+
+        encoded = name.encode('utf-8')
+        flags = 0
+        try:
+            name.encode('ascii')
+        except UnicodeError:
+            flags |= _UTF8_FLAG
+
+        size = len(data)
+        compressed_size = len(compressed)
+        offset = self._position
+
+        zip64 = size >= _ZIP64_LIMIT or compressed_size >= _ZIP64_LIMIT
+        if zip64:
+            extra = struct.pack('<HHQQ', 1, 16, size, compressed_size)
+            header_sizes = (_ZIP64_LIMIT, _ZIP64_LIMIT)
+        else:
+            extra = b''
+            header_sizes = (compressed_size, size)
+        version = _VERSION64 if zip64 else _VERSION
+
+        self._write(_LOCAL_HEADER.pack(
+            0x04034b50, version, flags, method, _DOS_TIME, _DOS_DATE, crc,
+            header_sizes[0], header_sizes[1], len(encoded), len(extra)))
+        self._write(encoded)
+        self._write(extra)
+        self._write(compressed)
+
+        self._entries.pop(name, None)
+        self._entries[name] = (
+            encoded, flags, method, crc, size, compressed_size, offset)
+
+    def close(self):
+        """Writes the central directory."""
+        start = self._position
+        for encoded, flags, method, crc, size, compressed_size, offset in \
+                self._entries.values():
+            extra_values = []
+            if size >= _ZIP64_LIMIT:
+                extra_values.append(size)
+                size = _ZIP64_LIMIT
+            if compressed_size >= _ZIP64_LIMIT:
+                extra_values.append(compressed_size)
+                compressed_size = _ZIP64_LIMIT
+            if offset >= _ZIP64_LIMIT:
+                extra_values.append(offset)
+                offset = _ZIP64_LIMIT
+            if extra_values:
+                extra = struct.pack(
+                    '<HH' + 'Q' * len(extra_values), 1,
+                    8 * len(extra_values), *extra_values)
+                version = _VERSION64
+            else:
+                extra = b''
+                version = _VERSION
+            self._write(_CENTRAL_HEADER.pack(
+                0x02014b50, version, version, flags, method, _DOS_TIME,
+                _DOS_DATE, crc, compressed_size, size, len(encoded),
+                len(extra), 0, 0, 0, 0o600 << 16, offset))
+            self._write(encoded)
+            self._write(extra)
+        end = self._position
+
+        count = len(self._entries)
+        size = end - start
+        if (count >= _ZIP_FILECOUNT_LIMIT or size >= _ZIP64_LIMIT or
+                start >= _ZIP64_LIMIT):
+            self._write(_END_RECORD64.pack(
+                0x06064b50, _END_RECORD64.size - 12, _VERSION64, _VERSION64,
+                0, 0, count, count, size, start))
+            self._write(_END_LOCATOR64.pack(0x07064b50, 0, end, 1))
+            count = min(count, _ZIP_FILECOUNT_LIMIT)
+            size = min(size, _ZIP64_LIMIT)
+            start = min(start, _ZIP64_LIMIT)
+        self._write(_END_RECORD.pack(
+            0x06054b50, 0, 0, count, count, size, start, 0))
@@ -1,3 +1,8 @@
+import collections
+import io
+from multiprocessing import pool
+import zlib
+
 import numpy
 import six
 
@@ -5,6 +10,7 @@ from chainer.backends import _cpu
 from chainer.backends import cuda
 from chainer.backends import intel64
 from chainer import serializer
+from chainer.serializers import _zip_writer
 import chainerx
 
 
@@ -80,17 +86,130 @@ def serialize(obj):
     return s.target
 
 
-def save_npz(file, obj, compression=True):
+def _encode_npy(array, compression):
+    # Returns the NPY data of an array, its CRC-32 and its compressed data.
+    f = io.BytesIO()
+    numpy.lib.format.write_array(f, array, **_allow_pickle_kwargs)
+    data = f.getvalue()
+    compressed = _zip_writer.deflate(data) if compression else data
+    return data, zlib.crc32(data), compressed
+
+
+class _NpzStreamWriter(object):
+
+    # Writes arrays into a ZIP archive in the order of `write` calls. With
+    # multiple threads, up to `n_threads` arrays are encoded in parallel.
+
+    def __init__(self, file, compression, n_threads):
+        self._zip = _zip_writer.ZipWriter(file)
+        self._compression = compression
+        self._method = (_zip_writer.DEFLATED if compression
+                        else _zip_writer.STORED)
+        self._n_threads = n_threads
+        self._pool = pool.ThreadPool(n_threads) if n_threads > 1 else None
+        self._pending = collections.deque()
+
+    def write(self, key, array):
+        if self._pool is None:
+            self._write_entry(key, _encode_npy(array, self._compression))
+            return
+        self._pending.append((key, self._pool.apply_async(
+            _encode_npy, (array, self._compression))))
+        if len(self._pending) > self._n_threads:
+            self._flush_one()
+
+    def _write_entry(self, key, encoded):
+        data, crc, compressed = encoded
+        self._zip.write(key + '.npy', data, compressed, crc, self._method)
+
+    def _flush_one(self):
+        key, result = self._pending.popleft()
+        self._write_entry(key, result.get())
+
+    def close(self):
+        try:
+            while self._pending:
+                self._flush_one()
+            self._zip.close()
+        finally:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool.join()
+                self._pool = None
+
+
+class NpzSerializer(serializer.Serializer):
+
+    """Serializer that writes objects into an NPZ file as they are visited.
+
+    Unlike :class:`DictionarySerializer`, this serializer does not build a
+    dictionary of all the arrays; each array is copied to the host, encoded
+    and written into the file as soon as it is visited. The peak memory usage
+    is therefore about the size of the largest array (times ``n_threads``).
+    The resulting file can be read by :func:`numpy.load` and
+    :class:`NpzDeserializer`.
+
+    The file is complete only after :meth:`close` is called.
+
+    Args:
+        file (file-like): Target file to write to. It does not have to be
+            seekable.
+        compression (bool): If ``True``, compression in the resulting zip file
+            is enabled.
+        n_threads (int): Number of threads to encode and compress arrays.
+            Since :mod:`zlib` releases the GIL, compression of independent
+            arrays runs in parallel.
+        path (str): The base path in the hierarchy that this serializer
+            indicates.
+
+    """
+
+    def __init__(self, file, compression=True, n_threads=1, path='',
+                 _writer=None):
+        if _writer is None:
+            _writer = _NpzStreamWriter(file, compression, n_threads)
+        self._writer = _writer
+        self.path = path
+
+    def __getitem__(self, key):
+        key = key.strip('/')
+        return NpzSerializer(
+            None, path=self.path + key + '/', _writer=self._writer)
+
+    def __call__(self, key, value):
+        key = key.lstrip('/')
+        array = (_cpu._to_cpu(value) if value is not None
+                 else numpy.asarray(None))
+        self._writer.write(self.path + key, numpy.asarray(array))
+        return value
+
+    def close(self):
+        """Finishes writing the NPZ file."""
+        self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def save_npz(file, obj, compression=True, n_threads=1):
     """Saves an object to the file in NPZ format.
 
     This is a short-cut function to save only one object into an NPZ file.
+    The object is serialized by :class:`NpzSerializer`, which writes each
+    array into the file as soon as it is visited.
 
     Args:
         file (str or file-like): Target file to write to.
         obj: Object to be serialized. It must support serialization protocol.
-            If it is a dictionary object, the serialization will be skipped.
+            If it is a dictionary object (e.g. made by :func:`serialize`),
+            the serialization will be skipped and its arrays are written in
+            the same way.
         compression (bool): If ``True``, compression in the resulting zip file
             is enabled.
+        n_threads (int): Number of threads to compress arrays in parallel.
 
     .. seealso::
         :func:`chainer.serializers.load_npz`
@@ -98,20 +217,20 @@ def save_npz(file, obj, compression=True):
     """
     if isinstance(file, six.string_types):
         with open(file, 'wb') as f:
-            save_npz(f, obj, compression)
+            save_npz(f, obj, compression, n_threads)
         return
 
     if isinstance(obj, dict):
-        target = obj
-    else:
-        s = DictionarySerializer()
-        s.save(obj)
-        target = s.target
+        writer = _NpzStreamWriter(file, compression, n_threads)
+        try:
+            for key, value in six.iteritems(obj):
+                writer.write(key, numpy.asarray(value))
+        finally:
+            writer.close()
+        return
 
-    if compression:
-        numpy.savez_compressed(file, **target)
-    else:
-        numpy.savez(file, **target)
+    with NpzSerializer(file, compression, n_threads) as s:
+        s.save(obj)
 
 
 class NpzDeserializer(serializer.Deserializer):
@@ -151,11 +270,7 @@ class NpzDeserializer(serializer.Deserializer):
             self.npz, self.path + key + '/', strict=self.strict,
             ignore_names=self.ignore_names)
 
-    def __call__(self, key, value):
-        key = self.path + key.lstrip('/')
-        if not self.strict and key not in self.npz:
-            return value
-
+    def _is_ignored(self, key):
         if isinstance(self.ignore_names, (tuple, list)):
             ignore_names = self.ignore_names
         else:
@@ -163,14 +278,22 @@ class NpzDeserializer(serializer.Deserializer):
         for ignore_name in ignore_names:
             if isinstance(ignore_name, str):
                 if key == ignore_name:
-                    return value
+                    return True
             elif callable(ignore_name):
                 if ignore_name(key):
-                    return value
+                    return True
             else:
                 raise ValueError(
                     'ignore_names needs to be a callable, string or '
                     'list of them.')
+        return False
+
+    def __call__(self, key, value):
+        key = self.path + key.lstrip('/')
+        if not self.strict and key not in self.npz:
+            return value
+        if self._is_ignored(key):
+            return value
 
         dataset = self.npz[key]
         if dataset[()] is None:
@@ -0,0 +1,224 @@
+import json
+import struct
+
+import numpy
+import six
+
+from chainer.serializers import npz
+
+
+# Layout of a raw file: the magic string, the length of the header as a
+# little-endian uint64, the header in JSON, and the raw data of each array.
+# The data of each array starts at an offset aligned to `_ALIGNMENT` bytes.
+_MAGIC = b'\x93CHAINER'
+_FORMAT_VERSION = 1
+_ALIGNMENT = 64
+
+
+def _align(offset):
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def save_raw(file, obj):
+    """Saves an object to the file in the raw format.
+
+    The raw format stores each array uncompressed at an offset aligned to 64
+    bytes after a small header, so that :func:`load_raw` can memory-map the
+    file instead of reading and decompressing it. Arrays of Python objects
+    cannot be stored in this format.
+
+    Args:
+        file (str or file-like): Target file to write to.
+        obj: Object to be serialized. It must support serialization protocol.
+            If it is a dictionary object, the serialization will be skipped.
+
+    .. seealso::
+        :func:`chainer.serializers.load_raw`
+
+    """
+    if isinstance(file, six.string_types):
+        with open(file, 'wb') as f:
+            save_raw(f, obj)
+        return
+
+    if isinstance(obj, dict):
+        target = obj
+    else:
+        s = npz.DictionarySerializer()
+        s.save(obj)
+        target = s.target
+
+    arrays = []
+    entries = {}
+    offset = 0
+    for key in sorted(target):
+        array = numpy.asarray(target[key])
+        if array.dtype == object:
+            if array.shape == () and array[()] is None:
+                entries[key] = None
+                continue
+            raise TypeError(
+                'Cannot save an array of Python objects in the raw format: '
+                '{}'.format(key))
+        entries[key] = {
+            'dtype': array.dtype.str,
+            'shape': list(array.shape),
+            'offset': offset,
+        }
+        arrays.append((offset, array))
+        offset = _align(offset + array.nbytes)
+
+    header = json.dumps({
+        'version': _FORMAT_VERSION, 'arrays': entries}).encode('utf-8')
+    data_offset = _align(len(_MAGIC) + 8 + len(header))
+    header += b' ' * (data_offset - len(_MAGIC) - 8 - len(header))
+
+    file.write(_MAGIC)
+    file.write(struct.pack('<Q', len(header)))
+    file.write(header)
+    position = 0
+    for offset, array in arrays:
+        file.write(b'\0' * (offset - position))
+        file.write(numpy.ascontiguousarray(array).data)
+        position = offset + array.nbytes
+    file.write(b'\0' * (_align(position) - position))
+
+
+def _read_header(file):
+    with open(file, 'rb') as f:
+        magic = f.read(len(_MAGIC))
+        if magic != _MAGIC:
+            raise ValueError('{} is not a file of the raw format'.format(file))
+        header_size, = struct.unpack('<Q', f.read(8))
+        header = json.loads(f.read(header_size).decode('utf-8'))
+    if header['version'] != _FORMAT_VERSION:
+        raise ValueError(
+            'Unsupported format version: {}'.format(header['version']))
+    return len(_MAGIC) + 8 + header_size, header['arrays']
+
+
+def open_raw(file, mode='r'):
+    """Memory-maps the arrays in a file of the raw format.
+
+    Args:
+        file (str): File to be opened.
+        mode (str): Mode of :class:`numpy.memmap`. ``'r'`` makes the arrays
+            read-only, and ``'c'`` makes them copy-on-write.
+
+    Returns:
+        dict: Dictionary that maps keys to arrays backed by the file. Values
+        saved as ``None`` are represented by ``numpy.asarray(None)``, as in
+        NPZ files.
+
+    """
+    data_offset, entries = _read_header(file)
+    mapped = None
+    arrays = {}
+    for key, entry in six.iteritems(entries):
+        if entry is None:
+            arrays[key] = numpy.asarray(None)
+            continue
+        dtype = numpy.dtype(entry['dtype'])
+        shape = tuple(entry['shape'])
+        if numpy.prod(shape, dtype=numpy.int64) == 0 or dtype.itemsize == 0:
+            # numpy.memmap cannot map an empty region.
+            arrays[key] = numpy.empty(shape, dtype=dtype)
+            continue
+        if mapped is None:
+            mapped = numpy.memmap(file, dtype=numpy.uint8, mode=mode)
+        arrays[key] = numpy.ndarray(
+            shape, dtype=dtype, buffer=mapped,
+            offset=data_offset + entry['offset'])
+    return arrays
+
+
+class RawDeserializer(npz.NpzDeserializer):
+
+    """Deserializer for the raw format.
+
+    This deserializer reads an object serialized by :func:`save_raw` from the
+    arrays returned by :func:`open_raw`. If ``adopt`` is ``True``, NumPy
+    arrays of the object which have the same shape and dtype as the stored
+    ones are replaced with the memory-mapped arrays instead of being
+    overwritten. The pages of the file are then read on demand and shared by
+    all the processes which load the same file, until they are written.
+
+    Args:
+        arrays (dict): Arrays returned by :func:`open_raw`.
+        path: The base path that the deserialization starts from.
+        strict (bool): If ``True``, the deserializer raises an error when an
+            expected value is not found in the given file. Otherwise,
+            it ignores the value and skip deserialization.
+        ignore_names (string, callable or list of them):
+            If callable, it is a function that takes a name of a parameter
+            and a persistent and returns ``True`` when it needs to be skipped.
+            If string, this is a name of a parameter or persistent that are
+            going to be skipped.
+            This can also be a list of callables and strings that behave as
+            described above.
+        adopt (bool): If ``True``, memory-mapped arrays are adopted as the
+            storage of NumPy arrays.
+
+    """
+
+    def __init__(self, arrays, path='', strict=True, ignore_names=None,
+                 adopt=False):
+        super(RawDeserializer, self).__init__(
+            arrays, path=path, strict=strict, ignore_names=ignore_names)
+        self.adopt = adopt
+
+    def __getitem__(self, key):
+        key = key.strip('/')
+        return RawDeserializer(
+            self.npz, self.path + key + '/', strict=self.strict,
+            ignore_names=self.ignore_names, adopt=self.adopt)
+
+    def __call__(self, key, value):
+        if self.adopt and type(value) is numpy.ndarray:
+            full_key = self.path + key.lstrip('/')
+            array = self.npz.get(full_key)
+            if (array is not None and array.shape == value.shape and
+                    array.dtype == value.dtype and
+                    not self._is_ignored(full_key)):
+                return array
+        return super(RawDeserializer, self).__call__(key, value)
+
+
+def load_raw(file, obj, path='', strict=True, ignore_names=None,
+             adopt=False):
+    """Loads an object from the file in the raw format.
+
+    The file is memory-mapped, so that arrays are not decompressed nor held
+    twice in memory while loading. If ``adopt`` is ``True``, NumPy arrays of
+    the object (e.g. parameters of links on CPU) directly use the mapped
+    pages as their storage; they are mapped copy-on-write, so updating them
+    does not modify the file.
+
+    Args:
+        file (str): File to be loaded.
+        obj: Object to be deserialized. It must support serialization protocol.
+        path (str): The path in the hierarchy of the serialized data under
+            which the data is to be loaded. The default behavior (blank) will
+            load all data under the root path.
+        strict (bool): If ``True``, the deserializer raises an error when an
+            expected value is not found in the given file. Otherwise,
+            it ignores the value and skip deserialization.
+        ignore_names (string, callable or list of them):
+            If callable, it is a function that takes a name of a parameter
+            and a persistent and returns ``True`` when it needs to be skipped.
+            If string, this is a name of a parameter or persistent that are
+            going to be skipped.
+            This can also be a list of callables and strings that behave as
+            described above.
+        adopt (bool): If ``True``, memory-mapped arrays are adopted as the
+            storage of NumPy arrays of the object instead of being copied.
+
+    .. seealso::
+        :func:`chainer.serializers.save_raw`
+
+    """
+    arrays = open_raw(file, mode='c' if adopt else 'r')
+    d = RawDeserializer(
+        arrays, path=path, strict=strict, ignore_names=ignore_names,
+        adopt=adopt)
+    d.load(obj)
@@ -1,13 +1,16 @@
 # import classes and functions
 from chainer.training.extensions._snapshot import snapshot  # NOQA
 from chainer.training.extensions._snapshot import snapshot_object  # NOQA
+from chainer.training.extensions.async_extension import AsyncExtension  # NOQA
 from chainer.training.extensions.computational_graph import DumpGraph  # NOQA
 from chainer.training.extensions.evaluator import Evaluator  # NOQA
+from chainer.training.extensions.evaluator import MultiprocessEvaluator  # NOQA
 from chainer.training.extensions.exponential_shift import ExponentialShift  # NOQA
 from chainer.training.extensions.fail_on_nonnumber import FailOnNonNumber  # NOQA
 from chainer.training.extensions.inverse_shift import InverseShift  # NOQA
 from chainer.training.extensions.linear_shift import LinearShift  # NOQA
 from chainer.training.extensions.log_report import LogReport  # NOQA
+from chainer.training.extensions.log_report import load_jsonl_log  # NOQA
 from chainer.training.extensions.micro_average import MicroAverage  # NOQA
 from chainer.training.extensions.multistep_shift import MultistepShift  # NOQA
 from chainer.training.extensions.parameter_statistics import ParameterStatistics  # NOQA
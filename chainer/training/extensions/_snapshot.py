@@ -1,3 +1,10 @@
+import itertools
+import threading
+
+import numpy
+
+from chainer.backends import _cpu
+from chainer.backends import cuda
 from chainer.serializers import npz
 from chainer.training import extension
 from chainer.training.extensions import snapshot_writers
@@ -6,7 +13,7 @@ from chainer.utils import argument
 
 def snapshot_object(target, filename, savefun=None, **kwargs):
     """snapshot_object(target, filename, savefun=None, \
-*, condition=None, writer=None, snapshot_on_error=False)
+*, condition=None, writer=None, snapshot_on_error=False, background=False)
 
     Returns a trainer extension to take snapshots of a given object.
 
@@ -45,6 +52,9 @@ def snapshot_object(target, filename, savefun=None, **kwargs):
             used.
         snapshot_on_error (bool): Whether to take a snapshot in case trainer
             loop has been failed.
+        background (bool): If ``True``, parameters and states of update rules
+            are copied to the host on a background thread. See
+            :meth:`chainer.training.extensions.snapshot` for details.
 
     Returns:
         Snapshot extension object.
@@ -61,7 +71,8 @@ def snapshot_object(target, filename, savefun=None, **kwargs):
 def snapshot(savefun=None,
              filename='snapshot_iter_{.updater.iteration}', **kwargs):
     """snapshot(savefun=None, filename='snapshot_iter_{.updater.iteration}', \
-*, target=None, condition=None, writer=None, snapshot_on_error=False)
+*, target=None, condition=None, writer=None, snapshot_on_error=False, \
+background=False)
 
     Returns a trainer extension to take snapshots of the trainer.
 
@@ -108,6 +119,16 @@ def snapshot(savefun=None,
             used.
         snapshot_on_error (bool): Whether to take a snapshot in case trainer
             loop has been failed.
+        background (bool): If ``True``, the parameters of the links optimized
+            by the optimizers of the updater and the states of their update
+            rules are not copied to the host when the snapshot is taken.
+            Instead, they are copied on a background thread, which then
+            invokes the writer, while the training loop goes on. The update
+            of each parameter waits only until the parameter and the states
+            of its update rule are copied. Other values (e.g. persistents of
+            links) are copied immediately, since they may be modified out of
+            update rules. The parameters must be modified only by the update
+            rules until the copy finishes.
 
     Returns:
         Snapshot extension object.
@@ -159,10 +180,11 @@ ProcessQueueWriter`
 
         - :meth:`chainer.training.extensions.snapshot_object`
     """
-    target, condition, writer, snapshot_on_error = argument.parse_kwargs(
-        kwargs,
-        ('target', None), ('condition', None), ('writer', None),
-        ('snapshot_on_error', False))
+    target, condition, writer, snapshot_on_error, background = \
+        argument.parse_kwargs(
+            kwargs,
+            ('target', None), ('condition', None), ('writer', None),
+            ('snapshot_on_error', False), ('background', False))
     argument.assert_kwargs_empty(kwargs)
 
     if savefun is not None and writer is not None:
@@ -176,13 +198,71 @@ ProcessQueueWriter`
 
     return _Snapshot(
         target=target, condition=condition, writer=writer, filename=filename,
-        snapshot_on_error=snapshot_on_error)
+        snapshot_on_error=snapshot_on_error, background=background)
 
 
 def _always_true():
     return True
 
 
+def _copy_to_host(array):
+    host = _cpu._to_cpu(array)
+    if isinstance(array, cuda.ndarray):
+        # The array has already been copied by the transfer.
+        return host
+    return numpy.array(host, copy=True)
+
+
+class _DeferredSerializer(npz.DictionarySerializer):
+
+    # Serializer that copies values to the host, except for the arrays in
+    # `deferred`, which maps the ids of arrays to their owners. Those arrays
+    # are recorded in `pending` to be copied later.
+
+    def __init__(self, deferred, pending, target=None, path=''):
+        super(_DeferredSerializer, self).__init__(target, path)
+        self._deferred = deferred
+        self._pending = pending
+
+    def __getitem__(self, key):
+        key = key.strip('/')
+        return _DeferredSerializer(
+            self._deferred, self._pending, self.target,
+            self.path + key + '/')
+
+    def __call__(self, key, value):
+        if value is None:
+            return super(_DeferredSerializer, self).__call__(key, value)
+        key = self.path + key.lstrip('/')
+        owner = self._deferred.get(id(value))
+        if owner is None:
+            self.target[key] = _copy_to_host(value)
+        else:
+            self.target[key] = None
+            self._pending.setdefault(owner, []).append((key, value))
+        return value
+
+
+class _SnapshotFence(object):
+
+    # Update rule hook that blocks the update of a parameter until its
+    # arrays are copied by the background snapshot.
+
+    timing = 'pre'
+
+    _ids = itertools.count()
+
+    def __init__(self):
+        # Each snapshot extension registers its own fence to the same rules.
+        self.name = 'SnapshotFence_{}'.format(next(self._ids))
+        self.events = {}
+
+    def __call__(self, rule, param):
+        event = self.events.get(rule)
+        if event is not None:
+            event.wait()
+
+
 class _Snapshot(extension.Extension):
     """Trainer extension to take snapshots.
 
@@ -203,7 +283,7 @@ class _Snapshot(extension.Extension):
     def __init__(
             self, target=None, condition=None, writer=None,
             filename='snapshot_iter_{.updater.iteration}',
-            snapshot_on_error=False):
+            snapshot_on_error=False, background=False):
         if condition is None:
             condition = _always_true
         if writer is None:
@@ -213,6 +293,11 @@ class _Snapshot(extension.Extension):
         self.condition = condition
         self.writer = writer
         self._snapshot_on_error = snapshot_on_error
+        self._background = background
+        self._fence = _SnapshotFence()
+        self._fenced_rules = set()
+        self._worker = None
+        self._error = None
 
     def on_error(self, trainer, exc, tb):
         super(_Snapshot, self).on_error(trainer, exc, tb)
@@ -225,15 +310,85 @@ class _Snapshot(extension.Extension):
 
     def _make_snapshot(self, trainer):
         target = trainer if self._target is None else self._target
-        serialized_target = npz.serialize(target)
         filename = self.filename
         if callable(filename):
             filename = filename(trainer)
         else:
             filename = filename.format(trainer)
         outdir = trainer.out
-        self.writer(filename, outdir, serialized_target)
+
+        if not self._background:
+            serialized_target = npz.serialize(target)
+            self.writer(filename, outdir, serialized_target)
+            return
+
+        self._wait()
+        deferred = self._prepare_fence(trainer)
+        pending = {}
+        serializer = _DeferredSerializer(deferred, pending)
+        serializer.save(target)
+        serialized_target = serializer.target
+
+        events = {rule: threading.Event() for rule in pending}
+        self._fence.events = events
+        self._worker = threading.Thread(
+            target=self._copy_and_write,
+            args=(filename, outdir, serialized_target, pending, events))
+        self._worker.daemon = True
+        self._worker.start()
+
+    def _prepare_fence(self, trainer):
+        # Returns a dict that maps the ids of the parameters and the states of
+        # the update rules to the update rules, and registers the fence to the
+        # update rules.
+        get_all_optimizers = getattr(
+            trainer.updater, 'get_all_optimizers', None)
+        if get_all_optimizers is None:
+            return {}
+
+        deferred = {}
+        for optimizer in get_all_optimizers().values():
+            for param in optimizer.target.params():
+                rule = param.update_rule
+                if rule is None or param.array is None:
+                    continue
+                if rule not in self._fenced_rules:
+                    rule.add_hook(self._fence)
+                    self._fenced_rules.add(rule)
+                deferred[id(param.array)] = rule
+                if rule.state is not None:
+                    for value in rule.state.values():
+                        deferred[id(value)] = rule
+        return deferred
+
+    def _copy_and_write(self, filename, outdir, target, pending, events):
+        try:
+            for rule, items in pending.items():
+                for key, value in items:
+                    target[key] = _copy_to_host(value)
+                events[rule].set()
+            self.writer(filename, outdir, target)
+        except Exception as e:
+            self._error = e
+        finally:
+            for event in events.values():
+                event.set()
+
+    def _wait(self):
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+            self._fence.events = {}
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
 
     def finalize(self):
-        if hasattr(self.writer, 'finalize'):
-            self.writer.finalize()
+        try:
+            self._wait()
+        finally:
+            for rule in self._fenced_rules:
+                rule.remove_hook(self._fence.name)
+            self._fenced_rules = set()
+            if hasattr(self.writer, 'finalize'):
+                self.writer.finalize()
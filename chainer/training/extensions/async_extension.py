@@ -0,0 +1,172 @@
+import sys
+import threading
+
+import six
+
+from chainer.training import extension as extension_module
+
+
+class _UpdaterState(object):
+
+    # Epoch and iteration counts of the updater at the invocation of an
+    # extension. Other attributes are taken from the updater itself.
+
+    _attributes = ('iteration', 'epoch', 'epoch_detail',
+                   'previous_epoch_detail', 'is_new_epoch')
+
+    def __init__(self, updater):
+        self._updater = updater
+        for name in self._attributes:
+            if hasattr(updater, name):
+                setattr(self, name, getattr(updater, name))
+
+    def __getattr__(self, name):
+        if name == '_updater':
+            raise AttributeError(name)
+        return getattr(self._updater, name)
+
+
+class _TrainerState(object):
+
+    # State of the trainer at the invocation of an extension. Other attributes
+    # are taken from the trainer itself.
+
+    def __init__(self, trainer):
+        self._trainer = trainer
+        self.observation = dict(trainer.observation)
+        self.elapsed_time = trainer.elapsed_time
+        self.out = trainer.out
+        self.updater = _UpdaterState(trainer.updater)
+
+    def __getattr__(self, name):
+        if name == '_trainer':
+            raise AttributeError(name)
+        return getattr(self._trainer, name)
+
+
+class AsyncExtension(extension_module.Extension):
+
+    """Trainer extension that runs another extension on a worker thread.
+
+    This extension invokes the given extension on a dedicated worker thread,
+    so that the training loop does not wait for it, e.g. while
+    :class:`~chainer.training.extensions.PlotReport` renders a figure or
+    :class:`~chainer.training.extensions.LogReport` writes the log file.
+    The invocations are executed in the order they are made.
+
+    The extension is given a copy of the state of the trainer at the time of
+    invocation instead of the trainer itself: a copy of
+    :attr:`~chainer.training.Trainer.observation`,
+    :attr:`~chainer.training.Trainer.elapsed_time`,
+    :attr:`~chainer.training.Trainer.out`, and an updater object whose
+    ``iteration``, ``epoch``, ``epoch_detail``, ``previous_epoch_detail`` and
+    ``is_new_epoch`` attributes are copied. The other attributes refer to the
+    actual trainer and updater, so the extension must not depend on states
+    which change during training, such as the parameters of the models. For
+    example, :class:`~chainer.training.extensions.Evaluator` and snapshot
+    extensions cannot be run asynchronously by this extension.
+
+    The pending invocations are completed before the extension is serialized
+    or finalized, and before its ``on_error`` method is called. An exception
+    raised by the extension on the worker thread is raised again by the next
+    invocation or by :meth:`finalize`.
+
+    The trigger, the priority and the name of this extension default to
+    those of the given extension. The other attributes of the given extension
+    are also accessible through this extension, e.g. ``log`` of
+    :class:`~chainer.training.extensions.LogReport`. Note that they may be
+    modified by the worker thread at any time.
+
+    Args:
+        extension: Extension to run asynchronously.
+        max_pending (int): Maximum number of the pending invocations. If it is
+            reached, the training loop waits until the worker thread finishes
+            one of them.
+
+    """
+
+    def __init__(self, extension, max_pending=64):
+        self.extension = extension
+        self.trigger = getattr(extension, 'trigger', (1, 'iteration'))
+        self.priority = getattr(
+            extension, 'priority', extension_module.PRIORITY_READER)
+        self._max_pending = max_pending
+        self._queue = None
+        self._worker = None
+        self._exc_info = None
+
+    @property
+    def default_name(self):
+        ext = self.extension
+        name = getattr(ext, 'name', None)
+        if name is None:
+            name = getattr(ext, 'default_name', None)
+            if name is None:
+                name = getattr(ext, '__name__', None)
+        return name
+
+    def __getattr__(self, name):
+        if name == 'extension':
+            raise AttributeError(name)
+        return getattr(self.extension, name)
+
+    def initialize(self, trainer):
+        initializer = getattr(self.extension, 'initialize', None)
+        if initializer is not None:
+            initializer(trainer)
+
+    def __call__(self, trainer):
+        self._raise_error()
+        if self._worker is None:
+            self._queue = six.moves.queue.Queue(self._max_pending)
+            self._worker = threading.Thread(target=self._run)
+            self._worker.daemon = True
+            self._worker.start()
+        self._queue.put(_TrainerState(trainer))
+
+    def _run(self):
+        while True:
+            state = self._queue.get()
+            try:
+                if state is not None and self._exc_info is None:
+                    self.extension(state)
+            except Exception:
+                self._exc_info = sys.exc_info()
+            finally:
+                self._queue.task_done()
+            if state is None:
+                break
+
+    def _raise_error(self):
+        if self._exc_info is not None:
+            exc_info, self._exc_info = self._exc_info, None
+            six.reraise(*exc_info)
+
+    def wait(self):
+        """Waits for the pending invocations to finish."""
+        if self._queue is not None:
+            self._queue.join()
+
+    def on_error(self, trainer, exc, tb):
+        self.wait()
+        handler = getattr(self.extension, 'on_error', None)
+        if handler is not None:
+            handler(trainer, exc, tb)
+
+    def serialize(self, serializer):
+        self.wait()
+        if hasattr(self.extension, 'serialize'):
+            self.extension.serialize(serializer)
+
+    def finalize(self):
+        try:
+            if self._worker is not None:
+                self._queue.put(None)
+                self._worker.join()
+                self._worker = None
+                self._queue = None
+        finally:
+            finalize = getattr(self.extension, 'finalize', None)
+            if finalize is not None:
+                finalize()
+        self._raise_error()
@@ -1,6 +1,8 @@
 import copy
+import multiprocessing
 import warnings
 
+import numpy
 import six
 
 from chainer import backend
@@ -12,6 +14,33 @@ from chainer import iterators
 from chainer import link
 from chainer import reporter as reporter_module
 from chainer.training import extension
+from chainer import variable
+
+
+def _reset_iterator(iterator):
+    if hasattr(iterator, 'reset'):
+        iterator.reset()
+        return iterator
+    warnings.warn(
+        'This iterator does not have the reset method. Evaluator '
+        'copies the iterator instead of resetting. This behavior is '
+        'deprecated. Please implement the reset method.',
+        DeprecationWarning)
+    return copy.copy(iterator)
+
+
+def _evaluate_batch(converter, device, eval_func, batch):
+    observation = {}
+    with reporter_module.report_scope(observation):
+        in_arrays = convert._call_converter(converter, batch, device)
+        with function.no_backprop_mode():
+            if isinstance(in_arrays, tuple):
+                eval_func(*in_arrays)
+            elif isinstance(in_arrays, dict):
+                eval_func(**in_arrays)
+            else:
+                eval_func(in_arrays)
+    return observation
 
 
 class Evaluator(extension.Extension):
@@ -196,32 +225,13 @@ class Evaluator(extension.Extension):
         if self.eval_hook:
             self.eval_hook(self)
 
-        if hasattr(iterator, 'reset'):
-            iterator.reset()
-            it = iterator
-        else:
-            warnings.warn(
-                'This iterator does not have the reset method. Evaluator '
-                'copies the iterator instead of resetting. This behavior is '
-                'deprecated. Please implement the reset method.',
-                DeprecationWarning)
-            it = copy.copy(iterator)
+        it = _reset_iterator(iterator)
 
         summary = reporter_module.DictSummary()
 
         for batch in it:
-            observation = {}
-            with reporter_module.report_scope(observation):
-                in_arrays = convert._call_converter(
-                    self.converter, batch, self.device)
-                with function.no_backprop_mode():
-                    if isinstance(in_arrays, tuple):
-                        eval_func(*in_arrays)
-                    elif isinstance(in_arrays, dict):
-                        eval_func(**in_arrays)
-                    else:
-                        eval_func(in_arrays)
-
+            observation = _evaluate_batch(
+                self.converter, self.device, eval_func, batch)
             summary.add(observation)
 
         return summary.compute_mean()
@@ -236,3 +246,131 @@ class Evaluator(extension.Extension):
         """
         for iterator in six.itervalues(self._iterators):
             iterator.finalize()
+
+
+# Evaluation function and converter used by the worker processes of
+# MultiprocessEvaluator, which are set by the initializer of the pool.
+_worker_args = None
+
+
+def _init_worker(converter, eval_func):
+    global _worker_args
+    _worker_args = converter, eval_func
+
+
+def _to_cpu_scalar(value):
+    if isinstance(value, variable.Variable):
+        value = value.array
+    if numpy.isscalar(value):
+        return value
+    return backend.CpuDevice().send(value)
+
+
+def _evaluate_batch_in_worker(batch):
+    converter, eval_func = _worker_args
+    with configuration.using_config('train', False):
+        observation = _evaluate_batch(converter, None, eval_func, batch)
+    # Only the scalars are sent back, since the others are ignored by
+    # DictSummary.
+    result = {}
+    for key, value in six.iteritems(observation):
+        if isinstance(value, tuple):
+            value = tuple(_to_cpu_scalar(v) for v in value)
+            scalar = value[0]
+        else:
+            value = _to_cpu_scalar(value)
+            scalar = value
+        if numpy.isscalar(scalar) or getattr(scalar, 'ndim', -1) == 0:
+            result[key] = value
+    return result
+
+
+class MultiprocessEvaluator(Evaluator):
+
+    """Trainer extension to evaluate models on a validation set in parallel.
+
+    This extension evaluates the models like :class:`Evaluator`, except that
+    the batches of the main iterator are evaluated by a pool of worker
+    processes. The pool is created by forking the current process at each
+    evaluation, so the workers share the current parameters of the models
+    with the trainer process by copy-on-write. The scalars reported by the
+    evaluation function are sent back to this process and accumulated to
+    :class:`~chainer.DictSummary` for each batch, so that the result is the
+    same as that of :class:`Evaluator`.
+
+    The batches are still loaded by the main iterator in this process and sent
+    to the workers. The evaluation is done on CPU, so ``device`` must not be
+    specified. The extension requires the ``fork`` start method of
+    :mod:`multiprocessing`, which is not available on Windows. Since the
+    process is forked while the training is running, the target and the
+    evaluation function must not depend on threads or resources that are not
+    inherited by the child processes.
+
+    Args:
+        iterator: Dataset iterator for the validation dataset. It can also be
+            a dictionary of iterators. If this is just an iterator, the
+            iterator is registered by the name ``'main'``.
+        target: Link object or a dictionary of links to evaluate. If this is
+            just a link object, the link is registered by the name ``'main'``.
+        converter: Converter function to build input arrays.
+            :func:`~chainer.dataset.concat_examples` is used by default.
+        eval_hook: Function to prepare for each evaluation process. It is
+            called at the beginning of the evaluation in this process. The
+            evaluator extension object is passed at each call.
+        eval_func: Evaluation function called at each iteration. The target
+            link to evaluate as a callable is used by default.
+        n_processes (int): Number of worker processes. By default,
+            the number of CPUs is used.
+        chunksize (int): Number of batches sent to a worker at a time.
+
+    """
+
+    def __init__(self, iterator, target, converter=convert.concat_examples,
+                 eval_hook=None, eval_func=None, n_processes=None,
+                 chunksize=1):
+        super(MultiprocessEvaluator, self).__init__(
+            iterator, target, converter=converter, eval_hook=eval_hook,
+            eval_func=eval_func)
+        self.n_processes = n_processes
+        self.chunksize = chunksize
+
+    def evaluate(self):
+        """Evaluates the model and returns a result dictionary.
+
+        This method runs the evaluation loop over the validation dataset using
+        the worker processes. See :meth:`Evaluator.evaluate` for details.
+
+        Returns:
+            dict: Result dictionary. This dictionary is further reported via
+            :func:`~chainer.report` without specifying any observer.
+
+        """
+        iterator = self._iterators['main']
+        eval_func = self.eval_func or self._targets['main']
+
+        if self.eval_hook:
+            self.eval_hook(self)
+
+        it = _reset_iterator(iterator)
+
+        if hasattr(multiprocessing, 'get_context'):
+            context = multiprocessing.get_context('fork')
+        else:
+            context = multiprocessing
+
+        summary = reporter_module.DictSummary()
+        # The arguments of the initializer are inherited by fork without
+        # pickling them.
+        pool = context.Pool(
+            self.n_processes, initializer=_init_worker,
+            initargs=(self.converter, eval_func))
+        try:
+            for observation in pool.imap(
+                    _evaluate_batch_in_worker, it, self.chunksize):
+                summary.add(observation)
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
+
+        return summary.compute_mean()
@@ -16,7 +16,8 @@ from chainer.utils import argument
 class LogReport(extension.Extension):
 
     """__init__(\
-keys=None, trigger=(1, 'epoch'), postprocess=None, filename='log')
+keys=None, trigger=(1, 'epoch'), postprocess=None, filename='log', \
+format='json', fsync=False, packed_summary=False)
 
     Trainer extension to output the accumulated results to a log file.
 
@@ -58,15 +59,47 @@ keys=None, trigger=(1, 'epoch'), postprocess=None, filename='log')
             does not output the log to any file.
             For historical reasons ``log_name`` is also accepted as an alias
             of this argument.
+        format (str): Format of the log file. If it is ``'json'``, the whole
+            list of result dictionaries is written to the log file as a JSON
+            array at every output. If it is ``'jsonl'``, each result
+            dictionary is appended to the log file as a line of JSON (the
+            JSON Lines format), and the serialized state of this extension
+            only holds the size of the log file instead of the whole list.
+            When the training is resumed, the entries after that size are
+            discarded and the list is read from the log file on the first
+            access to :attr:`log`. See also :func:`load_jsonl_log`.
+        fsync (bool): If ``True``, the log file is synchronized to the storage
+            with :func:`os.fsync` every time an entry is appended. It is only
+            used when ``format`` is ``'jsonl'``.
+        packed_summary (bool): If ``True``, the observations are accumulated
+            to :class:`~chainer.PackedDictSummary` instead of
+            :class:`~chainer.DictSummary`. The observed values on each device
+            are then accumulated at once, and the statistics are copied to
+            the host with a single transfer per device at the output, instead
+            of synchronizing with the device for each key.
 
     """
 
     def __init__(self, keys=None, trigger=(1, 'epoch'), postprocess=None,
-                 filename=None, **kwargs):
+                 filename=None, format='json', fsync=False,
+                 packed_summary=False, **kwargs):
+        if format not in ('json', 'jsonl'):
+            raise ValueError('Unknown log format: {}'.format(format))
         self._keys = keys
         self._trigger = trigger_module.get_trigger(trigger)
         self._postprocess = postprocess
+        self._format = format
+        self._fsync = fsync
+        self._packed_summary = packed_summary
         self._log = []
+        # State of the JSON Lines log: the name and the size of the file that
+        # is being appended to, the directory of the file, and whether the
+        # entries in the file have to be read into `_log`.
+        self._jsonl_name = None
+        self._jsonl_size = 0
+        self._jsonl_opened = False
+        self._out = None
+        self._log_unread = False
 
         log_name, = argument.parse_kwargs(
             kwargs, ('log_name', 'log'),
@@ -91,10 +124,13 @@ keys=None, trigger=(1, 'epoch'), postprocess=None, filename='log')
 
         if self._trigger(trainer):
             # output the result
-            stats = self._summary.compute_mean()
-            stats_cpu = {}
-            for name, value in six.iteritems(stats):
-                stats_cpu[name] = float(value)  # copy to CPU
+            if self._packed_summary:
+                stats_cpu = self._summary.compute_mean(to_cpu=True)
+            else:
+                stats = self._summary.compute_mean()
+                stats_cpu = {}
+                for name, value in six.iteritems(stats):
+                    stats_cpu[name] = float(value)  # copy to CPU
 
             updater = trainer.updater
             stats_cpu['epoch'] = updater.epoch
@@ -107,7 +143,11 @@ keys=None, trigger=(1, 'epoch'), postprocess=None, filename='log')
             self._log.append(stats_cpu)
 
             # write to the log file
-            if self._log_name is not None:
+            if self._log_name is None:
+                pass
+            elif self._format == 'jsonl':
+                self._append_jsonl(trainer.out, stats_cpu)
+            else:
                 log_name = self._log_name.format(**stats_cpu)
                 with utils.tempdir(prefix=log_name, dir=trainer.out) as tempd:
                     path = os.path.join(tempd, 'log.json')
@@ -120,9 +160,45 @@ keys=None, trigger=(1, 'epoch'), postprocess=None, filename='log')
             # reset the summary for the next output
             self._init_summary()
 
+    def initialize(self, trainer):
+        self._out = trainer.out
+
+    def _append_jsonl(self, out, stats):
+        log_name = self._log_name.format(**stats)
+        if log_name != self._jsonl_name:
+            self._jsonl_name = log_name
+            self._jsonl_size = 0
+            self._jsonl_opened = False
+        path = os.path.join(out, log_name)
+
+        line = (json.dumps(stats) + '\n').encode('utf-8')
+        with open(path, 'ab') as f:
+            if not self._jsonl_opened:
+                # Discards the entries written after the last snapshot (or
+                # by a previous run).
+                self._read_unread_log(out)
+                f.seek(0, os.SEEK_END)
+                self._jsonl_size = min(self._jsonl_size, f.tell())
+                f.truncate(self._jsonl_size)
+                self._jsonl_opened = True
+            f.write(line)
+            f.flush()
+            if self._fsync:
+                os.fsync(f.fileno())
+        self._jsonl_size += len(line)
+
+    def _read_unread_log(self, out):
+        if not self._log_unread or out is None:
+            return
+        path = os.path.join(out, self._jsonl_name)
+        if os.path.exists(path):
+            self._log[:0] = load_jsonl_log(path, self._jsonl_size)
+        self._log_unread = False
+
     @property
     def log(self):
         """The current list of observation dictionaries."""
+        self._read_unread_log(self._out)
         return self._log
 
     def serialize(self, serializer):
@@ -134,6 +210,10 @@ keys=None, trigger=(1, 'epoch'), postprocess=None, filename='log')
         except KeyError:
             warnings.warn('The statistics are not saved.')
 
+        if self._format == 'jsonl' and self._log_name is not None:
+            self._serialize_jsonl(serializer)
+            return
+
         # Note that this serialization may lose some information of small
         # numerical differences.
         if isinstance(serializer, serializer_module.Serializer):
@@ -143,5 +223,38 @@ keys=None, trigger=(1, 'epoch'), postprocess=None, filename='log')
             log = serializer('_log', '')
             self._log = json.loads(log)
 
+    def _serialize_jsonl(self, serializer):
+        if isinstance(serializer, serializer_module.Serializer):
+            serializer('_log_name', self._jsonl_name or '')
+            serializer('_log_size', self._jsonl_size)
+        else:
+            name = str(serializer('_log_name', ''))
+            self._jsonl_name = name or None
+            self._jsonl_size = int(serializer('_log_size', 0))
+            self._jsonl_opened = False
+            self._log = []
+            self._log_unread = self._jsonl_name is not None
+
     def _init_summary(self):
-        self._summary = reporter.DictSummary()
+        if self._packed_summary:
+            self._summary = reporter.PackedDictSummary()
+        else:
+            self._summary = reporter.DictSummary()
+
+
+def load_jsonl_log(path, size=None):
+    """Loads the log written by :class:`LogReport` in the JSON Lines format.
+
+    Args:
+        path (str): Path to the log file.
+        size (int): Number of bytes to read from the head of the file. If it
+            is ``None``, the whole file is read.
+
+    Returns:
+        list: List of the result dictionaries.
+
+    """
+    with open(path, 'rb') as f:
+        data = f.read() if size is None else f.read(size)
+    return [json.loads(line.decode('utf-8'))
+            for line in data.splitlines() if line.strip()]
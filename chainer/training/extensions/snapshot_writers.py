@@ -1,9 +1,16 @@
+import hashlib
+import json
 import multiprocessing
 import os
 import shutil
-from six.moves import queue
+import tempfile
 import threading
 
+import numpy
+import six
+from six.moves import cPickle as pickle
+from six.moves import queue
+
 from chainer.serializers import npz
 from chainer import utils
 
@@ -292,3 +299,235 @@ class ProcessQueueWriter(QueueWriter):
 
     def create_consumer(self, q):
         return multiprocessing.Process(target=self.consume, args=(q,))
+
+
+def _hash_array(array):
+    array = numpy.asarray(array)
+    h = hashlib.sha1()
+    h.update('{}{}'.format(array.dtype.str, array.shape).encode('utf-8'))
+    if array.dtype == object:
+        h.update(pickle.dumps(array.tolist(), protocol=2))
+    else:
+        h.update(numpy.ascontiguousarray(array).data)
+    return h.hexdigest()
+
+
+class ShardedWriter(Writer):
+    """Snapshot writer that saves arrays into shards incrementally.
+
+    This writer splits a serialized object into shards, each of which holds
+    the arrays of a subtree of the hierarchy (e.g. the parameters of a link or
+    the states of the update rule of a parameter), and saves them as NPZ files
+    in the directory ``shard_dir`` under the output directory. The snapshot
+    file itself is a manifest in JSON which maps each key to the shard file
+    and the content hash of the array.
+
+    Arrays which are not changed since the previous snapshot taken by this
+    writer (e.g. frozen parameters) are not saved again; the manifest refers
+    to the shard file which already holds them. Only the changed bytes are
+    therefore written by frequent snapshots of fine-tuning.
+
+    Shard files are shared among snapshots. The writer keeps the list of the
+    snapshots it has written in ``shard_dir``, and after each snapshot it
+    deletes the shard files which are no longer referred to by any of them
+    that still exists. Removing an old snapshot file, or overwriting it by
+    reusing its filename, therefore frees its shards at the next snapshot;
+    the number of snapshots retained determines the disk usage. Shard files
+    must not be removed by hand while a snapshot referring to them is in use.
+    When training is resumed, the arrays saved by the latest existing
+    snapshot in the list are not saved again.
+
+    Use :func:`load_sharded` to load a snapshot saved by this writer. This
+    writer can also be used as the ``task`` of :class:`QueueWriter` to save
+    snapshots asynchronously.
+
+    Args:
+        shard_dir (str): Name of the directory of shard files, relative to the
+            output directory.
+        shard_depth (int): If given, the keys are grouped into shards by their
+            first ``shard_depth`` components. By default, arrays of the same
+            parent in the hierarchy belong to the same shard.
+        compression (bool): If ``True``, shard files are compressed.
+
+    .. seealso::
+
+        - :meth:`chainer.training.extensions.snapshot`
+    """
+
+    def __init__(self, shard_dir='snapshot_shards', shard_depth=None,
+                 compression=False):
+        self._shard_dir = shard_dir
+        self._shard_depth = shard_depth
+        self._compression = compression
+        # Maps keys to the shard files and hashes in the last snapshot. It is
+        # loaded from the output directory at the first snapshot.
+        self._saved = None
+
+    def _shard_of(self, key):
+        components = key.split('/')[:-1]
+        if self._shard_depth is not None:
+            components = components[:self._shard_depth]
+        return '/'.join(components)
+
+    def __call__(self, filename, outdir, target):
+        shard_dir = os.path.join(outdir, self._shard_dir)
+        if not os.path.isdir(shard_dir):
+            os.makedirs(shard_dir)
+        manifests = _load_json(
+            os.path.join(shard_dir, _MANIFEST_LIST), [])
+        if self._saved is None:
+            self._saved = self._load_latest(outdir, manifests)
+
+        manifest = {}
+        changed = {}
+        for key in sorted(target):
+            digest = _hash_array(target[key])
+            saved = self._saved.get(key)
+            if saved is not None and saved[1] == digest and os.path.exists(
+                    os.path.join(outdir, saved[0])):
+                manifest[key] = saved
+            else:
+                changed.setdefault(self._shard_of(key), {})[key] = digest
+
+        savez = numpy.savez_compressed if self._compression else numpy.savez
+        for shard, digests in six.iteritems(changed):
+            # The name also depends on the content so that a shard still
+            # referred to is not overwritten when the filename is reused.
+            shard_id = hashlib.sha1(shard.encode('utf-8')).hexdigest()[:16]
+            content_id = hashlib.sha1(json.dumps(
+                sorted(six.iteritems(digests))).encode('utf-8')).hexdigest()
+            shard_file = os.path.join(
+                self._shard_dir, '{}.{}.{}.npz'.format(
+                    filename, shard_id, content_id[:16]))
+            self.save(
+                os.path.basename(shard_file), shard_dir,
+                {key: target[key] for key in digests},
+                lambda path, arrays: savez(path, **arrays))
+            for key, digest in six.iteritems(digests):
+                manifest[key] = (shard_file, digest)
+
+        _dump_json(os.path.join(outdir, filename),
+                   {'version': 1, 'arrays': manifest})
+        self._saved = manifest
+
+        manifests = [name for name in manifests if name != filename]
+        manifests.append(filename)
+        self._collect_garbage(outdir, manifests, filename, manifest)
+
+    def _load_latest(self, outdir, manifests):
+        # Returns the arrays of the latest snapshot which still exists.
+        for name in reversed(manifests):
+            arrays = _load_manifest(os.path.join(outdir, name))
+            if arrays is not None:
+                return arrays
+        return {}
+
+    def _collect_garbage(self, outdir, manifests, filename, manifest):
+        # Deletes the shard files not referred to by the existing snapshots,
+        # and updates the list of the snapshots.
+        referred = set(entry[0] for entry in six.itervalues(manifest))
+        alive = []
+        for name in manifests:
+            if name == filename:
+                alive.append(name)
+                continue
+            arrays = _load_manifest(os.path.join(outdir, name))
+            if arrays is not None:
+                alive.append(name)
+                referred.update(entry[0] for entry in six.itervalues(arrays))
+        _dump_json(os.path.join(outdir, self._shard_dir, _MANIFEST_LIST),
+                   alive)
+
+        shard_dir = os.path.join(outdir, self._shard_dir)
+        for name in os.listdir(shard_dir):
+            if (name.endswith('.npz') and
+                    os.path.join(self._shard_dir, name) not in referred):
+                os.remove(os.path.join(shard_dir, name))
+
+
+# File in the shard directory listing the snapshots written by ShardedWriter
+_MANIFEST_LIST = 'manifests.json'
+
+
+def _load_json(path, default):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return default
+
+
+def _dump_json(path, obj):
+    dirname = os.path.dirname(path)
+    fd, tmppath = tempfile.mkstemp(
+        prefix='tmp' + os.path.basename(path), dir=dirname)
+    with os.fdopen(fd, 'w') as f:
+        json.dump(obj, f)
+    shutil.move(tmppath, path)
+
+
+def _load_manifest(path):
+    # Returns the arrays of a snapshot saved by ShardedWriter, or None if it
+    # does not exist or is not such a snapshot.
+    manifest = _load_json(path, None)
+    if not isinstance(manifest, dict) or manifest.get('version') != 1:
+        return None
+    return manifest.get('arrays')
+
+
+class _ShardedArrays(object):
+
+    # Mapping from keys to arrays of a snapshot saved by ShardedWriter, which
+    # can be read by NpzDeserializer.
+
+    def __init__(self, path):
+        with open(path) as f:
+            manifest = json.load(f)
+        if manifest['version'] != 1:
+            raise ValueError(
+                'Unsupported format version: {}'.format(manifest['version']))
+        self._dir = os.path.dirname(path)
+        self._arrays = manifest['arrays']
+        self._shards = {}
+
+    def __contains__(self, key):
+        return key in self._arrays
+
+    def __getitem__(self, key):
+        shard_file = self._arrays[key][0]
+        shard = self._shards.get(shard_file)
+        if shard is None:
+            shard = numpy.load(os.path.join(self._dir, shard_file),
+                               **npz._allow_pickle_kwargs)
+            self._shards[shard_file] = shard
+        return shard[key]
+
+    def close(self):
+        for shard in six.itervalues(self._shards):
+            shard.close()
+        self._shards = {}
+
+
+def load_sharded(path, obj, path_prefix='', strict=True, ignore_names=None):
+    """Loads an object from a snapshot saved by :class:`ShardedWriter`.
+
+    Args:
+        path (str): Path to the snapshot (manifest) file.
+        obj: Object to be deserialized. It must support serialization protocol.
+        path_prefix (str): The path in the hierarchy of the serialized data
+            under which the data is to be loaded.
+        strict (bool): If ``True``, the deserializer raises an error when an
+            expected value is not found in the snapshot.
+        ignore_names (string, callable or list of them): Names of parameters
+            and persistents to be skipped. See
+            :class:`~chainer.serializers.NpzDeserializer`.
+
+    """
+    arrays = _ShardedArrays(path)
+    try:
+        d = npz.NpzDeserializer(
+            arrays, path=path_prefix, strict=strict,
+            ignore_names=ignore_names)
+        d.load(obj)
+    finally:
+        arrays.close()
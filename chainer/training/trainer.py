@@ -1,4 +1,6 @@
 import collections
+import json
+import math
 import os
 import sys
 import time
@@ -31,6 +33,81 @@ class _ExtensionEntry(object):
         self.priority = priority
 
 
+class _TimeHistogram(object):
+
+    # Histogram of durations in seconds. The i-th bin counts the durations in
+    # [2 ** (i - 21), 2 ** (i - 20)) seconds; the first and the last bins
+    # also count the shorter and the longer ones, respectively.
+
+    _min_exponent = -20
+    _n_bins = 32
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.counts = [0] * self._n_bins
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def bin_edges(self):
+        return [2.0 ** (i + self._min_exponent)
+                for i in six.moves.range(self._n_bins - 1)]
+
+    def add(self, duration):
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        if duration > 0:
+            index = int(math.floor(math.log(duration, 2))) + 1
+            index -= self._min_exponent
+        else:
+            index = 0
+        self.counts[min(max(index, 0), self._n_bins - 1)] += 1
+
+
+class _Profiler(object):
+
+    # Records durations of the parts of the training loop to histograms and
+    # optionally to a file of the Chrome trace event format.
+
+    def __init__(self, trace_path=None):
+        self.histograms = collections.OrderedDict()
+        self._trace_path = trace_path
+        self._trace = None
+        self._origin = None
+
+    def open(self, origin):
+        self._origin = origin
+        if self._trace_path is not None:
+            self._trace = open(self._trace_path, 'w')
+            self._trace.write('[\n')
+            self._trace_separator = ''
+
+    def close(self):
+        if self._trace is not None:
+            self._trace.write('\n]\n')
+            self._trace.close()
+            self._trace = None
+
+    def record(self, name, start, duration, trace=True):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = _TimeHistogram()
+        histogram.add(duration)
+
+        if trace and self._trace is not None:
+            event = {
+                'name': name, 'ph': 'X', 'pid': os.getpid(), 'tid': 0,
+                'ts': (start - self._origin) * 1e6, 'dur': duration * 1e6,
+            }
+            self._trace.write(self._trace_separator + json.dumps(event))
+            self._trace_separator = ',\n'
+
+
 class Trainer(object):
 
     """The standard training loop in Chainer.
@@ -118,6 +195,23 @@ class Trainer(object):
 
     The default trainer is `plain`, i.e., it does not contain any extensions.
 
+    If ``profile`` is ``True``, the trainer measures the wall time of each
+    update, of the trigger checks of the extensions, and of each invocation
+    of each extension, and accumulates it to histograms
+    (see :attr:`time_histograms`). The times are also reported to the
+    observation with the following names, so that they can be logged by
+    extensions like :class:`~chainer.training.extensions.LogReport`.
+
+    - ``'time/update'``: Time of :meth:`Updater.update`.
+    - ``'time/iterator'``: Time for the updater to obtain the batch, if the
+      updater provides the ``iterator_wait_time`` attribute (e.g.
+      :class:`~chainer.training.updaters.StandardUpdater`).
+    - ``'time/triggers'``: Total time of the trigger checks in the previous
+      iteration.
+    - ``'time/extensions/<name>'``: Time of the extension in the previous
+      iteration, if it was invoked. Since extensions run after each other,
+      their times are reported in the observation of the next iteration.
+
     Args:
         updater (~chainer.training.Updater): Updater object. It defines how to
             update the models.
@@ -125,6 +219,12 @@ class Trainer(object):
             If it is not callable, it is passed to :class:`IntervalTrigger`.
         out: Output directory.
         extensions: Extensions registered to the trainer.
+        profile (bool): If ``True``, the training loop is profiled as
+            described above.
+        trace_file (str): Name of the file under the output directory to
+            which the measured times are written in the Chrome trace event
+            format, which can be viewed with ``chrome://tracing``. If it is
+            given, the training loop is profiled regardless of ``profile``.
 
     Attributes:
         updater: The updater object for this trainer.
@@ -139,7 +239,7 @@ class Trainer(object):
     """
 
     def __init__(self, updater, stop_trigger=None, out='result',
-                 extensions=None):
+                 extensions=None, profile=False, trace_file=None):
         self.updater = updater
         self.stop_trigger = trigger_module.get_trigger(stop_trigger)
         self.observation = {}
@@ -161,6 +261,10 @@ class Trainer(object):
         self._snapshot_elapsed_time = 0.0
         self._final_elapsed_time = None
 
+        self._profile = profile or trace_file is not None
+        self._trace_file = trace_file
+        self._profiler = None
+
         updater.connect_trainer(self)
         for ext in extensions:
             self.extend(ext)
@@ -180,6 +284,24 @@ class Trainer(object):
             raise RuntimeError('training has not been started yet')
         return _get_time() - self._start_at + self._snapshot_elapsed_time
 
+    @property
+    def time_histograms(self):
+        """Histograms of the times measured by profiling.
+
+        It is a dictionary that maps the names reported to the observation
+        (e.g. ``'time/update'``) to histogram objects. A histogram object has
+        the following attributes: ``count`` (number of measurements),
+        ``total``, ``mean`` and ``max`` (in seconds), and ``counts`` (list of
+        the number of measurements in each bin). The bins are separated by
+        ``bin_edges``, the powers of two from :math:`2^{-20}` to
+        :math:`2^{10}` seconds. It is ``None`` if the training loop is not
+        profiled or has not been started.
+
+        """
+        if self._profiler is None:
+            return None
+        return self._profiler.histograms
+
     def extend(self, extension, name=None, trigger=None, priority=None,
                **kwargs):
         """Registers an extension to the trainer.
@@ -308,15 +430,30 @@ class Trainer(object):
         reporter = self.reporter
         stop_trigger = self.stop_trigger
 
+        profiler = None
+        if self._profile:
+            trace_path = None
+            if self._trace_file is not None:
+                trace_path = os.path.join(self.out, self._trace_file)
+            profiler = _Profiler(trace_path)
+            profiler.open(self._start_at)
+            self._profiler = profiler
+        extension_times = {}
+
         # main training loop
         try:
             while not stop_trigger(self):
                 self.observation = {}
                 with reporter.scope(self.observation):
-                    update()
-                    for name, entry in extensions:
-                        if entry.trigger(self):
-                            entry.extension(self)
+                    if profiler is None:
+                        update()
+                        for name, entry in extensions:
+                            if entry.trigger(self):
+                                entry.extension(self)
+                    else:
+                        reporter.report(extension_times)
+                        extension_times = self._run_profiled_iteration(
+                            profiler, extensions)
         except Exception as e:
             if show_loop_exception_msg:
                 # Show the exception here, as it will appear as if chainer
@@ -353,10 +490,44 @@ class Trainer(object):
                 if finalize:
                     finalize()
             self.updater.finalize()
+            if profiler is not None:
+                profiler.close()
 
         self._final_elapsed_time = self.elapsed_time
         self._done = True
 
+    def _run_profiled_iteration(self, profiler, extensions):
+        # Runs an iteration measuring the times of its parts. The times of the
+        # extensions are returned to be reported in the next iteration.
+        reporter = self.reporter
+        start = _get_time()
+        self.updater.update()
+        update_time = _get_time() - start
+        profiler.record('time/update', start, update_time)
+        observation = {'time/update': update_time}
+
+        iterator_time = getattr(self.updater, 'iterator_wait_time', None)
+        if iterator_time is not None:
+            profiler.record('time/iterator', start, iterator_time)
+            observation['time/iterator'] = iterator_time
+        reporter.report(observation)
+
+        times = {}
+        trigger_time = 0.0
+        for name, entry in extensions:
+            start = _get_time()
+            triggered = entry.trigger(self)
+            end = _get_time()
+            trigger_time += end - start
+            if triggered:
+                entry.extension(self)
+                key = 'time/extensions/' + name
+                times[key] = _get_time() - end
+                profiler.record(key, end, times[key])
+        profiler.record('time/triggers', None, trigger_time, trace=False)
+        times['time/triggers'] = trigger_time
+        return times
+
     def serialize(self, serializer):
         self.updater.serialize(serializer['updater'])
         if hasattr(self.stop_trigger, 'serialize'):
@@ -1,12 +1,22 @@
+from multiprocessing import pool
+import time
+
+import numpy
 import six
 
 from chainer import backend
 from chainer.backends import cuda
 from chainer.dataset import convert
 from chainer.dataset import iterator as iterator_module
+from chainer import reporter
+from chainer import serializer as serializer_module
 from chainer.training import _updater
 
 
+_EPOCH_ATTRIBUTES = (
+    'epoch', 'epoch_detail', 'previous_epoch_detail', 'is_new_epoch')
+
+
 class StandardUpdater(_updater.Updater):
 
     """Standard implementation of Updater.
@@ -48,6 +58,20 @@ class StandardUpdater(_updater.Updater):
             :meth:`~chainer.Optimizer.new_epoch` of the main optimizer is
             automatically called when the ``is_new_epoch`` attribute of the
             main iterator is ``True``.
+        prefetch (bool): If ``True``, the default update routine fetches and
+            converts the next batch of the main iterator on a background
+            thread while the current batch is being trained, so that
+            collation and transfer to ``device`` overlap with computation.
+            It does not depend on the device backend. The time spent waiting
+            for the batch is reported as ``prefetch_stall`` (in seconds).
+            NumPy arrays of the batch which do not own their memory (e.g.
+            views of shared memory of an iterator with ``zero_copy``) are
+            copied on the background thread before the next batch is
+            fetched. The main iterator runs one batch ahead of the updater,
+            so :meth:`serialize` also saves the prefetched batch under
+            ``prefetched/``, which is used first when training is resumed
+            (with or without ``prefetch``). Snapshots of an updater without
+            ``prefetch`` do not have this entry.
 
     Attributes:
         converter: Converter function.
@@ -55,6 +79,9 @@ class StandardUpdater(_updater.Updater):
                    main optimizer is used instead.
         device: Device to which the training data is sent.
         iteration: Current number of completed updates.
+        iterator_wait_time: Time in seconds spent by the last update to
+            obtain the batch from the main iterator and convert it (or to wait
+            for the prefetched one). It is ``None`` before the first update.
         auto_new_epoch: If ``True``, :meth:`~chainer.Optimizer.new_epoch` is
             automatically called by :meth:`update_core`. In this case, the
             :attr:`~chainer.Optimizer.use_auto_new_epoch` attribute of each
@@ -66,7 +93,7 @@ class StandardUpdater(_updater.Updater):
 
     def __init__(self, iterator, optimizer, converter=convert.concat_examples,
                  device=None, loss_func=None, loss_scale=None,
-                 auto_new_epoch=True):
+                 auto_new_epoch=True, prefetch=False):
         if device is not None:
             device = backend.get_device(device)
 
@@ -91,6 +118,7 @@ class StandardUpdater(_updater.Updater):
         self.loss_func = loss_func
         self.device = device
         self.iteration = 0
+        self.iterator_wait_time = None
 
         self.loss_scale = loss_scale
         if loss_scale is not None:
@@ -102,21 +130,33 @@ class StandardUpdater(_updater.Updater):
             for o in six.itervalues(self._optimizers):
                 o.use_auto_new_epoch = True
 
+        self.prefetch = prefetch
+        self._prefetch_pool = None
+        self._prefetched = None
+        # Epoch attributes of the main iterator at the last batch consumed by
+        # the updater, which may differ from the current ones due to prefetch.
+        self._epoch_state = None
+
+    def _get_epoch_attribute(self, name):
+        if self._epoch_state is not None:
+            return self._epoch_state[name]
+        return getattr(self._iterators['main'], name)
+
     @property
     def epoch(self):
-        return self._iterators['main'].epoch
+        return self._get_epoch_attribute('epoch')
 
     @property
     def epoch_detail(self):
-        return self._iterators['main'].epoch_detail
+        return self._get_epoch_attribute('epoch_detail')
 
     @property
     def previous_epoch_detail(self):
-        return self._iterators['main'].previous_epoch_detail
+        return self._get_epoch_attribute('previous_epoch_detail')
 
     @property
     def is_new_epoch(self):
-        return self._iterators['main'].is_new_epoch
+        return self._get_epoch_attribute('is_new_epoch')
 
     def finalize(self):
         """Finalizes the updater object.
@@ -126,6 +166,12 @@ class StandardUpdater(_updater.Updater):
         It is called at the end of training loops.
 
         """
+        self._wait_prefetch()
+        if self._prefetch_pool is not None:
+            self._prefetch_pool.close()
+            self._prefetch_pool.join()
+            self._prefetch_pool = None
+        self._prefetched = None
         for iterator in six.itervalues(self._iterators):
             iterator.finalize()
 
@@ -175,10 +221,61 @@ class StandardUpdater(_updater.Updater):
         self.update_core()
         self.iteration += 1
 
-    def update_core(self):
+    def _fetch(self):
         iterator = self._iterators['main']
         batch = iterator.next()
+        epoch_state = {name: getattr(iterator, name, None)
+                       for name in _EPOCH_ATTRIBUTES}
         in_arrays = convert._call_converter(self.converter, batch, self.device)
+        # The next call of `iterator.next()` may reuse the memory of the
+        # batch while it is being trained.
+        return _map_arrays(_own_array, in_arrays), epoch_state
+
+    def _wait_prefetch(self):
+        if self._prefetched is not None:
+            self._prefetched.wait()
+
+    def _next_arrays(self):
+        # Returns the converted arrays of the next batch of the main iterator.
+        # With prefetch, the next batch is requested to the background thread
+        # before returning the current one.
+        if not self.prefetch:
+            start = time.time()
+            if self._prefetched is not None:
+                # Batch restored from a snapshot of a prefetching updater,
+                # which the iterator has already passed.
+                try:
+                    in_arrays, _ = self._prefetched.get()
+                finally:
+                    self._prefetched = None
+                    self._epoch_state = None
+                self.iterator_wait_time = time.time() - start
+                return in_arrays
+            batch = self._iterators['main'].next()
+            in_arrays = convert._call_converter(
+                self.converter, batch, self.device)
+            self.iterator_wait_time = time.time() - start
+            return in_arrays
+
+        if self._prefetch_pool is None:
+            self._prefetch_pool = pool.ThreadPool(1)
+        if self._prefetched is None:
+            self._prefetched = self._prefetch_pool.apply_async(self._fetch)
+
+        start = time.time()
+        try:
+            in_arrays, self._epoch_state = self._prefetched.get()
+        finally:
+            self._prefetched = None
+        stall = time.time() - start
+        self.iterator_wait_time = stall
+
+        self._prefetched = self._prefetch_pool.apply_async(self._fetch)
+        reporter.report({'prefetch_stall': stall})
+        return in_arrays
+
+    def update_core(self):
+        in_arrays = self._next_arrays()
 
         optimizer = self._optimizers['main']
         loss_func = self.loss_func or optimizer.target
@@ -190,11 +287,24 @@ class StandardUpdater(_updater.Updater):
         else:
             optimizer.update(loss_func, in_arrays)
 
-        if self.auto_new_epoch and iterator.is_new_epoch:
+        if self.auto_new_epoch and self.is_new_epoch:
             optimizer.new_epoch(auto=True)
 
     def serialize(self, serializer):
         """Serializes the current state of the updater object."""
+        # Do not let the background thread touch the iterator while it is
+        # serialized. The iterator is ahead of the updater by the prefetched
+        # batch, which is saved together and restored on loading.
+        self._wait_prefetch()
+        if isinstance(serializer, serializer_module.Deserializer):
+            self._prefetched = self._load_prefetched(serializer['prefetched'])
+            self._epoch_state = None
+            if self._prefetched is not None:
+                self._epoch_state = _load_epoch_state(
+                    serializer['prefetched']['current_epoch_state'])
+        elif self.prefetch or self._prefetched is not None:
+            self._save_prefetched(serializer['prefetched'])
+
         for name, iterator in six.iteritems(self._iterators):
             iterator.serialize(serializer['iterator:' + name])
 
@@ -203,3 +313,115 @@ class StandardUpdater(_updater.Updater):
             optimizer.target.serialize(serializer['model:' + name])
 
         self.iteration = serializer('iteration', self.iteration)
+
+    def _save_prefetched(self, serializer):
+        kind = _NO_BATCH
+        if self._prefetched is not None:
+            try:
+                in_arrays, epoch_state = self._prefetched.get()
+            except Exception:
+                # The error is raised again when the batch is consumed.
+                in_arrays = None
+            else:
+                kind, arrays = _flatten_arrays(in_arrays)
+        serializer('kind', kind)
+        if kind == _NO_BATCH:
+            return
+        if kind == _DICT_BATCH:
+            serializer('keys', numpy.array(sorted(in_arrays)))
+        serializer('n_arrays', len(arrays))
+        for i, array in enumerate(arrays):
+            serializer(str(i), array)
+        _save_epoch_state(serializer['epoch_state'], epoch_state)
+        # Epoch of the batch used by the last update, which the iterator has
+        # already passed.
+        _save_epoch_state(
+            serializer['current_epoch_state'],
+            {name: getattr(self, name) for name in _EPOCH_ATTRIBUTES})
+
+    def _load_prefetched(self, serializer):
+        try:
+            kind = int(serializer('kind', _NO_BATCH))
+        except KeyError:
+            # Snapshot saved without the prefetched batch
+            return None
+        if kind == _NO_BATCH:
+            return None
+        keys = None
+        if kind == _DICT_BATCH:
+            keys = [str(key) for key in serializer('keys', None)]
+        n_arrays = int(serializer('n_arrays', 0))
+        arrays = []
+        for i in six.moves.range(n_arrays):
+            array = numpy.array(serializer(str(i), None))
+            if self.device is not None:
+                array = self.device.send(array)
+            arrays.append(array)
+        epoch_state = _load_epoch_state(serializer['epoch_state'])
+        return _PrefetchedBatch(
+            (_unflatten_arrays(kind, keys, arrays), epoch_state))
+
+
+# Kinds of the converted batches saved by StandardUpdater.serialize
+_NO_BATCH = 0
+_ARRAY_BATCH = 1
+_TUPLE_BATCH = 2
+_DICT_BATCH = 3
+
+
+class _PrefetchedBatch(object):
+
+    # Prefetched batch restored from a snapshot, which has the interface of
+    # AsyncResult used by StandardUpdater.
+
+    def __init__(self, value):
+        self._value = value
+
+    def wait(self):
+        pass
+
+    def get(self):
+        return self._value
+
+
+def _save_epoch_state(serializer, epoch_state):
+    for name in _EPOCH_ATTRIBUTES:
+        serializer(name, epoch_state[name])
+
+
+def _load_epoch_state(serializer):
+    epoch_state = {}
+    for name in _EPOCH_ATTRIBUTES:
+        value = serializer(name, None)
+        epoch_state[name] = None if value is None else value.item()
+    return epoch_state
+
+
+def _map_arrays(func, in_arrays):
+    if isinstance(in_arrays, tuple):
+        return tuple([func(x) for x in in_arrays])
+    if isinstance(in_arrays, dict):
+        return {key: func(x) for key, x in six.iteritems(in_arrays)}
+    return func(in_arrays)
+
+
+def _own_array(x):
+    if isinstance(x, numpy.ndarray) and not x.flags.owndata:
+        return x.copy()
+    return x
+
+
+def _flatten_arrays(in_arrays):
+    if isinstance(in_arrays, tuple):
+        return _TUPLE_BATCH, list(in_arrays)
+    if isinstance(in_arrays, dict):
+        return _DICT_BATCH, [in_arrays[key] for key in sorted(in_arrays)]
+    return _ARRAY_BATCH, [in_arrays]
+
+
+def _unflatten_arrays(kind, keys, arrays):
+    if kind == _TUPLE_BATCH:
+        return tuple(arrays)
+    if kind == _DICT_BATCH:
+        return dict(six.moves.zip(keys, arrays))
+    return arrays[0]
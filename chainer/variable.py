@@ -2,6 +2,8 @@ from __future__ import absolute_import
 import collections
 import copy
 import heapq
+import multiprocessing.pool
+import sys
 import traceback
 import typing as tp  # NOQA
 import warnings
@@ -176,6 +178,8 @@ class VariableNode(object):
 
     _creator_node = None
     _data = None  # type: types.NdArray
+    # True if the data is released by backward with release_retained_arrays
+    _data_released = False
     _rank = 0  # type: int
     # Name of the Function is assigned if this variable is a gradient generated
     # by an old-style Function
@@ -1342,7 +1346,8 @@ class Variable(object):
         self._node.set_creator_node(fnode)
 
     def backward(self, retain_grad=False, enable_double_backprop=False,
-                 loss_scale=None):
+                 loss_scale=None, release_retained_arrays=False,
+                 grad_in_place=False, n_threads=1):
         """Runs error backpropagation (a.k.a.\\  backprop) from this variable.
 
         On backprop,
@@ -1393,7 +1398,45 @@ class Variable(object):
                 computational graph along the backprop. The gradients of
                 parameters are divided by the factor just before the parameters
                 are to be updated.
+            release_retained_arrays (bool): If ``True``, the arrays retained
+                by function nodes for backprop (see
+                :meth:`FunctionNode.retain_inputs()
+                <chainer.FunctionNode.retain_inputs>` and
+                :meth:`FunctionNode.retain_outputs()
+                <chainer.FunctionNode.retain_outputs>`) are released as soon
+                as all the function nodes using them are processed, instead of
+                being kept until the graph is released. The graph cannot be
+                backpropagated again after that, nor can other graphs whose
+                function nodes retain the intermediate variables of this graph
+                as inputs, unless the variables are still alive; they raise
+                :class:`RuntimeError`. The peak total size of the
+                retained arrays and the gradients held by backprop is reported
+                as ``backward/peak_memory`` in bytes to the current reporter.
+            grad_in_place (bool): If ``True``, the gradients of the leaf
+                variables which already have gradient arrays (e.g. parameters
+                after :meth:`~chainer.Link.zerograds`) are accumulated into
+                the arrays in place, instead of being summed up into new
+                arrays. It cannot be used with ``enable_double_backprop``.
+            n_threads (int): Number of threads to run the backward
+                computations of function nodes. If it is greater than ``1``,
+                the function nodes whose output gradients are final are
+                processed concurrently by a thread pool, which speeds up the
+                backprop of graphs with independent branches when the backward
+                computations release the GIL (e.g. NumPy and BLAS routines).
+                The gradients are accumulated in an order that does not
+                depend on the thread scheduling. If any function hook is
+                registered globally or to a function node in the graph, the
+                function nodes are processed sequentially by the calling
+                thread as with ``n_threads=1``, since hooks such as
+                :class:`~chainer.function_hooks.TimerHook` assume that the
+                preprocess and postprocess of a function node are called in
+                pairs without the others in between.
         """
+        if grad_in_place and enable_double_backprop:
+            raise ValueError(
+                'grad_in_place cannot be used with enable_double_backprop.')
+        if n_threads < 1:
+            raise ValueError('n_threads must be a positive integer.')
         if self._has_chainerx_array:
             if retain_grad:
                 raise RuntimeError(
@@ -1401,6 +1444,16 @@ class Variable(object):
             if loss_scale is not None:
                 raise RuntimeError(
                     'loss_scale is not supported for ChainerX array.')
+            if release_retained_arrays:
+                raise RuntimeError(
+                    'release_retained_arrays is not supported for ChainerX '
+                    'array.')
+            if grad_in_place:
+                raise RuntimeError(
+                    'grad_in_place is not supported for ChainerX array.')
+            if n_threads != 1:
+                raise RuntimeError(
+                    'n_threads is not supported for ChainerX array.')
             arr = self._data[0]
             assert isinstance(arr, chainerx.ndarray)
             chainerx.backward(
@@ -1431,7 +1484,14 @@ class Variable(object):
             # TODO(kataoka): The following line should not pass grad_var = None
             # to _backprop_to_all, but it is working because grad_var is
             # immediately popped away as None = _backprop_utils._reduce([None])
-            _backprop_to_all([(node, grad_var)], retain_grad, loss_scale)
+            if n_threads > 1:
+                _backprop_to_all_concurrent(
+                    [(node, grad_var)], retain_grad, loss_scale,
+                    release_retained_arrays, grad_in_place, n_threads)
+            else:
+                _backprop_to_all(
+                    [(node, grad_var)], retain_grad, loss_scale,
+                    release_retained_arrays, grad_in_place)
 
     def item(self):
         """Converts the variable with one element to a Python scalar.
@@ -1568,7 +1628,8 @@ class Variable(object):
     __hash__ = None  # type: tp.Callable[[object], int]
 
 
-def _backprop_to_all(outputs, retain_grad, loss_scale):
+def _backprop_to_all(outputs, retain_grad, loss_scale,
+                     release_retained_arrays=False, grad_in_place=False):
     """Backprop to all input variables
 
     Args:
@@ -1576,6 +1637,8 @@ def _backprop_to_all(outputs, retain_grad, loss_scale):
             y_grad_var should not be None.
         retain_grad (bool): see docstring of Variable.backward
         loss_scale (float): see docstring of Variable.backward
+        release_retained_arrays (bool): see docstring of Variable.backward
+        grad_in_place (bool): see docstring of Variable.backward
 
     """
     OrderedDict = chainer.utils._collections.OrderedDict  # fix py2 memory leak
@@ -1590,6 +1653,13 @@ def _backprop_to_all(outputs, retain_grad, loss_scale):
             seen_set.add(cand)
 
     grads = _backprop_utils.GradTable(accumulate_grad_inputs=True)
+    if release_retained_arrays:
+        retained = _backprop_utils.RetainedArrayTable(
+            [y for y, _ in outputs])
+    else:
+        retained = None
+    # Gradient variables of leaf nodes to accumulate gradients into
+    grad_buffers = {}
 
     leaf_nodes = set()
 
@@ -1610,6 +1680,7 @@ def _backprop_to_all(outputs, retain_grad, loss_scale):
     base_hooks = chainer.get_function_hooks().values()
     while cand_funcs:
         _, _, func = heapq.heappop(cand_funcs)
+        _backprop_utils.check_retained_arrays(func)
         inputs = func.inputs
         target_input_indexes = tuple([
             i for i, x in enumerate(inputs) if x.requires_grad
@@ -1620,6 +1691,8 @@ def _backprop_to_all(outputs, retain_grad, loss_scale):
                           else None
                           for y in outputs])
         if not target_input_indexes:
+            if retained is not None:
+                retained.release(func)
             continue
 
         in_data = [x.data for x in inputs]
@@ -1645,11 +1718,16 @@ def _backprop_to_all(outputs, retain_grad, loss_scale):
             in_grad = OrderedDict()
             for x in target_inputs:
                 if x not in in_grad:
+                    if grad_in_place and x not in grads.grads:
+                        _add_grad_buffer(x, grads, grad_buffers)
                     in_grad[x] = grads.get_as_list(x)
 
             _backprop_utils.backprop_step(
                 func, target_input_indexes, out_grad, in_grad, is_debug)
 
+            if retained is not None:
+                retained.record(grads)
+
             for hook in hooks:
                 hook.backward_postprocess(
                     func, tuple(in_data), tuple(out_grad_array))
@@ -1672,20 +1750,225 @@ def _backprop_to_all(outputs, retain_grad, loss_scale):
                     _check_grad_type(func, x, True, gx_elem.array)
             del gx_elem  # to reduce memory usage
 
+            if x in grad_buffers:
+                _accumulate_into_buffer(grad_buffers[x], gx)
+
             if x.creator_node is None:  # leaf
                 leaf_nodes.add(x)
             else:
                 add_cand(x.creator_node)
         del gx, in_grad  # to reduce memory usage
 
+        if retained is not None:
+            retained.release(func)
+
     for x in leaf_nodes:
         x_var = x.get_variable_or_none()
         gx = grads.pop(x)
         if x_var is not None:
-            x_var._set_grad_var_without_check(gx)
+            if x not in grad_buffers:
+                x_var._set_grad_var_without_check(gx)
             x_var._loss_scale = loss_scale
     grads.assert_no_grads()
 
+    if retained is not None:
+        chainer.report({'backward/peak_memory': retained.peak})
+
+
+def _add_grad_buffer(x, grads, grad_buffers):
+    # Registers the gradient of a leaf node as the buffer to accumulate its
+    # gradients into, instead of loading it into the gradient table.
+    if x.creator_node is not None:
+        return
+    x_var = x.get_variable_or_none()
+    if x_var is None:
+        return
+    gx = x_var.grad_var
+    if gx is None or gx.array is None:
+        return
+    grad_buffers[x] = gx
+    grads[x] = None
+
+
+def _accumulate_into_buffer(buf, gx):
+    with chainer.using_device(buf.device):
+        array = buf.array
+        for gx_elem in gx:
+            array += gx_elem.array
+    del gx[:]
+
+
+def _backprop_to_all_concurrent(outputs, retain_grad, loss_scale,
+                                release_retained_arrays, grad_in_place,
+                                n_threads):
+    """Backprop to all input variables with a thread pool
+
+    The function nodes are scheduled by counting the dependencies between
+    them instead of by their ranks. Only the calling thread touches the
+    gradient table; the workers receive the final output gradients and return
+    the input gradients computed by each function node. It falls back to
+    _backprop_to_all if any function hook is registered.
+
+    Args:
+        outputs (list of tuple): each tuple is (y_node, y_grad_var).
+            y_grad_var should not be None.
+        retain_grad (bool): see docstring of Variable.backward
+        loss_scale (float): see docstring of Variable.backward
+        release_retained_arrays (bool): see docstring of Variable.backward
+        grad_in_place (bool): see docstring of Variable.backward
+        n_threads (int): see docstring of Variable.backward
+
+    """
+    OrderedDict = chainer.utils._collections.OrderedDict  # fix py2 memory leak
+
+    deps = None
+    if not chainer.get_function_hooks():
+        deps = _backprop_utils.DependencyTable([y for y, _ in outputs])
+    if deps is None or any(func._n_local_function_hooks != 0
+                           for func in deps.keys):
+        _backprop_to_all(outputs, retain_grad, loss_scale,
+                         release_retained_arrays, grad_in_place)
+        return
+
+    grads = _backprop_utils.GradTable(accumulate_grad_inputs=True)
+    if release_retained_arrays:
+        retained = _backprop_utils.RetainedArrayTable(
+            [y for y, _ in outputs])
+    else:
+        retained = None
+    grad_buffers = {}
+    leaf_nodes = set()
+
+    for y, gy in outputs:
+        grads.accumulate(y, gy)
+        if y.creator_node is None:  # leaf
+            leaf_nodes.add(y)
+
+    # Fix F812 (Python 2)
+    y = None
+    del y
+
+    is_debug = chainer.is_debug()
+    # The workers see the configuration of the calling thread.
+    local_config = dict(chainer.config._local.__dict__)
+
+    ready = []
+    # Maps running function nodes to their devices.
+    running = {}
+    results = six.moves.queue.Queue()
+
+    def add_ready(funcs):
+        for func in funcs:
+            heapq.heappush(ready, (deps.keys[func], func))
+
+    def dispatch(func):
+        # Submits the backward computation of a ready function node. Returns
+        # False if there is nothing to compute.
+        _backprop_utils.check_retained_arrays(func)
+        inputs = func.inputs
+        target_input_indexes = tuple([
+            i for i, x in enumerate(inputs) if x.requires_grad
+        ])
+        outputs = [y() for y in func.outputs]  # access via weak ref
+        out_grad = tuple([grads.pop(y)
+                          if y is not None and y.creator_node is not None
+                          else None
+                          for y in outputs])
+        if retain_grad:
+            for y, gy in six.moves.zip(outputs, out_grad):
+                if y is not None:
+                    y._set_grad_var_if_available(gy)
+        if not target_input_indexes or all(gy is None for gy in out_grad):
+            return False
+
+        in_data = [x.data for x in inputs]
+        out_grad_array = [None if g is None else g.array for g in out_grad]
+        device = backend.get_device_from_array(*(in_data + out_grad_array))
+
+        # Each function node receives empty lists of input gradients; the
+        # gradients from different function nodes are summed up after the
+        # nodes are complete.
+        in_grad = OrderedDict()
+        for i in target_input_indexes:
+            in_grad[inputs[i]] = []
+        running[func] = device
+        pool.apply_async(
+            _backward_task,
+            (func, target_input_indexes, out_grad, in_grad, is_debug, device,
+             local_config),
+            callback=results.put)
+        return True
+
+    def complete(func, in_grad):
+        for x, gx in six.iteritems(in_grad):
+            for gx_elem in gx:
+                _check_grad_type(func, x, True, gx_elem.array)
+
+        completed, ready_funcs = deps.done(func, in_grad)
+        for x, gx in completed:
+            if not gx:
+                continue
+            if x.creator_node is None:  # leaf
+                leaf_nodes.add(x)
+                if grad_in_place and x not in grads.grads:
+                    _add_grad_buffer(x, grads, grad_buffers)
+                if x in grad_buffers:
+                    _accumulate_into_buffer(grad_buffers[x], gx)
+                    continue
+            grads.get_as_list(x).extend(gx)
+        add_ready(ready_funcs)
+
+        if retained is not None:
+            retained.record(grads)
+            retained.release(func)
+
+    add_ready(deps.initial_funcs())
+    pool = multiprocessing.pool.ThreadPool(n_threads)
+    try:
+        while ready or running:
+            while ready:
+                _, func = heapq.heappop(ready)
+                if not dispatch(func):
+                    complete(func, {})
+            if not running:
+                break
+
+            func, in_grad, exc_info = results.get()
+            del running[func]
+            if exc_info is not None:
+                six.reraise(*exc_info)
+            complete(func, in_grad)
+            del in_grad  # to reduce memory usage
+    finally:
+        pool.terminate()
+        pool.join()
+
+    for x in leaf_nodes:
+        x_var = x.get_variable_or_none()
+        gx = grads.pop(x)
+        if x_var is not None:
+            if x not in grad_buffers:
+                x_var._set_grad_var_without_check(gx)
+            x_var._loss_scale = loss_scale
+    grads.assert_no_grads()
+
+    if retained is not None:
+        chainer.report({'backward/peak_memory': retained.peak})
+
+
+def _backward_task(func, target_input_indexes, out_grad, in_grad, is_debug,
+                   device, local_config):
+    # Runs on a worker thread of _backprop_to_all_concurrent. Exceptions are
+    # returned to be reraised by the calling thread.
+    try:
+        chainer.config._local.__dict__.update(local_config)
+        with chainer.using_device(device):
+            _backprop_utils.backprop_step(
+                func, target_input_indexes, out_grad, in_grad, is_debug)
+    except Exception:
+        return func, in_grad, sys.exc_info()
+    return func, in_grad, None
+
 
 class Parameter(Variable):
 
@@ -6,7 +6,9 @@ from chainer import testing
 
 class DummyDataset(chainer.dataset.TabularDataset):
 
-    def __init__(self, mode, return_array=False, callback=None):
+    def __init__(self, mode, return_array=False, callback=None,
+                 keys=('a', 'b', 'c')):
+        self._keys = keys
         self._mode = mode
         self._return_array = return_array
         self._callback = callback
@@ -18,7 +20,7 @@ class DummyDataset(chainer.dataset.TabularDataset):
 
     @property
     def keys(self):
-        return ('a', 'b', 'c')
+        return self._keys
 
     @property
     def mode(self):
@@ -0,0 +1,77 @@
+import unittest
+
+import numpy as np
+
+import chainer
+from chainer import testing
+from chainer_tests.dataset_tests.tabular_tests import dummy_dataset
+
+
+@testing.parameterize(*testing.product({
+    'mode': [tuple, dict],
+    'return_array': [True, False],
+    'indices': [None, [1, 12, 3, 19, 0], slice(2, 18, 3), slice(None, 4, -2),
+                [], [-1, -15, 3]],
+    'key_indices': [None, (1,), (2, 0)],
+}))
+class TestConcat(unittest.TestCase):
+
+    def test_concat(self):
+        dataset0 = dummy_dataset.DummyDataset(
+            mode=self.mode, return_array=self.return_array)
+        dataset1 = dummy_dataset.DummyDataset(
+            mode=self.mode, return_array=self.return_array)
+        view = dataset0.concat(dataset1)
+        self.assertIsInstance(view, chainer.dataset.TabularDataset)
+        self.assertEqual(len(view), 20)
+        self.assertEqual(view.keys, ('a', 'b', 'c'))
+        self.assertEqual(view.mode, self.mode)
+
+        data = np.hstack((dataset0.data, dataset1.data))
+        if self.indices is not None:
+            data = data[:, self.indices]
+        if self.key_indices is not None:
+            data = data[list(self.key_indices)]
+
+        output = view.get_examples(self.indices, self.key_indices)
+        self.assertEqual(len(output), len(data))
+        for out, d in zip(output, data):
+            np.testing.assert_equal(out, d)
+            if self.return_array:
+                self.assertIsInstance(out, np.ndarray)
+            else:
+                self.assertIsInstance(out, list)
+
+
+class TestConcatNegativeIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.dataset0 = dummy_dataset.DummyDataset(mode=tuple).slice[:3]
+        self.dataset1 = dummy_dataset.DummyDataset(mode=tuple).slice[3:5]
+        self.view = self.dataset0.concat(self.dataset1)
+
+    def test_last(self):
+        np.testing.assert_equal(self.view[-1], self.view[4])
+        np.testing.assert_equal(self.view[-1], self.dataset1[1])
+
+    def test_cross_datasets(self):
+        np.testing.assert_equal(self.view[-3], self.dataset0[2])
+        np.testing.assert_equal(self.view[-2], self.dataset1[0])
+
+    def test_out_of_bounds(self):
+        with self.assertRaises(IndexError):
+            self.view.get_examples([-6], None)
+        with self.assertRaises(IndexError):
+            self.view.get_examples([5], None)
+
+
+class TestConcatInvalid(unittest.TestCase):
+
+    def test_concat_key_mismatch(self):
+        dataset0 = dummy_dataset.DummyDataset(mode=tuple)
+        dataset1 = dummy_dataset.DummyDataset(mode=tuple).slice[:, ('a',)]
+        with self.assertRaises(ValueError):
+            dataset0.concat(dataset1)
+
+
+testing.run_module(__name__, __file__)
@@ -0,0 +1,62 @@
+import unittest
+
+import numpy as np
+
+import chainer
+from chainer import testing
+from chainer_tests.dataset_tests.tabular_tests import dummy_dataset
+
+
+@testing.parameterize(*testing.product({
+    'mode': [tuple, dict],
+    'return_array': [True, False],
+    'indices': [None, [3, 1], slice(2, 8, 3)],
+    'key_indices': [None, (4,), (3, 0), (1, 1, 5)],
+}))
+class TestJoin(unittest.TestCase):
+
+    def test_join(self):
+        def callback(indices, key_indices):
+            self.assertIsNotNone(key_indices)
+            self.assertGreater(len(key_indices), 0)
+
+        dataset0 = dummy_dataset.DummyDataset(
+            mode=self.mode, return_array=self.return_array, callback=callback)
+        dataset1 = dummy_dataset.DummyDataset(
+            mode=self.mode, return_array=self.return_array,
+            callback=callback, keys=('d', 'e', 'f'))
+        view = dataset0.join(dataset1)
+        self.assertIsInstance(view, chainer.dataset.TabularDataset)
+        self.assertEqual(len(view), 10)
+        self.assertEqual(view.keys, ('a', 'b', 'c', 'd', 'e', 'f'))
+        self.assertEqual(view.mode, self.mode)
+
+        data = np.vstack((dataset0.data, dataset1.data))
+        if self.indices is not None:
+            data = data[:, self.indices]
+        if self.key_indices is not None:
+            data = data[list(self.key_indices)]
+
+        output = view.get_examples(self.indices, self.key_indices)
+        self.assertEqual(len(output), len(data))
+        for out, d in zip(output, data):
+            np.testing.assert_equal(out, d)
+
+
+class TestJoinInvalid(unittest.TestCase):
+
+    def test_join_length_mismatch(self):
+        dataset0 = dummy_dataset.DummyDataset(mode=tuple)
+        dataset1 = dummy_dataset.DummyDataset(
+            mode=tuple, keys=('d', 'e', 'f')).slice[:5]
+        with self.assertRaises(ValueError):
+            dataset0.join(dataset1)
+
+    def test_join_conflict_key(self):
+        dataset0 = dummy_dataset.DummyDataset(mode=tuple)
+        dataset1 = dummy_dataset.DummyDataset(mode=tuple)
+        with self.assertRaises(ValueError):
+            dataset0.join(dataset1)
+
+
+testing.run_module(__name__, __file__)
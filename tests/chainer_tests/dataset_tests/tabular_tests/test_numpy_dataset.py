@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import chainer
+from chainer import testing
+from chainer.dataset import tabular
+
+
+class TestFromNumpy(unittest.TestCase):
+
+    def setUp(self):
+        self.a = np.random.uniform(size=(10, 3)).astype(np.float32)
+        self.b = np.arange(10, dtype=np.int32)
+
+    def test_from_numpy_tuple(self):
+        dataset = tabular.from_numpy((self.a, self.b), keys=('a', 'b'))
+        self.assertIsInstance(dataset, chainer.dataset.TabularDataset)
+        self.assertEqual(len(dataset), 10)
+        self.assertEqual(dataset.keys, ('a', 'b'))
+        self.assertEqual(dataset.mode, tuple)
+
+        a, b = dataset.get_examples([3, 1], None)
+        np.testing.assert_equal(a, self.a[[3, 1]])
+        np.testing.assert_equal(b, self.b[[3, 1]])
+        b, = dataset.get_examples(slice(2, 8, 3), (1,))
+        np.testing.assert_equal(b, self.b[2:8:3])
+
+    def test_from_numpy_tuple_default_keys(self):
+        dataset = tabular.from_numpy((self.a, self.b))
+        self.assertEqual(dataset.keys, ('0', '1'))
+
+    def test_from_numpy_dict(self):
+        dataset = tabular.from_numpy({'b': self.b, 'a': self.a})
+        self.assertEqual(dataset.keys, ('a', 'b'))
+        self.assertEqual(dataset.mode, dict)
+        example = dataset[4]
+        np.testing.assert_equal(example['a'], self.a[4])
+        self.assertEqual(example['b'], self.b[4])
+
+    def test_from_numpy_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            tabular.from_numpy((self.a, self.b[:5]))
+
+    def test_from_memmap(self):
+        tempdir = tempfile.mkdtemp()
+        try:
+            path_a = os.path.join(tempdir, 'a.npy')
+            path_b = os.path.join(tempdir, 'b.npy')
+            np.save(path_a, self.a)
+            np.save(path_b, self.b)
+            dataset = tabular.from_memmap({'a': path_a, 'b': path_b})
+            self.assertEqual(dataset.keys, ('a', 'b'))
+            a, b = dataset.fetch()['a'], dataset.fetch()['b']
+            self.assertIsInstance(a, np.memmap)
+            np.testing.assert_equal(a, self.a)
+            np.testing.assert_equal(b, self.b)
+            del a, b, dataset
+        finally:
+            for name in os.listdir(tempdir):
+                os.remove(os.path.join(tempdir, name))
+            os.rmdir(tempdir)
+
+
+testing.run_module(__name__, __file__)
@@ -0,0 +1,68 @@
+import unittest
+
+import numpy as np
+
+import chainer
+from chainer import testing
+from chainer_tests.dataset_tests.tabular_tests import dummy_dataset
+
+
+@testing.parameterize(*testing.product({
+    'mode': [tuple, dict],
+    'out_mode': [tuple, dict],
+    'indices': [None, [3, 1], slice(2, 8, 3)],
+    'key_indices': [None, (1,), (1, 0)],
+}))
+class TestTransformBatch(unittest.TestCase):
+
+    def test_transform_batch(self):
+        def transform_batch(*args, **kwargs):
+            if self.mode is tuple:
+                self.assertEqual(len(args), 3)
+                self.assertEqual(len(kwargs), 0)
+                a, b, c = args
+            elif self.mode is dict:
+                self.assertEqual(len(args), 0)
+                self.assertEqual(set(kwargs.keys()), {'a', 'b', 'c'})
+                a, b, c = kwargs['a'], kwargs['b'], kwargs['c']
+            self.n_calls += 1
+            if self.out_mode is tuple:
+                return a + b, c * 2
+            elif self.out_mode is dict:
+                return {'d': c * 2, 'sum': a + b}
+
+        self.n_calls = 0
+        dataset = dummy_dataset.DummyDataset(mode=self.mode, return_array=True)
+        view = dataset.transform_batch(('sum', 'd'), transform_batch)
+        self.assertIsInstance(view, chainer.dataset.TabularDataset)
+        self.assertEqual(len(view), len(dataset))
+        self.assertEqual(view.keys, ('sum', 'd'))
+        self.assertEqual(view.mode, self.mode)
+
+        data = np.vstack(
+            (dataset.data[0] + dataset.data[1], dataset.data[2] * 2))
+        if self.indices is not None:
+            data = data[:, self.indices]
+        if self.key_indices is not None:
+            data = data[list(self.key_indices)]
+
+        output = view.get_examples(self.indices, self.key_indices)
+        self.assertEqual(self.n_calls, 1)
+        self.assertEqual(len(output), len(data))
+        for out, d in zip(output, data):
+            np.testing.assert_equal(out, d)
+
+    def test_transform_batch_unary(self):
+        dataset = dummy_dataset.DummyDataset(mode=tuple, return_array=True)
+        view = dataset.transform_batch('a', lambda a, b, c: a * 3)
+        self.assertEqual(view.keys, ('a',))
+        np.testing.assert_equal(view.fetch(), (dataset.data[0] * 3,))
+
+    def test_transform_batch_length_mismatch(self):
+        dataset = dummy_dataset.DummyDataset(mode=tuple, return_array=True)
+        view = dataset.transform_batch(('a', 'b'), lambda a, b, c: (a,))
+        with self.assertRaises(ValueError):
+            view.fetch()
+
+
+testing.run_module(__name__, __file__)
@@ -0,0 +1,61 @@
+import unittest
+
+import numpy as np
+
+import chainer
+from chainer import testing
+from chainer_tests.dataset_tests.tabular_tests import dummy_dataset
+
+
+@testing.parameterize(*testing.product({
+    'mode': [tuple, dict],
+    'return_array': [True, False],
+}))
+class TestWithConverter(unittest.TestCase):
+
+    def test_convert(self):
+        dataset = dummy_dataset.DummyDataset(
+            mode=self.mode, return_array=self.return_array)
+        output = dataset.convert(dataset.fetch())
+
+        if self.mode is tuple:
+            self.assertIsInstance(output, tuple)
+        elif self.mode is dict:
+            self.assertIsInstance(output, dict)
+            output = tuple(output[key] for key in dataset.keys)
+        for out, d in zip(output, dataset.data):
+            self.assertIsInstance(out, np.ndarray)
+            np.testing.assert_equal(out, d)
+
+    def test_with_converter(self):
+        def converter(*args, **kwargs):
+            if self.mode is tuple:
+                np.testing.assert_equal(args, tuple(dataset.data))
+                self.assertEqual(kwargs, {})
+            elif self.mode is dict:
+                self.assertEqual(args, ())
+                np.testing.assert_equal(
+                    kwargs, dict(zip(('a', 'b', 'c'), dataset.data)))
+            return 'converted'
+
+        dataset = dummy_dataset.DummyDataset(
+            mode=self.mode, return_array=self.return_array)
+        view = dataset.with_converter(converter)
+        self.assertIsInstance(view, chainer.dataset.TabularDataset)
+        self.assertEqual(len(view), len(dataset))
+        self.assertEqual(view.keys, dataset.keys)
+        self.assertEqual(view.mode, dataset.mode)
+        self.assertEqual(view.convert(view.fetch()), 'converted')
+
+    def test_concat_examples(self):
+        dataset = dummy_dataset.DummyDataset(
+            mode=self.mode, return_array=self.return_array)
+        view = dataset.with_converter(
+            lambda a, b, c: (np.asarray(a) + np.asarray(b), c))
+        it = chainer.iterators.SerialIterator(view, 4, shuffle=False)
+        x, c = chainer.dataset.concat_examples(it.next())
+        np.testing.assert_equal(x, dataset.data[0][:4] + dataset.data[1][:4])
+        np.testing.assert_equal(c, dataset.data[2][:4])
+
+
+testing.run_module(__name__, __file__)
@@ -0,0 +1,138 @@
+import os
+import pickle
+import sys
+import unittest
+
+import numpy
+
+from chainer import dataset
+from chainer import datasets
+from chainer import iterators
+from chainer import testing
+from chainer import utils
+
+
+@testing.parameterize(*testing.product({
+    'mode': [tuple, dict],
+}))
+class TestColumnarDataset(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = utils.tempdir()
+        self.path = os.path.join(self.tempdir.__enter__(), 'dataset')
+        self.examples = [
+            (numpy.random.uniform(size=(2, 3)).astype(numpy.float32),
+             numpy.arange(i % 4, dtype=numpy.int32),
+             i)
+            for i in range(10)]
+        with datasets.open_columnar_dataset_writer(
+                self.path, keys=('x', 'seq', 't')) as writer:
+            for example in self.examples:
+                if self.mode is dict:
+                    example = dict(zip(('x', 'seq', 't'), example))
+                writer.write(example)
+
+    def tearDown(self):
+        self.tempdir.__exit__(*sys.exc_info())
+
+    def check_example(self, actual, expected):
+        if self.mode is dict:
+            actual = tuple(actual[key] for key in ('x', 'seq', 't'))
+        self.assertEqual(len(actual), len(expected))
+        for a, e in zip(actual, expected):
+            numpy.testing.assert_array_equal(a, e)
+
+    def test_read(self):
+        ds = datasets.open_columnar_dataset(self.path)
+        self.assertIsInstance(ds, dataset.TabularDataset)
+        self.assertEqual(len(ds), 10)
+        self.assertEqual(ds.keys, ('x', 'seq', 't'))
+        self.assertEqual(ds.mode, self.mode)
+        for i in range(10):
+            self.check_example(ds[i], self.examples[i])
+
+    def test_negative_index(self):
+        ds = datasets.open_columnar_dataset(self.path)
+        self.check_example(ds[-1], self.examples[-1])
+        self.check_example(ds[-10], self.examples[0])
+        seq, = ds.get_examples([-1, -3], (1,))
+        numpy.testing.assert_array_equal(seq[0], self.examples[-1][1])
+        numpy.testing.assert_array_equal(seq[1], self.examples[-3][1])
+
+    def test_index_out_of_range(self):
+        ds = datasets.open_columnar_dataset(self.path)
+        for index in (len(ds), -len(ds) - 1):
+            with self.assertRaises(IndexError):
+                ds.get_examples([index], (1,))
+            with self.assertRaises(IndexError):
+                ds[index]
+
+    def test_get_examples(self):
+        ds = datasets.open_columnar_dataset(self.path)
+        x, seq = ds.get_examples([3, 1, 7], (0, 1))
+        self.assertIsInstance(x, numpy.ndarray)
+        numpy.testing.assert_array_equal(
+            x, numpy.stack([self.examples[i][0] for i in [3, 1, 7]]))
+        self.assertIsInstance(seq, list)
+        for s, i in zip(seq, [3, 1, 7]):
+            numpy.testing.assert_array_equal(s, self.examples[i][1])
+
+        t, = ds.get_examples(slice(8, 2, -2), (2,))
+        numpy.testing.assert_array_equal(t, [8, 6, 4])
+        seq, = ds.get_examples(slice(None, 3), (1,))
+        self.assertEqual([len(s) for s in seq], [0, 1, 2])
+
+    def test_pickle(self):
+        ds = datasets.open_columnar_dataset(self.path)
+        ds = pickle.loads(pickle.dumps(ds))
+        self.check_example(ds[5], self.examples[5])
+
+    def test_iterator(self):
+        ds = datasets.open_columnar_dataset(self.path)
+        it = iterators.SerialIterator(ds, 4, shuffle=False)
+        batch = dataset.concat_examples(it.next(), padding=-1)
+        if self.mode is dict:
+            batch = tuple(batch[key] for key in ('x', 'seq', 't'))
+        x, seq, t = batch
+        self.assertEqual(x.shape, (4, 2, 3))
+        numpy.testing.assert_array_equal(
+            seq, [[-1, -1, -1], [0, -1, -1], [0, 1, -1], [0, 1, 2]])
+        numpy.testing.assert_array_equal(t, [0, 1, 2, 3])
+
+
+class TestColumnarDatasetWriterInvalid(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = utils.tempdir()
+        self.path = self.tempdir.__enter__()
+
+    def tearDown(self):
+        self.tempdir.__exit__(*sys.exc_info())
+
+    def test_dtype_mismatch(self):
+        writer = datasets.ColumnarDatasetWriter(self.path)
+        writer.write((numpy.zeros(3, numpy.float32),))
+        with self.assertRaises(ValueError):
+            writer.write((numpy.zeros(3, numpy.float64),))
+
+    def test_trailing_shape_mismatch(self):
+        writer = datasets.ColumnarDatasetWriter(self.path)
+        writer.write((numpy.zeros((3, 2)),))
+        with self.assertRaises(ValueError):
+            writer.write((numpy.zeros((3, 3)),))
+
+    def test_rejected_example_is_not_written(self):
+        with datasets.ColumnarDatasetWriter(self.path) as writer:
+            writer.write((numpy.arange(2), numpy.zeros(3, numpy.float32)))
+            with self.assertRaises(ValueError):
+                writer.write((numpy.arange(3), numpy.zeros(3, numpy.int32)))
+            writer.write((numpy.arange(1), numpy.ones(3, numpy.float32)))
+
+        dataset = datasets.ColumnarDataset(self.path)
+        self.assertEqual(len(dataset), 2)
+        numpy.testing.assert_array_equal(dataset[1][0], numpy.arange(1))
+        numpy.testing.assert_array_equal(
+            dataset[1][1], numpy.ones(3, numpy.float32))
+
+
+testing.run_module(__name__, __file__)
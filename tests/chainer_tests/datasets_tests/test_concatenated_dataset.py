@@ -1,10 +1,12 @@
-import numpy as np
-import six
 import unittest
 
+import mock
+import numpy as np
+import six
 
 from chainer.datasets import ConcatenatedDataset
 from chainer import testing
+from chainer_tests.dataset_tests.tabular_tests import dummy_dataset
 
 
 @testing.parameterize(
@@ -60,5 +62,39 @@ class TestConcatenatedDataset(unittest.TestCase):
                 concatenated_slice, expected_slice):
             np.testing.assert_equal(concatenated, expected)
 
+    def test_concatenated_dataset_indices(self):
+        n = len(self.expected_dataset)
+        indices = np.random.permutation(n)[:7]
+        for index in (indices, indices.tolist()):
+            examples = self.concatenated_dataset[index]
+            self.assertEqual(len(examples), len(indices))
+            for example, i in six.moves.zip(examples, indices):
+                np.testing.assert_equal(example, self.expected_dataset[i])
+
+    def test_concatenated_dataset_out_of_range(self):
+        n = len(self.expected_dataset)
+        with self.assertRaises(IndexError):
+            self.concatenated_dataset[n]
+        with self.assertRaises(IndexError):
+            self.concatenated_dataset[-1]
+        with self.assertRaises(IndexError):
+            self.concatenated_dataset[[0, n]]
+
+
+class TestConcatenatedDatasetTabular(unittest.TestCase):
+
+    def test_get_examples_once(self):
+        callback = mock.MagicMock()
+        shards = [dummy_dataset.DummyDataset(mode=tuple, callback=callback)
+                  for _ in range(3)]
+        dataset = ConcatenatedDataset(*shards)
+        self.assertEqual(len(dataset), 30)
+
+        indices = [25, 3, 17, 4, 26]
+        examples = dataset[indices]
+        self.assertEqual(callback.call_count, 3)
+        for example, i in six.moves.zip(examples, indices):
+            self.assertEqual(example, shards[i // 10].get_example(i % 10))
+
 
 testing.run_module(__name__, __file__)
@@ -1,8 +1,12 @@
 import io
+import multiprocessing.pool
 import os
 import sys
 import unittest
 
+import numpy
+import pytest
+
 from chainer import datasets
 from chainer import testing
 from chainer import utils
@@ -44,5 +48,69 @@ class TestPickleDatasetHelper(unittest.TestCase):
         with datasets.open_pickle_dataset(self.path) as dataset:
             assert dataset[0] == 1
 
+    def test_cache_index(self):
+        with datasets.open_pickle_dataset_writer(self.path) as writer:
+            writer.write(1)
+            writer.write('hello')
+
+        with datasets.open_pickle_dataset(
+                self.path, cache_index=True) as dataset:
+            assert dataset[1] == 'hello'
+        assert os.path.exists(self.path + '.index')
+
+        with datasets.open_pickle_dataset(
+                self.path, cache_index=True) as dataset:
+            assert isinstance(dataset._positions, numpy.memmap)
+            assert len(dataset) == 2
+            assert dataset[0] == 1
+            assert dataset[1] == 'hello'
+
+    def test_cache_index_modified(self):
+        with datasets.open_pickle_dataset_writer(self.path) as writer:
+            writer.write(1)
+        with datasets.open_pickle_dataset(self.path, cache_index=True):
+            pass
+
+        with datasets.open_pickle_dataset_writer(self.path) as writer:
+            writer.write('a')
+            writer.write('b')
+        with datasets.open_pickle_dataset(
+                self.path, cache_index=True) as dataset:
+            assert len(dataset) == 2
+            assert dataset[1] == 'b'
+
+    def test_cache_index_not_writable(self):
+        with datasets.open_pickle_dataset_writer(self.path) as writer:
+            writer.write(1)
+        index_path = os.path.join(
+            os.path.dirname(self.path), 'missing', 'test.index')
+
+        with open(self.path, 'rb') as f:
+            with pytest.warns(UserWarning):
+                dataset = datasets.PickleDataset(f, index_path=index_path)
+            assert len(dataset) == 1
+            assert dataset[0] == 1
+        assert not os.path.exists(index_path)
+
+    def test_lock_free(self):
+        with datasets.open_pickle_dataset_writer(self.path) as writer:
+            for i in range(100):
+                writer.write((i, 'x' * i))
+
+        with datasets.open_pickle_dataset(
+                self.path, lock_free=True) as dataset:
+            assert len(dataset) == 100
+            assert dataset[-1] == (99, 'x' * 99)
+            with self.assertRaises(IndexError):
+                dataset[100]
+            with self.assertRaises(IndexError):
+                dataset[-101]
+
+            pool = multiprocessing.pool.ThreadPool(4)
+            results = pool.map(dataset.get_example, range(100))
+            pool.close()
+            pool.join()
+            assert results == [(i, 'x' * i) for i in range(100)]
+
 
 testing.run_module(__name__, __file__)
@@ -2,14 +2,19 @@
 
 from __future__ import unicode_literals
 
+import io
+import multiprocessing.pool
 import os
 import pickle
+import sys
 import unittest
 
+import numpy
 import six
 
 from chainer import datasets
 from chainer import testing
+from chainer import utils
 
 
 class TestTextDataset(unittest.TestCase):
@@ -147,5 +152,79 @@ class TestTextDataset(unittest.TestCase):
         assert ds1[1] == ('テスト2\n', 'テスト2\n')
         assert ds2[1] == ('テスト2\n', 'テスト2\n')
 
+    def test_lock_free(self):
+        ds = self._dataset(
+            ['utf8_1.txt', 'utf8_2.txt'], encoding='utf-8', lock_free=True)
+        expected = [ds[i] for i in range(len(ds))]
+
+        pool = multiprocessing.pool.ThreadPool(4)
+        results = pool.map(ds.get_example, list(range(len(ds))) * 10)
+        pool.close()
+        pool.join()
+        assert results == expected * 10
+
+        ds2 = pickle.loads(pickle.dumps(ds))
+        assert ds2[1] == ('テスト2\n', 'テスト2\n')
+        ds2.close()
+
+        ds.close()
+        with self.assertRaises(ValueError):
+            ds[0]
+
+
+class TestTextDatasetCacheIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = utils.tempdir()
+        dirpath = self.tempdir.__enter__()
+        self.paths = [os.path.join(dirpath, 'a.txt'),
+                      os.path.join(dirpath, 'b.txt')]
+        self._write(self.paths[0], 'hello\nworld\ntest\n')
+        self._write(self.paths[1], 'テスト1\nテスト2\nテスト3\n')
+
+    def tearDown(self):
+        self.tempdir.__exit__(*sys.exc_info())
+
+    def _write(self, path, text):
+        with io.open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def _check(self, ds):
+        assert len(ds) == 3
+        assert ds[0] == ('hello\n', 'テスト1\n')
+        assert ds[2] == ('test\n', 'テスト3\n')
+
+    def test_cache_index(self):
+        ds1 = datasets.TextDataset(
+            self.paths, encoding='utf-8', cache_index=True)
+        self._check(ds1)
+        for path in self.paths:
+            assert os.path.exists(path + '.index')
+
+        ds2 = datasets.TextDataset(
+            self.paths, encoding='utf-8', cache_index=True)
+        for b in ds2._bounds:
+            assert isinstance(b, numpy.memmap)
+        self._check(ds2)
+
+        ds3 = pickle.loads(pickle.dumps(ds2))
+        self._check(ds3)
+        ds1.close()
+        ds2.close()
+        ds3.close()
+
+    def test_cache_index_modified(self):
+        ds = datasets.TextDataset(
+            self.paths, encoding='utf-8', cache_index=True)
+        ds.close()
+        self._write(self.paths[0], 'hi\nall\nfoo\n')
+        stat = os.stat(self.paths[0])
+        os.utime(self.paths[0], (stat.st_atime, stat.st_mtime + 10))
+
+        ds = datasets.TextDataset(
+            self.paths, encoding='utf-8', cache_index=True)
+        assert ds[1] == ('all\n', 'テスト2\n')
+        ds.close()
+
 
 testing.run_module(__name__, __file__)
@@ -0,0 +1,174 @@
+import unittest
+
+import numpy
+
+import chainer
+import chainer.functions as F
+from chainer import gradient_check
+from chainer.graph_optimizations import elementwise_fusion
+from chainer import testing
+
+
+def _activation(x, y, condition):
+    h = F.sigmoid(x * 2 + 1) * F.tanh(y) - F.relu(x / (y * y + 1))
+    h = F.clip(h, -0.5, 0.5) + F.exp(-x) + F.leaky_relu(y, 0.1)
+    return F.where(condition, h, x ** 2), F.sqrt(F.square(y) + 1)
+
+
+@testing.parameterize(*testing.product({
+    'shape': [(0,), (1,), (3, 4), (7, 5)],
+    'block_size': [1, 4, 8192],
+    'dtype': [numpy.float32, numpy.float64],
+}))
+class TestFuseElementwise(unittest.TestCase):
+
+    def setUp(self):
+        self.x = self.uniform()
+        self.y = self.uniform()
+        self.condition = numpy.asarray(self.uniform() > 0)
+        self.gz = self.uniform()
+        self.gw = self.uniform()
+        self.fused = elementwise_fusion.fuse_elementwise(
+            _activation, block_size=self.block_size)
+
+    def uniform(self):
+        return numpy.asarray(
+            numpy.random.uniform(-1, 1, self.shape), self.dtype)
+
+    def check(self, func):
+        x = chainer.Variable(self.x)
+        y = chainer.Variable(self.y)
+        z, w = func(x, y, self.condition)
+        F.sum(z * self.gz + w * self.gw).backward()
+        return z.array, w.array, x.grad, y.grad
+
+    def test_forward_backward(self):
+        expect = self.check(_activation)
+        for _ in range(2):
+            actual = self.check(self.fused)
+            for e, a in zip(expect, actual):
+                testing.assert_allclose(e, a, atol=1e-5, rtol=1e-4)
+
+    def test_single_node(self):
+        z, w = self.fused(self.x, self.y, self.condition)
+        assert isinstance(
+            z.creator, elementwise_fusion.FusedElementwise)
+        assert z.creator is w.creator
+
+
+class TestFuseElementwiseFallback(unittest.TestCase):
+
+    def setUp(self):
+        self.x = numpy.random.uniform(-1, 1, (3, 4)).astype(numpy.float32)
+
+    def test_unsupported_function(self):
+        @chainer.fuse_elementwise
+        def f(x):
+            return F.sum(F.exp(x))
+
+        y = f(chainer.Variable(self.x))
+        assert not isinstance(y.creator, elementwise_fusion.FusedElementwise)
+        testing.assert_allclose(y.array, numpy.exp(self.x).sum())
+
+    def test_constant_array(self):
+        c = numpy.ones((3, 4), numpy.float32)
+
+        @chainer.fuse_elementwise
+        def f(x):
+            return x + c
+
+        y = f(chainer.Variable(self.x))
+        assert not isinstance(y.creator, elementwise_fusion.FusedElementwise)
+        testing.assert_allclose(y.array, self.x + 1)
+
+    def test_data_dependent_constant(self):
+        @chainer.fuse_elementwise
+        def f(x):
+            return x * float(x.array.max())
+
+        for x in (self.x, self.x * 2):
+            y = f(chainer.Variable(x))
+            assert not isinstance(
+                y.creator, elementwise_fusion.FusedElementwise)
+            testing.assert_allclose(y.array, x * x.max())
+
+    def test_broadcast(self):
+        @chainer.fuse_elementwise(block_size=2)
+        def f(x, y):
+            return x * y
+
+        y = f(chainer.Variable(self.x), self.x[0])
+        testing.assert_allclose(y.array, self.x * self.x[0])
+
+    def test_unsupported_argument(self):
+        @chainer.fuse_elementwise
+        def f(x, name):
+            return F.exp(x)
+
+        y = f(chainer.Variable(self.x), 'exp')
+        assert not isinstance(y.creator, elementwise_fusion.FusedElementwise)
+
+    def test_invalid_block_size(self):
+        with self.assertRaises(ValueError):
+            chainer.fuse_elementwise(block_size=0)
+
+
+class TestFuseElementwiseScalar(unittest.TestCase):
+
+    def setUp(self):
+        self.x = numpy.random.uniform(-1, 1, (3, 4)).astype(numpy.float32)
+
+    def test_scalar_argument(self):
+        @chainer.fuse_elementwise
+        def swish(x, beta):
+            return x * F.sigmoid(beta * x)
+
+        for beta in (1.0, 2, numpy.float32(0.5), 1.0):
+            x = chainer.Variable(self.x)
+            y = swish(x, beta)
+            assert isinstance(y.creator, elementwise_fusion.FusedElementwise)
+            F.sum(y).backward()
+            expect = chainer.Variable(self.x)
+            y_expect = swish.__wrapped__(expect, beta)
+            F.sum(y_expect).backward()
+            testing.assert_allclose(y.array, y_expect.array)
+            testing.assert_allclose(x.grad, expect.grad)
+
+    def test_closure(self):
+        scale = 1.0
+
+        @chainer.fuse_elementwise
+        def f(x):
+            return x * scale
+
+        for scale in (1.0, 2.0):
+            y = f(self.x)
+            assert isinstance(y.creator, elementwise_fusion.FusedElementwise)
+            testing.assert_allclose(y.array, self.x * scale)
+
+    def test_double_backward_scalar(self):
+        @chainer.fuse_elementwise
+        def f(beta, x):
+            return F.tanh(beta * x) * x
+
+        x = numpy.random.uniform(-1, 1, (5,)).astype(numpy.float64)
+        gy = numpy.random.uniform(-1, 1, (5,)).astype(numpy.float64)
+        ggx = numpy.random.uniform(-1, 1, (5,)).astype(numpy.float64)
+        gradient_check.check_double_backward(
+            lambda x: f(0.5, x), x, gy, ggx)
+
+
+class TestFuseElementwiseDoubleBackprop(unittest.TestCase):
+
+    def test_double_backward(self):
+        @chainer.fuse_elementwise(block_size=3)
+        def f(x):
+            return F.tanh(x) * x
+
+        x = numpy.random.uniform(-1, 1, (5,)).astype(numpy.float64)
+        gy = numpy.random.uniform(-1, 1, (5,)).astype(numpy.float64)
+        ggx = numpy.random.uniform(-1, 1, (5,)).astype(numpy.float64)
+        gradient_check.check_double_backward(f, x, gy, ggx)
+
+
+testing.run_module(__name__, __file__)
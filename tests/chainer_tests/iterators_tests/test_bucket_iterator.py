@@ -0,0 +1,117 @@
+from __future__ import division
+
+import unittest
+
+import numpy
+import six
+
+from chainer import iterators
+from chainer import serializers
+from chainer import testing
+
+
+def _make_dataset(n, max_length=20, seed=0):
+    random = numpy.random.RandomState(seed)
+    lengths = random.randint(1, max_length + 1, size=n)
+    return [numpy.full((length,), i, dtype=numpy.int32)
+            for i, length in enumerate(lengths)]
+
+
+@testing.parameterize(*testing.product({
+    'max_tokens': [None, 40],
+    'batch_size': [None, 3],
+    'bucket_width': [1, 5],
+    'shuffle': [True, False],
+}))
+class TestBucketIterator(unittest.TestCase):
+
+    def setUp(self):
+        if self.max_tokens is None and self.batch_size is None:
+            self.skipTest('either max_tokens or batch_size is required')
+        self.dataset = _make_dataset(50)
+
+    def _iterator(self, **kwargs):
+        return iterators.BucketIterator(
+            self.dataset, max_tokens=self.max_tokens,
+            batch_size=self.batch_size, bucket_width=self.bucket_width,
+            shuffle=self.shuffle, **kwargs)
+
+    def test_iterator(self):
+        it = self._iterator()
+        for epoch in range(3):
+            seen = []
+            while True:
+                batch = it.next()
+                lengths = [len(x) for x in batch]
+                if self.batch_size is not None:
+                    self.assertLessEqual(len(batch), self.batch_size)
+                if self.max_tokens is not None and len(batch) > 1:
+                    self.assertLessEqual(
+                        len(batch) * max(lengths), self.max_tokens)
+                buckets = set(
+                    length // self.bucket_width for length in lengths)
+                self.assertEqual(len(buckets), 1)
+                seen.extend(int(x[0]) for x in batch)
+                if it.is_new_epoch:
+                    break
+                self.assertEqual(it.epoch, epoch)
+                self.assertLess(it.epoch_detail, epoch + 1)
+            self.assertEqual(it.epoch, epoch + 1)
+            self.assertAlmostEqual(it.epoch_detail, epoch + 1)
+            self.assertEqual(sorted(seen), list(range(len(self.dataset))))
+
+    def test_iterator_not_repeat(self):
+        it = self._iterator(repeat=False)
+        n = sum(len(batch) for batch in it)
+        self.assertEqual(n, len(self.dataset))
+        self.assertEqual(it.epoch, 1)
+        with self.assertRaises(StopIteration):
+            it.next()
+
+    def test_iterator_serialize(self):
+        it = self._iterator()
+        for _ in range(5):
+            it.next()
+
+        target = {}
+        it.serialize(serializers.DictionarySerializer(target))
+
+        it2 = self._iterator()
+        it2.serialize(serializers.NpzDeserializer(target))
+        self.assertEqual(it2.epoch_detail, it.epoch_detail)
+        self.assertEqual(it2.previous_epoch_detail, it.previous_epoch_detail)
+        # Batches are compared until the end of the epoch, because the
+        # iterators shuffle the next epoch with different random states.
+        while not it.is_new_epoch:
+            batch1 = it.next()
+            batch2 = it2.next()
+            self.assertEqual(len(batch1), len(batch2))
+            for x1, x2 in six.moves.zip(batch1, batch2):
+                numpy.testing.assert_array_equal(x1, x2)
+
+
+class TestBucketIteratorLengths(unittest.TestCase):
+
+    def test_lengths(self):
+        dataset = [(numpy.zeros(i), numpy.zeros(10 - i)) for i in range(10)]
+        it = iterators.BucketIterator(
+            dataset, lengths=[5] * 10, batch_size=4, shuffle=False)
+        self.assertEqual([len(it.next()) for _ in range(3)], [4, 4, 2])
+
+    def test_default_lengths(self):
+        dataset = [(numpy.zeros(i), numpy.zeros(2)) for i in range(10)]
+        it = iterators.BucketIterator(dataset, max_tokens=8, shuffle=False)
+        batch = it.next()
+        # Lengths are 2, 2, 2, 3, ...
+        self.assertEqual([len(x) for x, _ in batch], [0, 1, 2])
+
+    def test_invalid_lengths(self):
+        with self.assertRaises(ValueError):
+            iterators.BucketIterator([1, 2, 3], lengths=[1, 2], batch_size=1)
+
+    def test_no_limit(self):
+        with self.assertRaises(ValueError):
+            iterators.BucketIterator([[1], [2]])
+
+
+testing.run_module(__name__, __file__)
@@ -17,6 +17,7 @@ import six
 from chainer import iterators
 from chainer import serializer
 from chainer import testing
+from chainer.dataset import convert
 from chainer.testing import attr
 
 
@@ -581,6 +582,107 @@ class TestMultiprocessIteratorConcurrency(unittest.TestCase):
         self.assertFalse(deadlock)
 
 
+class _GrowingDataset(object):
+
+    def __len__(self):
+        return 8
+
+    def __getitem__(self, i):
+        return i, numpy.full((i + 1,), i, dtype=numpy.float32)
+
+
+@testing.parameterize(*testing.product({
+    'n_prefetch': [1, 2],
+    'shared_mem': [None, 4],
+    'zero_copy': [False, True],
+}))
+class TestMultiprocessIteratorSharedMemory(unittest.TestCase):
+
+    def setUp(self):
+        self.options = {'n_processes': 2,
+                        'n_prefetch': self.n_prefetch,
+                        'shared_mem': self.shared_mem,
+                        'zero_copy': self.zero_copy}
+
+    def check_batch(self, batch):
+        for i, x in batch:
+            numpy.testing.assert_array_equal(
+                x, numpy.full((i + 1,), i, dtype=numpy.float32))
+
+    def test_grow_shared_memory(self):
+        dataset = _GrowingDataset()
+        it = iterators.MultiprocessIterator(
+            dataset, 2, shuffle=False, **self.options)
+        for _ in range(12):
+            self.check_batch(it.next())
+        assert it._prefetch_loop.mem_size >= dataset[7][1].nbytes
+        it.finalize()
+
+    def test_zero_copy_views(self):
+        dataset = [numpy.full((3,), i) for i in range(6)]
+        it = iterators.MultiprocessIterator(
+            dataset, 2, shuffle=False, **self.options)
+        for _ in range(6):
+            batch = it.next()
+            if self.zero_copy and it.epoch > 0:
+                # The first batch is fetched in the main process if the
+                # shared memory size is measured automatically.
+                for x in batch:
+                    self.assertFalse(x.flags.owndata)
+            for x in batch:
+                self.assertEqual(x.shape, (3,))
+                self.assertTrue((x == x[0]).all())
+        it.finalize()
+
+
+@testing.parameterize(*testing.product({
+    'n_prefetch': [1, 2],
+    'shared_mem': [None, 4, 1000000],
+    'zero_copy': [False, True],
+    'repeat': [False, True],
+}))
+class TestMultiprocessIteratorConverter(unittest.TestCase):
+
+    def setUp(self):
+        self.options = {'n_processes': 2,
+                        'n_prefetch': self.n_prefetch,
+                        'shared_mem': self.shared_mem,
+                        'zero_copy': self.zero_copy,
+                        'repeat': self.repeat,
+                        'converter': convert.concat_examples}
+        self.dataset = [(numpy.full((2, 3), i, dtype=numpy.float32), i)
+                        for i in range(10)]
+
+    def test_iterator_converter(self):
+        it = iterators.MultiprocessIterator(
+            self.dataset, 4, shuffle=False, **self.options)
+        for i in range(6):
+            if not self.repeat and i == 3:
+                with self.assertRaises(StopIteration):
+                    it.next()
+                break
+            x, t = it.next()
+            expect = [(4 * i + j) % 10 for j in range(4)]
+            if not self.repeat and i == 2:
+                expect = expect[:2]
+            numpy.testing.assert_array_equal(t, numpy.array(expect))
+            self.assertEqual(x.shape, (len(expect), 2, 3))
+            numpy.testing.assert_array_equal(x[:, 0, 0], t)
+        it.finalize()
+
+    def test_iterator_converter_reset(self):
+        it = iterators.MultiprocessIterator(
+            self.dataset, 4, shuffle=False, **self.options)
+        for _ in range(3):
+            it.next()
+            it.next()
+            it.reset()
+            x, t = it.next()
+            numpy.testing.assert_array_equal(t, numpy.arange(4))
+            numpy.testing.assert_array_equal(x[:, 0, 0], t)
+        it.finalize()
+
+
 class TestMultiprocessIteratorDeterminancy(unittest.TestCase):
 
     def setUp(self):
@@ -632,6 +734,7 @@ import os
 import random
 import sys
 import time
+from chainer import dataset
 from chainer import iterators
 
 # Using `multiprocessing` on Windows Python 2.7 requires
@@ -0,0 +1,68 @@
+import unittest
+
+import numpy as np
+
+from chainer import dataset
+from chainer import iterators
+from chainer import testing
+from chainer.dataset.tabular import _batch
+from chainer_tests.dataset_tests.tabular_tests import dummy_dataset
+
+
+@testing.parameterize(*testing.product({
+    'iterator': ['serial', 'multithread', 'multiprocess'],
+    'mode': [tuple, dict],
+    'return_array': [True, False],
+}))
+class TestIteratorTabularDataset(unittest.TestCase):
+
+    def setUp(self):
+        self.batch_calls = 0
+
+    def _make_iterator(self, dataset):
+        if self.iterator == 'serial':
+            return iterators.SerialIterator(dataset, 4, shuffle=False)
+        elif self.iterator == 'multithread':
+            return iterators.MultithreadIterator(
+                dataset, 4, shuffle=False, n_threads=2)
+        elif self.iterator == 'multiprocess':
+            return iterators.MultiprocessIterator(
+                dataset, 4, shuffle=False, n_processes=2)
+
+    def test_iterator(self):
+        def callback(indices, key_indices):
+            # Single examples are also fetched below for comparison.
+            if len(indices) == 4:
+                self.batch_calls += 1
+            self.assertIsNone(key_indices)
+
+        ds = dummy_dataset.DummyDataset(
+            mode=self.mode, return_array=self.return_array,
+            callback=callback if self.iterator == 'serial' else None)
+        it = self._make_iterator(ds)
+
+        for i in range(5):
+            batch = it.next()
+            self.assertIsInstance(batch, _batch.ColumnMajorBatch)
+            self.assertEqual(len(batch), 4)
+            indices = [(4 * i + j) % 10 for j in range(4)]
+            for j, index in enumerate(indices):
+                self.assertEqual(batch[j], ds[index])
+
+            converted = dataset.concat_examples(batch)
+            expected = dataset.concat_examples([ds[k] for k in indices])
+            self.assertIsInstance(converted, self.mode)
+            if self.mode is dict:
+                self.assertEqual(
+                    sorted(converted.keys()), sorted(expected.keys()))
+                converted = [converted[key] for key in sorted(converted)]
+                expected = [expected[key] for key in sorted(expected)]
+            for x, y in zip(converted, expected):
+                np.testing.assert_array_equal(x, y)
+
+        if self.iterator == 'serial':
+            self.assertEqual(self.batch_calls, 5)
+        it.finalize()
+
+
+testing.run_module(__name__, __file__)
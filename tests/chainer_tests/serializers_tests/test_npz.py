@@ -470,7 +470,80 @@ class TestSaveNpz(unittest.TestCase):
 
         self.assertEqual(obj.serialize.call_count, 1)
         (serializer,), _ = obj.serialize.call_args
-        self.assertIsInstance(serializer, npz.DictionarySerializer)
+        self.assertIsInstance(serializer, npz.NpzSerializer)
+
+
+@testing.parameterize(*testing.product({
+    'compress': [False, True],
+    'n_threads': [1, 3],
+}))
+class TestNpzSerializer(unittest.TestCase):
+
+    def setUp(self):
+        self.file = six.BytesIO()
+        self.arrays = {
+            'a/x': numpy.random.uniform(size=(3, 4)).astype(numpy.float32),
+            'a/b/y': numpy.arange(10),
+            'z': numpy.asarray(3),
+        }
+
+    def _load(self):
+        self.file.seek(0)
+        return numpy.load(self.file, allow_pickle=True)
+
+    def test_serialize(self):
+        with npz.NpzSerializer(
+                self.file, self.compress, self.n_threads) as s:
+            s['a']('x', self.arrays['a/x'])
+            s['a']['b']('/y', self.arrays['a/b/y'])
+            ret = s('z', 3)
+            s('none', None)
+        self.assertEqual(ret, 3)
+
+        with self._load() as f:
+            self.assertEqual(
+                set(f.keys()), {'a/x', 'a/b/y', 'z', 'none'})
+            for key, expected in self.arrays.items():
+                numpy.testing.assert_array_equal(f[key], expected)
+            self.assertIsNone(f['none'][()])
+
+    def test_overwrite(self):
+        with npz.NpzSerializer(
+                self.file, self.compress, self.n_threads) as s:
+            s('x', numpy.zeros(3))
+            s('x', numpy.ones(3))
+        with self._load() as f:
+            self.assertEqual(list(f.keys()), ['x'])
+            numpy.testing.assert_array_equal(f['x'], numpy.ones(3))
+
+    def test_save_dict(self):
+        thread_pool = npz.pool.ThreadPool
+        with mock.patch.object(
+                npz.pool, 'ThreadPool', side_effect=thread_pool) as m:
+            npz.save_npz(
+                self.file, self.arrays, self.compress, self.n_threads)
+        if self.n_threads > 1:
+            m.assert_called_once_with(self.n_threads)
+        else:
+            self.assertEqual(m.call_count, 0)
+
+        with self._load() as f:
+            self.assertEqual(set(f.keys()), set(self.arrays))
+            for key, expected in self.arrays.items():
+                numpy.testing.assert_array_equal(f[key], expected)
+
+    def test_save_load_link(self):
+        src = links.Linear(3, 4)
+        src.add_persistent('count', 5)
+        npz.save_npz(self.file, src, self.compress, self.n_threads)
+
+        dst = links.Linear(3, 4)
+        dst.add_persistent('count', 0)
+        self.file.seek(0)
+        npz.load_npz(self.file, dst)
+        numpy.testing.assert_array_equal(dst.W.array, src.W.array)
+        numpy.testing.assert_array_equal(dst.b.array, src.b.array)
+        self.assertEqual(dst.count, 5)
 
 
 @testing.parameterize(*testing.product({
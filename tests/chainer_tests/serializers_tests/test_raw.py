@@ -0,0 +1,143 @@
+import io
+import os
+import sys
+import unittest
+
+import numpy
+
+import chainer
+from chainer import links
+from chainer import serializers
+from chainer.serializers import raw
+from chainer import testing
+from chainer import utils
+
+
+def _is_mapped(array):
+    while array is not None:
+        if isinstance(array, numpy.memmap):
+            return True
+        array = array.base
+    return False
+
+
+class TestSaveRaw(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = utils.tempdir()
+        self.path = os.path.join(self.tempdir.__enter__(), 'test.raw')
+
+    def tearDown(self):
+        self.tempdir.__exit__(*sys.exc_info())
+
+    def test_save_load(self):
+        target = {
+            'a/x': numpy.random.uniform(size=(3, 5)).astype(numpy.float32),
+            'a/y': numpy.arange(7, dtype=numpy.int8),
+            'b': numpy.asarray(3),
+            'c': numpy.asarray(None),
+            'd': numpy.asarray('hello'),
+            'e': numpy.zeros((0, 2), dtype=numpy.float64),
+            'f': numpy.asfortranarray(numpy.ones((2, 3))),
+        }
+        serializers.save_raw(self.path, target)
+
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        self.assertEqual(len(data) % 64, 0)
+
+        arrays = serializers.open_raw(self.path)
+        self.assertEqual(set(arrays), set(target))
+        for key, expected in target.items():
+            actual = arrays[key]
+            if key == 'c':
+                self.assertIsNone(actual[()])
+                continue
+            self.assertEqual(actual.dtype, expected.dtype)
+            numpy.testing.assert_array_equal(actual, expected)
+            if actual.size > 0:
+                self.assertEqual(actual.ctypes.data % 64, 0)
+
+    def test_save_file_object(self):
+        f = io.BytesIO()
+        serializers.save_raw(f, {'x': numpy.arange(3)})
+        with open(self.path, 'wb') as out:
+            out.write(f.getvalue())
+        numpy.testing.assert_array_equal(
+            serializers.open_raw(self.path)['x'], numpy.arange(3))
+
+    def test_save_object_array(self):
+        with self.assertRaises(TypeError):
+            serializers.save_raw(
+                self.path, {'x': numpy.array([1, 'a'], dtype=object)})
+
+    def test_invalid_file(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'not a raw file')
+        with self.assertRaises(ValueError):
+            serializers.open_raw(self.path)
+
+
+@testing.parameterize(*testing.product({
+    'adopt': [False, True],
+}))
+class TestLoadRaw(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = utils.tempdir()
+        self.path = os.path.join(self.tempdir.__enter__(), 'test.raw')
+
+        self.src = chainer.Sequential(
+            links.Linear(3, 4), links.BatchNormalization(4))
+        self.src[1].avg_mean[:] = numpy.random.uniform(size=4)
+        self.src[1].N = 5
+        serializers.save_raw(self.path, self.src)
+
+        self.dst = chainer.Sequential(
+            links.Linear(3, 4), links.BatchNormalization(4))
+
+    def tearDown(self):
+        self.tempdir.__exit__(*sys.exc_info())
+
+    def test_load(self):
+        serializers.load_raw(self.path, self.dst, adopt=self.adopt)
+        for (name, src), (_, dst) in zip(
+                sorted(self.src.namedparams()),
+                sorted(self.dst.namedparams())):
+            numpy.testing.assert_array_equal(dst.array, src.array)
+            self.assertEqual(_is_mapped(dst.array), self.adopt)
+        numpy.testing.assert_array_equal(
+            self.dst[1].avg_mean, self.src[1].avg_mean)
+        self.assertEqual(self.dst[1].N, 5)
+
+    def test_update_does_not_modify_file(self):
+        serializers.load_raw(self.path, self.dst, adopt=self.adopt)
+        self.dst[0].W.array[...] = 0
+
+        arrays = serializers.open_raw(self.path)
+        numpy.testing.assert_array_equal(
+            arrays['0/W'], self.src[0].W.array)
+
+    def test_load_uninitialized(self):
+        dst = links.Linear(4)
+        serializers.load_raw(self.path, dst, path='0/', adopt=self.adopt)
+        numpy.testing.assert_array_equal(dst.W.array, self.src[0].W.array)
+
+    def test_ignore_names(self):
+        W = self.dst[0].W.array.copy()
+        serializers.load_raw(
+            self.path, self.dst, ignore_names='0/W', adopt=self.adopt)
+        numpy.testing.assert_array_equal(self.dst[0].W.array, W)
+
+
+class TestRawDeserializer(unittest.TestCase):
+
+    def test_get_item(self):
+        d = raw.RawDeserializer({}, adopt=True)
+        child = d['x']
+        self.assertIsInstance(child, raw.RawDeserializer)
+        self.assertEqual(child.path, 'x/')
+        self.assertTrue(child.adopt)
+
+
+testing.run_module(__name__, __file__)
@@ -1,6 +1,8 @@
 from __future__ import print_function
+import gc
 import threading
 import unittest
+import weakref
 
 import mock
 import numpy
@@ -426,6 +428,77 @@ Actual: 1 < 2"""
             f.apply((v,))
 
 
+class TestFunctionNodeTypeCheckCache(unittest.TestCase):
+
+    def setUp(self):
+        test = self
+        test.count = 0
+
+        class FunctionNode(chainer.FunctionNode):
+
+            def __init__(self, ndim):
+                self.ndim = ndim
+
+            def check_type_forward(self, in_types):
+                test.count += 1
+                x_type, = in_types
+                type_check.expect(
+                    x_type.dtype == numpy.float32,
+                    x_type.ndim == self.ndim,
+                )
+
+            def forward(self, inputs):
+                return inputs[0].copy(),
+
+        self.function_class = FunctionNode
+
+    def apply(self, shape, dtype=numpy.float32, ndim=2):
+        x = chainer.Variable(numpy.zeros(shape, dtype))
+        return self.function_class(ndim).apply((x,))
+
+    def test_cached(self):
+        self.apply((2, 3))
+        self.apply((2, 3))
+        assert self.count == 1
+
+        # New shape
+        self.apply((3, 2))
+        assert self.count == 2
+
+        # New attribute
+        self.apply((2,), ndim=1)
+        assert self.count == 3
+
+    def test_invalid_type(self):
+        self.apply((2, 3))
+        with pytest.raises(type_check.InvalidType):
+            self.apply((2, 3), dtype=numpy.float64)
+        with pytest.raises(type_check.InvalidType):
+            self.apply((2, 3), dtype=numpy.float64)
+        with pytest.raises(type_check.InvalidType):
+            self.apply((2, 3), ndim=3)
+
+    def test_unhashable_attribute(self):
+        x = chainer.Variable(numpy.zeros((2, 3), numpy.float32))
+        for _ in range(2):
+            f = self.function_class(2)
+            f.array = numpy.zeros(3)
+            f.apply((x,))
+        assert self.count == 2
+
+    def test_attribute_type(self):
+        for ndim in (2, 2.0, numpy.float32(2), numpy.int64(2)):
+            self.apply((2, 3), ndim=ndim)
+        assert self.count == 4
+
+    def test_class_not_kept_alive(self):
+        self.apply((2, 3))
+        ref = weakref.ref(self.function_class)
+        del self.function_class
+        gc.collect()
+        assert ref() is None
+
+
 class TestFunctionNodeInconsistentBackends(unittest.TestCase):
 
     def setUp(self):
@@ -713,6 +786,47 @@ class TestNoBackpropMode(unittest.TestCase):
         assert chainerx.is_backprop_required()
 
 
+class TestInferenceMode(unittest.TestCase):
+
+    def setUp(self):
+        self.x = chainer.Variable(numpy.array([1., 2.], 'f'))
+
+    def test_inference_mode(self):
+        with chainer.inference_mode():
+            self.assertFalse(chainer.config.enable_backprop)
+            self.assertTrue(chainer.config.inference_mode)
+            y = chainer.functions.exp(self.x * 2)
+        self.assertFalse(chainer.config.inference_mode)
+        self.assertIsNone(y.creator_node)
+        self.assertFalse(y.requires_grad)
+        numpy.testing.assert_allclose(y.array, numpy.exp(self.x.array * 2))
+
+    def test_force_backprop_mode(self):
+        with chainer.inference_mode():
+            with chainer.force_backprop_mode():
+                y = self.x + 1
+        self.assertIsNotNone(y.creator_node)
+
+    def test_type_check(self):
+        with chainer.inference_mode():
+            with self.assertRaises(type_check.InvalidType):
+                chainer.functions.exp(numpy.array([1, 2], 'i'))
+
+    def test_function_hook(self):
+        # Function hooks are still called.
+        hook = chainer.function_hooks.TimerHook()
+        with chainer.inference_mode(), hook:
+            self.x + 1
+        self.assertEqual(len(hook.call_history), 1)
+
+    @attr.gpu
+    def test_cupy(self):
+        x = cuda.to_gpu(self.x.array)
+        with chainer.inference_mode():
+            y = chainer.functions.exp(x)
+        cuda.cupy.testing.assert_allclose(y.array, cuda.cupy.exp(x))
+
+
 class MyThread(threading.Thread):
 
     def run(self):
@@ -1,6 +1,7 @@
 import contextlib
 import tempfile
 import unittest
+import warnings
 
 import numpy
 
@@ -449,4 +450,117 @@ class TestDictSummary(unittest.TestCase):
         })
 
 
+@testing.parameterize(*testing.product({
+    'to_cpu': [False, True],
+}))
+class TestPackedDictSummary(unittest.TestCase):
+
+    def setUp(self):
+        self.summary = chainer.reporter.PackedDictSummary()
+
+    def check(self, summary, data):
+        mean = summary.compute_mean(to_cpu=self.to_cpu)
+        stats = summary.make_statistics(to_cpu=self.to_cpu)
+        self.assertEqual(set(mean.keys()), set(data.keys()))
+        self.assertEqual(
+            set(stats.keys()),
+            set(data.keys()).union(name + '.std' for name in data.keys()))
+        for name in data.keys():
+            m = sum(data[name]) / float(len(data[name]))
+            s = numpy.sqrt(
+                sum(x * x for x in data[name]) / float(len(data[name]))
+                - m * m)
+            testing.assert_allclose(mean[name], m)
+            testing.assert_allclose(stats[name], m)
+            testing.assert_allclose(stats[name + '.std'], s)
+            if self.to_cpu:
+                self.assertIsInstance(mean[name], float)
+
+    def test(self):
+        self.summary.add({'numpy': numpy.array(3, 'f'), 'int': 1, 'float': 4.})
+        self.summary.add({'numpy': numpy.array(1, 'f'), 'int': 5, 'float': 9.})
+        self.summary.add({'numpy': numpy.array(2, 'f'), 'int': 6, 'float': 5.})
+        self.summary.add({'numpy': numpy.array(3, 'f'), 'int': 5, 'float': 8.})
+
+        self.check(self.summary, {
+            'numpy': (3., 1., 2., 3.),
+            'int': (1, 5, 6, 5),
+            'float': (4., 9., 5., 8.),
+        })
+
+    @attr.gpu
+    def test_cupy(self):
+        xp = cuda.cupy
+        self.summary.add({'cupy': xp.array(3, 'f'), 'numpy': 1.})
+        self.summary.add({'cupy': xp.array(1, 'f'), 'numpy': 2.})
+        self.summary.add({'cupy': xp.array(2, 'f')})
+        self.summary.add({'cupy': xp.array(3, 'f')})
+
+        self.check(self.summary, {
+            'cupy': (3., 1., 2., 3.),
+            'numpy': (1., 2.),
+        })
+
+    @attr.gpu
+    def test_cupy_and_numpy_same_name(self):
+        xp = cuda.cupy
+        self.summary.add({'a': xp.array(3, 'f')})
+        self.summary.add({'a': 1.})
+
+        self.check(self.summary, {'a': (3., 1.)})
+
+    def test_sparse(self):
+        self.summary.add({'a': 3., 'b': 1.})
+        self.summary.add({'a': 1., 'b': 5., 'c': 9.})
+        self.summary.add({'b': 6.})
+        self.summary.add({'a': 3., 'b': 5., 'c': 8.})
+
+        self.check(self.summary, {
+            'a': (3., 1., 3.),
+            'b': (1., 5., 6., 5.),
+            'c': (9., 8.),
+        })
+
+    def test_weight(self):
+        self.summary.add({'a': (1., 0.5)})
+        self.summary.add({'a': (2., numpy.array(0.4))})
+        self.summary.add({'a': (3., chainer.Variable(numpy.array(0.3)))})
+
+        mean = self.summary.compute_mean(to_cpu=self.to_cpu)
+        val = (1 * 0.5 + 2 * 0.4 + 3 * 0.3) / (0.5 + 0.4 + 0.3)
+        testing.assert_allclose(mean['a'], val)
+
+        with self.assertRaises(ValueError):
+            self.summary.add({'a': (4., numpy.array([0.5]))})
+
+    def test_zero_weight(self):
+        self.summary.add({'a': (1., 0), 'b': 2.})
+        self.summary.add({'a': (3., 0.)})
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            mean = self.summary.compute_mean(to_cpu=self.to_cpu)
+            stats = self.summary.make_statistics(to_cpu=self.to_cpu)
+        assert numpy.isnan(float(mean['a']))
+        assert numpy.isnan(float(stats['a']))
+        assert numpy.isnan(float(stats['a.std']))
+        testing.assert_allclose(mean['b'], 2.)
+
+    def test_serialize(self):
+        self.summary.add({'numpy': numpy.array(3, 'f'), 'int': 1, 'float': 4.})
+        self.summary.add({'numpy': numpy.array(1, 'f'), 'int': 5, 'float': 9.})
+        self.summary.add({'numpy': numpy.array(2, 'f'), 'int': 6, 'float': 5.})
+
+        summary = chainer.reporter.PackedDictSummary()
+        summary.add({'c': 5.})
+        testing.save_and_load_npz(self.summary, summary)
+        summary.add({'numpy': numpy.array(3, 'f'), 'int': 5, 'float': 8.})
+
+        self.check(summary, {
+            'numpy': (3., 1., 2., 3.),
+            'int': (1, 5, 6, 5),
+            'float': (4., 9., 5., 8.),
+        })
+
+
 testing.run_module(__name__, __file__)
@@ -607,4 +607,113 @@ class TestEmptySequential(unittest.TestCase):
             seq(x)
 
 
+@testing.parameterize(
+    {'memory_budget': None, 'n_segments': None},
+    {'memory_budget': None, 'n_segments': 1},
+    {'memory_budget': None, 'n_segments': 3},
+    {'memory_budget': None, 'n_segments': 100},
+    {'memory_budget': 1, 'n_segments': None},
+    {'memory_budget': 40000, 'n_segments': None},
+    {'memory_budget': 10 ** 9, 'n_segments': None},
+)
+class TestSequentialCheckpointing(unittest.TestCase):
+
+    def setUp(self):
+        layers = []
+        for _ in range(8):
+            layers += [links.Linear(10, 10), functions.tanh]
+        self.seq = chainer.Sequential(*layers)
+        self.x = numpy.random.uniform(-1, 1, (64, 10)).astype(numpy.float32)
+
+    def forward_backward(self):
+        self.seq.cleargrads()
+        observation = {}
+        reporter = chainer.Reporter()
+        reporter.add_observer('seq', self.seq)
+        with reporter.scope(observation):
+            y = self.seq(self.x)
+        functions.sum(y).backward()
+        grads = [param.grad.copy() for param in self.seq.params()]
+        return y.array, grads, observation
+
+    def test_forward_backward(self):
+        y_expect, grads_expect, observation = self.forward_backward()
+        self.assertEqual(observation, {})
+
+        self.seq.enable_checkpointing(
+            memory_budget=self.memory_budget, n_segments=self.n_segments)
+        # The second call uses the sizes of activations of the first call.
+        for _ in range(2):
+            y, grads, observation = self.forward_backward()
+            numpy.testing.assert_allclose(y, y_expect, rtol=1e-6)
+            for g, g_expect in zip(grads, grads_expect):
+                numpy.testing.assert_allclose(g, g_expect, rtol=1e-5)
+            self.assertEqual(
+                set(observation), {'seq/activation_memory', 'seq/peak_memory'})
+            self.assertLessEqual(
+                observation['seq/activation_memory'],
+                observation['seq/peak_memory'])
+            self.assertLessEqual(observation['seq/peak_memory'], 16 * 2560)
+
+        self.seq.disable_checkpointing()
+        _, _, observation = self.forward_backward()
+        self.assertEqual(observation, {})
+
+    def test_no_backprop_mode(self):
+        self.seq.enable_checkpointing(
+            memory_budget=self.memory_budget, n_segments=self.n_segments)
+        with chainer.no_backprop_mode():
+            y = self.seq(self.x)
+        self.assertIsNone(y.creator)
+
+
+class TestSequentialCheckpointingPlan(unittest.TestCase):
+
+    def setUp(self):
+        layers = []
+        for _ in range(16):
+            layers += [links.Linear(10, 10)]
+        self.seq = chainer.Sequential(*layers)
+        self.x = numpy.zeros((64, 10), numpy.float32)
+
+    def test_sqrt_segments(self):
+        self.seq.enable_checkpointing()
+        self.assertEqual(
+            self.seq._plan_checkpoint(),
+            [(0, 4, True), (4, 8, True), (8, 12, True), (12, 16, False)])
+
+    def test_budget(self):
+        # Each layer outputs an array of 2560 bytes.
+        self.seq.enable_checkpointing(memory_budget=2560 * 8)
+        self.seq(self.x)
+        plan = self.seq._plan_checkpoint()
+        for (_, stop, _), (start, _, _) in zip(plan, plan[1:]):
+            self.assertEqual(stop, start)
+        self.assertEqual(plan[0][0], 0)
+        self.assertEqual(plan[-1][1], 16)
+        sizes = [2560] * 16
+        _, peak = chainer.sequential._estimate_memory(sizes, plan)
+        self.assertLessEqual(peak, 2560 * 8)
+        # Keeping 6 layers and 2 boundaries fits in the budget.
+        n_recomputed = sum(
+            stop - start for start, stop, forget in plan if forget)
+        self.assertEqual(n_recomputed, 10)
+
+    def test_large_budget(self):
+        self.seq.enable_checkpointing(memory_budget=2560 * 16)
+        self.seq(self.x)
+        self.assertEqual(self.seq._plan_checkpoint(), [(0, 16, False)])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self.seq.enable_checkpointing(memory_budget=1, n_segments=1)
+        with self.assertRaises(ValueError):
+            self.seq.enable_checkpointing(n_segments=0)
+
+    def test_copy(self):
+        self.seq.enable_checkpointing(n_segments=2)
+        copied = self.seq.copy()
+        self.assertEqual(copied._checkpoint, (None, 2))
+
+
 testing.run_module(__name__, __file__)
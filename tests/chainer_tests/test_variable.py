@@ -2961,6 +2961,206 @@ class TestLazyGradSum(unittest.TestCase):
             self.check_backward()
 
 
+@testing.parameterize(*testing.product({
+    'release_retained_arrays': [False, True],
+    'grad_in_place': [False, True],
+}))
+class TestVariableBackwardMemory(unittest.TestCase):
+
+    def setUp(self):
+        self.x_data = np.random.uniform(-1, 1, (3, 4)).astype(np.float32)
+        self.gx_expect = 2 * np.exp(2 * self.x_data)
+
+    def forward(self, x):
+        # F.exp retains its output and `h * h` retains its inputs.
+        h = F.exp(x)
+        return F.sum(h * h), h
+
+    def backward(self, y):
+        observation = {}
+        with chainer.Reporter().scope(observation):
+            y.backward(
+                release_retained_arrays=self.release_retained_arrays,
+                grad_in_place=self.grad_in_place)
+        return observation
+
+    def test_backward(self):
+        x = chainer.Variable(self.x_data)
+        y, h = self.forward(x)
+        observation = self.backward(y)
+        testing.assert_allclose(x.grad, self.gx_expect, rtol=1e-5)
+
+        if self.release_retained_arrays:
+            self.assertIsNone(h.node.data)
+            self.assertEqual(h.node.shape, (3, 4))
+            self.assertGreaterEqual(
+                observation['backward/peak_memory'], 2 * h.array.nbytes)
+            with self.assertRaises(RuntimeError):
+                y.backward()
+        else:
+            self.assertIsNotNone(h.node.data)
+            self.assertEqual(observation, {})
+
+    def test_accumulate(self):
+        x = chainer.Variable(self.x_data)
+        x.grad = np.ones_like(self.x_data)
+        gx = x.grad
+        y, _ = self.forward(x)
+        self.backward(y)
+        testing.assert_allclose(x.grad, self.gx_expect + 1, rtol=1e-5)
+        if self.grad_in_place:
+            self.assertIs(x.grad, gx)
+        else:
+            self.assertIsNot(x.grad, gx)
+            testing.assert_allclose(gx, np.ones_like(self.x_data))
+
+    def test_shared_intermediate(self):
+        x = chainer.Variable(self.x_data)
+        y, h = self.forward(x)
+        # F.sin retains its input, which is not kept alive by the variable.
+        z = F.sum(F.sin(h))
+        del h
+        self.backward(y)
+        x.cleargrad()
+        if self.release_retained_arrays:
+            with self.assertRaises(RuntimeError):
+                z.backward()
+        else:
+            z.backward()
+            testing.assert_allclose(
+                x.grad, np.cos(np.exp(self.x_data)) * np.exp(self.x_data),
+                rtol=1e-5)
+
+
+@testing.parameterize(
+    {'kwargs': {'release_retained_arrays': True}},
+    {'kwargs': {'grad_in_place': True}},
+    {'kwargs': {'n_threads': 2}},
+)
+@attr.chainerx
+class TestVariableBackwardChainerxUnsupported(unittest.TestCase):
+
+    def test_backward(self):
+        x = chainer.Variable(chainerx.ones((3,), np.float32))
+        y = F.sum(x * x)
+        with self.assertRaises(RuntimeError):
+            y.backward(**self.kwargs)
+
+
+class TestVariableBackwardGradInPlaceError(unittest.TestCase):
+
+    def test_double_backprop(self):
+        x = chainer.Variable(np.ones((3,), np.float32))
+        y = F.sum(x * x)
+        with self.assertRaises(ValueError):
+            y.backward(grad_in_place=True, enable_double_backprop=True)
+
+
+@testing.parameterize(*testing.product({
+    'retain_grad': [False, True],
+    'release_retained_arrays': [False, True],
+    'grad_in_place': [False, True],
+}))
+class TestVariableBackwardConcurrent(unittest.TestCase):
+
+    def setUp(self):
+        self.x_data = np.random.uniform(-1, 1, (3, 4)).astype(np.float32)
+        self.w_data = np.random.uniform(-1, 1, (4, 4)).astype(np.float32)
+        self.gx_init = np.random.uniform(-1, 1, (3, 4)).astype(np.float32)
+
+    def forward(self, x, w):
+        # Independent branches sharing the input and the weight.
+        h = F.relu(F.matmul(x, w))
+        a = F.tanh(F.matmul(h, w))
+        b = F.exp(h) * F.sigmoid(F.matmul(x, w))
+        c = F.sin(x)
+        return F.sum(a + b) + F.sum(c * c), h
+
+    def backward(self, n_threads):
+        x = chainer.Variable(self.x_data)
+        w = chainer.Variable(self.w_data)
+        x.grad = self.gx_init.copy()
+        y, h = self.forward(x, w)
+        y.backward(
+            retain_grad=self.retain_grad,
+            release_retained_arrays=self.release_retained_arrays,
+            grad_in_place=self.grad_in_place, n_threads=n_threads)
+        return x, w, h
+
+    def test_backward(self):
+        x1, w1, h1 = self.backward(1)
+        x4, w4, h4 = self.backward(4)
+        testing.assert_allclose(x1.grad, x4.grad)
+        testing.assert_allclose(w1.grad, w4.grad)
+        if self.retain_grad:
+            testing.assert_allclose(h1.grad, h4.grad)
+        else:
+            self.assertIsNone(h4.grad_var)
+
+    def test_deterministic(self):
+        _, w1, _ = self.backward(4)
+        _, w2, _ = self.backward(4)
+        np.testing.assert_array_equal(w1.grad, w2.grad)
+
+
+class TestVariableBackwardConcurrentConfig(unittest.TestCase):
+
+    def test_double_backprop(self):
+        x = chainer.Variable(np.random.uniform(-1, 1, (3,)).astype('f'))
+        y = F.sum(F.sin(x) * F.cos(x))
+        y.backward(enable_double_backprop=True, n_threads=2)
+        gx = x.grad_var
+        x.grad_var = None
+        F.sum(gx).backward(n_threads=2)
+        testing.assert_allclose(x.grad, -2 * np.sin(2 * x.array))
+
+    def test_error(self):
+        x = chainer.Variable(np.ones((3,), np.float32))
+        y = F.sum(x * x)
+        with self.assertRaises(ValueError):
+            y.backward(n_threads=0)
+
+    def run_function_hook(self, local, n_threads):
+        x = chainer.Variable(np.ones((3,), np.float32))
+        y = F.exp(x) * F.sin(x)
+        hook = chainer.function_hooks.TimerHook()
+        if local:
+            y.creator.add_hook(hook)
+            F.sum(y).backward(n_threads=n_threads)
+        else:
+            with hook:
+                F.sum(y).backward(n_threads=n_threads)
+        testing.assert_allclose(
+            x.grad, np.exp(x.array) * (np.sin(x.array) + np.cos(x.array)))
+        return [name for name, _ in hook.call_history]
+
+    def check_function_hook(self, local):
+        # The function nodes are processed sequentially, so that the
+        # preprocess and postprocess of each function node are paired.
+        self.assertEqual(self.run_function_hook(local, 2),
+                         self.run_function_hook(local, 1))
+
+    def test_global_function_hook(self):
+        self.check_function_hook(False)
+
+    def test_local_function_hook(self):
+        self.check_function_hook(True)
+
+    def test_backward_error(self):
+        class Failure(chainer.FunctionNode):
+
+            def forward(self, inputs):
+                return inputs[0].copy(),
+
+            def backward(self, indexes, grad_outputs):
+                raise RuntimeError('failure')
+
+        x = chainer.Variable(np.ones((3,), np.float32))
+        y = F.sum(Failure().apply((x,))[0] + F.exp(x))
+        with self.assertRaises(RuntimeError):
+            y.backward(n_threads=2)
+
+
 @testing.parameterize(*(
     testing.product({
         'from_connected': [True, False],
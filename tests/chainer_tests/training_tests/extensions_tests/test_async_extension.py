@@ -0,0 +1,91 @@
+import threading
+import time
+import unittest
+
+import mock
+
+from chainer import testing
+from chainer import training
+from chainer.training import extensions
+
+
+class RecordingExtension(training.Extension):
+
+    trigger = 2, 'iteration'
+    priority = training.PRIORITY_WRITER
+
+    def __init__(self):
+        self.records = []
+        self.threads = set()
+        self.finalized = False
+
+    def __call__(self, trainer):
+        time.sleep(0.001)
+        self.records.append(
+            (trainer.updater.iteration, dict(trainer.observation)))
+        self.threads.add(threading.current_thread())
+
+    def finalize(self):
+        self.finalized = True
+
+
+class TestAsyncExtension(unittest.TestCase):
+
+    def setUp(self):
+        self.trainer = testing.get_trainer_with_mock_updater(
+            (10, 'iteration'))
+
+        @training.make_extension(trigger=(1, 'iteration'), priority=1000)
+        def observe(trainer):
+            trainer.observation['x'] = trainer.updater.iteration
+        self.trainer.extend(observe)
+
+    def test_run(self):
+        ext = RecordingExtension()
+        async_ext = extensions.AsyncExtension(ext)
+        self.trainer.extend(async_ext)
+        self.trainer.run()
+
+        self.assertTrue(ext.finalized)
+        self.assertEqual(
+            ext.records, [(i, {'x': i}) for i in range(2, 11, 2)])
+        self.assertNotIn(threading.current_thread(), ext.threads)
+
+    def test_attributes(self):
+        ext = RecordingExtension()
+        async_ext = extensions.AsyncExtension(ext)
+        self.assertEqual(async_ext.trigger, (2, 'iteration'))
+        self.assertEqual(async_ext.priority, training.PRIORITY_WRITER)
+        self.assertEqual(async_ext.default_name, 'RecordingExtension')
+        self.assertIs(async_ext.records, ext.records)
+
+        self.trainer.extend(async_ext)
+        self.assertIs(
+            self.trainer.get_extension('RecordingExtension'), async_ext)
+
+    def test_error(self):
+        class TheOnlyError(Exception):
+            pass
+
+        ext = mock.MagicMock(side_effect=TheOnlyError())
+        ext.trigger = 1, 'iteration'
+        ext.priority = training.PRIORITY_READER
+        ext.name = 'error'
+        self.trainer.extend(extensions.AsyncExtension(ext))
+        with self.assertRaises(TheOnlyError):
+            self.trainer.run(show_loop_exception_msg=False)
+        ext.finalize.assert_called_once_with()
+
+    def test_serialize_waits(self):
+        ext = RecordingExtension()
+        ext.serialize = mock.MagicMock(
+            side_effect=lambda serializer: self.assertEqual(
+                len(ext.records), 5))
+        async_ext = extensions.AsyncExtension(ext)
+        self.trainer.extend(async_ext)
+        self.trainer.run()
+        async_ext.serialize(mock.MagicMock())
+        ext.serialize.assert_called_once()
+
+
+testing.run_module(__name__, __file__)
@@ -272,4 +272,45 @@ class TestEvaluatorRepeat(unittest.TestCase):
                 extensions.Evaluator(iterator, {})
 
 
+class WeightedModel(chainer.Link):
+
+    def forward(self, x):
+        chainer.report({
+            'loss': chainer.Variable(numpy.asarray(x.sum())),
+            'weighted': (x.mean(), len(x)),
+            'vector': x,
+            'train': float(chainer.config.train),
+        }, self)
+
+
+@testing.parameterize(*testing.product({
+    'n_processes': [1, 3],
+    'chunksize': [1, 2],
+}))
+class TestMultiprocessEvaluator(unittest.TestCase):
+
+    def setUp(self):
+        self.data = numpy.random.uniform(-1, 1, (11, 3)).astype('f')
+
+    def _evaluate(self, evaluator_class, **kwargs):
+        iterator = iterators.SerialIterator(
+            self.data, 2, repeat=False, shuffle=False)
+        evaluator = evaluator_class(iterator, WeightedModel(), **kwargs)
+        return evaluator()
+
+    def test_evaluate(self):
+        result = self._evaluate(
+            extensions.MultiprocessEvaluator, n_processes=self.n_processes,
+            chunksize=self.chunksize)
+        expected = self._evaluate(extensions.Evaluator)
+        self.assertEqual(
+            set(result), {'main/loss', 'main/weighted', 'main/train'})
+        self.assertEqual(set(result), set(expected))
+        for key, value in expected.items():
+            numpy.testing.assert_allclose(result[key], value, rtol=1e-6)
+        numpy.testing.assert_allclose(
+            result['main/weighted'], self.data.mean(), rtol=1e-6)
+        self.assertEqual(result['main/train'], 0)
+
+
 testing.run_module(__name__, __file__)
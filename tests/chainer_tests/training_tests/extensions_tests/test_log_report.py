@@ -0,0 +1,108 @@
+import json
+import os
+import sys
+import unittest
+
+import mock
+
+from chainer import serializers
+from chainer import testing
+from chainer.training import extensions
+from chainer import utils
+
+
+@testing.parameterize(*testing.product({
+    'format': ['json', 'jsonl'],
+    'fsync': [False, True],
+    'packed_summary': [False, True],
+}))
+class TestLogReport(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = utils.tempdir()
+        self.out = self.tempdir.__enter__()
+        self.path = os.path.join(self.out, 'log')
+
+    def tearDown(self):
+        self.tempdir.__exit__(*sys.exc_info())
+
+    def _log_report(self):
+        log_report = extensions.LogReport(
+            trigger=lambda trainer: True, format=self.format,
+            fsync=self.fsync, packed_summary=self.packed_summary)
+        log_report.initialize(self._trainer(0))
+        return log_report
+
+    def _trainer(self, iteration):
+        trainer = mock.MagicMock()
+        trainer.out = self.out
+        trainer.observation = {'loss': float(iteration)}
+        trainer.updater.epoch = 0
+        trainer.updater.iteration = iteration
+        trainer.elapsed_time = 0.0
+        return trainer
+
+    def _read_log(self):
+        if self.format == 'json':
+            with open(self.path) as f:
+                return json.load(f)
+        return extensions.load_jsonl_log(self.path)
+
+    def test_log(self):
+        log_report = self._log_report()
+        for i in range(3):
+            log_report(self._trainer(i))
+        assert [entry['loss'] for entry in log_report.log] == [0, 1, 2]
+        assert self._read_log() == log_report.log
+
+    def test_resume(self):
+        log_report = self._log_report()
+        for i in range(2):
+            log_report(self._trainer(i))
+        target = {}
+        log_report.serialize(serializers.DictionarySerializer(target))
+        if self.format == 'jsonl':
+            assert '_log' not in target
+        # Entries after the snapshot are discarded on resume.
+        log_report(self._trainer(2))
+
+        log_report = self._log_report()
+        log_report.serialize(serializers.NpzDeserializer(target))
+        log_report(self._trainer(3))
+        assert [entry['loss'] for entry in log_report.log] == [0, 1, 3]
+        assert self._read_log() == log_report.log
+
+    def test_overwrite(self):
+        with open(self.path, 'w') as f:
+            f.write('garbage')
+        log_report = self._log_report()
+        log_report(self._trainer(0))
+        assert self._read_log() == log_report.log
+
+
+class TestLogReportInvalidFormat(unittest.TestCase):
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            extensions.LogReport(format='csv')
+
+
+class TestLoadJsonlLog(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = utils.tempdir()
+        self.path = os.path.join(self.tempdir.__enter__(), 'log')
+        with open(self.path, 'w') as f:
+            f.write('{"a": 1}\n{"a": 2}\n')
+
+    def tearDown(self):
+        self.tempdir.__exit__(*sys.exc_info())
+
+    def test_load(self):
+        assert extensions.load_jsonl_log(self.path) == [{'a': 1}, {'a': 2}]
+
+    def test_load_size(self):
+        assert extensions.load_jsonl_log(self.path, 9) == [{'a': 1}]
+
+
+testing.run_module(__name__, __file__)
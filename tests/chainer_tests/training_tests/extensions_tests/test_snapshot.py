@@ -2,8 +2,12 @@ import os
 import unittest
 
 import mock
+import numpy
 import pytest
 
+import chainer
+from chainer import links
+from chainer import optimizers
 from chainer import testing
 from chainer import training
 from chainer.training import extensions
@@ -97,4 +101,92 @@ class TestSnapshotOnError(unittest.TestCase):
         self.assertTrue(os.path.exists(self.filename))
 
 
+class TestSnapshotBackground(unittest.TestCase):
+
+    def setUp(self):
+        self.model = chainer.Sequential(
+            links.Linear(3, 4), links.BatchNormalization(4))
+        self.optimizer = optimizers.MomentumSGD()
+        self.optimizer.setup(self.model)
+        self.trainer = mock.MagicMock()
+        self.trainer.updater.get_all_optimizers.return_value = {
+            'main': self.optimizer}
+        self._update()
+
+    def _update(self):
+        for param in self.model.params():
+            param.grad = numpy.ones_like(param.array)
+        self.model[1].avg_mean += 1
+        self.optimizer.update()
+
+    def _snapshot(self, background, writer):
+        return extensions.snapshot_object(
+            self.model, 'snapshot', writer=writer, background=background)
+
+    def test_same_as_foreground(self):
+        expected = mock.MagicMock()
+        self._snapshot(False, expected)(self.trainer)
+        expected_target = {
+            key: value.copy()
+            for key, value in expected.call_args[0][2].items()}
+
+        writer = mock.MagicMock()
+        snapshot = self._snapshot(True, writer)
+        snapshot(self.trainer)
+        self._update()
+        snapshot.finalize()
+
+        assert writer.call_count == 1
+        filename, outdir, target = writer.call_args[0]
+        assert filename == 'snapshot'
+        assert set(target) == set(expected_target)
+        for key, value in expected_target.items():
+            numpy.testing.assert_array_equal(target[key], value)
+
+    def test_fence(self):
+        snapshot = self._snapshot(True, mock.MagicMock())
+        snapshot(self.trainer)
+        events = snapshot._fence.events
+        assert set(events) == set(
+            param.update_rule for param in self.model.params())
+        self._update()
+        assert all(event.is_set() for event in events.values())
+        snapshot.finalize()
+        assert snapshot._fence.events == {}
+
+    def test_multiple_snapshots(self):
+        writers = [mock.MagicMock(), mock.MagicMock()]
+        snapshots = [self._snapshot(True, writer) for writer in writers]
+        for snapshot in snapshots:
+            snapshot(self.trainer)
+        self._update()
+        for snapshot in snapshots:
+            snapshot.finalize()
+
+        for writer in writers:
+            assert writer.call_count == 1
+        for param in self.model.params():
+            assert param.update_rule._pre_update_hooks == {}
+
+    def test_error(self):
+        class TheOnlyError(Exception):
+            pass
+
+        writer = mock.MagicMock(side_effect=TheOnlyError())
+        snapshot = self._snapshot(True, writer)
+        snapshot(self.trainer)
+        with pytest.raises(TheOnlyError):
+            snapshot.finalize()
+
+    def test_without_optimizers(self):
+        del self.trainer.updater.get_all_optimizers
+        writer = mock.MagicMock()
+        snapshot = self._snapshot(True, writer)
+        snapshot(self.trainer)
+        snapshot.finalize()
+        target = writer.call_args[0][2]
+        numpy.testing.assert_array_equal(
+            target['0/W'], self.model[0].W.array)
+
+
 testing.run_module(__name__, __file__)
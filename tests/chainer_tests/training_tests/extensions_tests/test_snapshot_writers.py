@@ -1,9 +1,16 @@
+import json
+import os
 import unittest
 
 import mock
 import multiprocessing
+import numpy
 import threading
 
+import chainer
+from chainer import links
+from chainer import optimizers
+from chainer.serializers import npz
 from chainer import testing
 from chainer.training.extensions import snapshot_writers
 from chainer import utils
@@ -99,4 +106,159 @@ class TestQueueWriter(unittest.TestCase):
                 assert q.task_done.call_count == 3
 
 
+class _ModelAndOptimizer(object):
+
+    def __init__(self, model, optimizer):
+        self.model = model
+        self.optimizer = optimizer
+
+    def serialize(self, serializer):
+        self.model.serialize(serializer['model'])
+        self.optimizer.serialize(serializer['optimizer'])
+
+
+class TestShardedWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.model = links.Classifier(chainer.Sequential(
+            links.Linear(3, 4), links.Linear(4, 2)))
+        self.optimizer = optimizers.MomentumSGD()
+        self.optimizer.setup(self.model)
+        self.model.predictor[0].disable_update()
+        for param in self.model.params():
+            param.grad = numpy.ones_like(param.array)
+        self.optimizer.update()
+        self.target = _ModelAndOptimizer(self.model, self.optimizer)
+
+    def _shard_files(self, outdir):
+        return set(name for name in os.listdir(
+            os.path.join(outdir, 'snapshot_shards')) if name.endswith('.npz'))
+
+    def test_save_load(self):
+        w = snapshot_writers.ShardedWriter()
+        with utils.tempdir() as tempd:
+            w('snapshot_1', tempd, npz.serialize(self.target))
+            shards = self._shard_files(tempd)
+            # One shard for each link, update rule and the optimizer.
+            self.assertGreater(len(shards), 1)
+
+            for param in self.model.params():
+                param.grad = numpy.ones_like(param.array)
+            self.optimizer.update()
+            w('snapshot_2', tempd, npz.serialize(self.target))
+            new_shards = self._shard_files(tempd) - shards
+            # The frozen link is not saved again.
+            self.assertTrue(all(name.startswith('snapshot_2.')
+                                for name in new_shards))
+            with open(os.path.join(tempd, 'snapshot_2')) as f:
+                manifest = json.load(f)['arrays']
+            self.assertTrue(manifest['model/predictor/0/W'][0].startswith(
+                os.path.join('snapshot_shards', 'snapshot_1.')))
+            self.assertTrue(manifest['model/predictor/1/W'][0].startswith(
+                os.path.join('snapshot_shards', 'snapshot_2.')))
+
+            model = links.Classifier(chainer.Sequential(
+                links.Linear(3, 4), links.Linear(4, 2)))
+            optimizer = optimizers.MomentumSGD()
+            optimizer.setup(model)
+            model.predictor[0].disable_update()
+            snapshot_writers.load_sharded(
+                os.path.join(tempd, 'snapshot_2'),
+                _ModelAndOptimizer(model, optimizer))
+
+        self.assertEqual(optimizer.t, self.optimizer.t)
+        for (_, p1), (_, p2) in zip(sorted(model.namedparams()),
+                                    sorted(self.model.namedparams())):
+            numpy.testing.assert_array_equal(p1.array, p2.array)
+            if p2.update_rule.state is None:
+                self.assertIsNone(p1.update_rule.state)
+            else:
+                numpy.testing.assert_array_equal(
+                    p1.update_rule.state['v'], p2.update_rule.state['v'])
+
+    def test_removed_shard_is_saved_again(self):
+        w = snapshot_writers.ShardedWriter(shard_depth=1)
+        with utils.tempdir() as tempd:
+            target = {'a/x': numpy.arange(3), 'b/y': numpy.ones(2)}
+            w('snapshot_1', tempd, target)
+            self.assertEqual(len(self._shard_files(tempd)), 2)
+            for name in self._shard_files(tempd):
+                os.remove(os.path.join(tempd, 'snapshot_shards', name))
+
+            w('snapshot_2', tempd, target)
+            self.assertEqual(len(self._shard_files(tempd)), 2)
+            model = {}
+
+            class Target(object):
+                def serialize(self, serializer):
+                    model['x'] = serializer('a/x', None)
+                    model['y'] = serializer('b/y', None)
+
+            snapshot_writers.load_sharded(
+                os.path.join(tempd, 'snapshot_2'), Target())
+        numpy.testing.assert_array_equal(model['x'], numpy.arange(3))
+        numpy.testing.assert_array_equal(model['y'], numpy.ones(2))
+
+    def test_same_filename(self):
+        w = snapshot_writers.ShardedWriter(shard_depth=1)
+        with utils.tempdir() as tempd:
+            target = {'a/x': numpy.arange(3), 'a/y': numpy.ones(2)}
+            w('snapshot', tempd, target)
+            target = {'a/x': numpy.arange(3), 'a/y': numpy.zeros(2)}
+            w('snapshot', tempd, target)
+            model = {}
+
+            class Target(object):
+                def serialize(self, serializer):
+                    model['x'] = serializer('a/x', None)
+                    model['y'] = serializer('a/y', None)
+
+            snapshot_writers.load_sharded(
+                os.path.join(tempd, 'snapshot'), Target())
+        numpy.testing.assert_array_equal(model['x'], numpy.arange(3))
+        numpy.testing.assert_array_equal(model['y'], numpy.zeros(2))
+
+    def test_reused_filename_frees_shards(self):
+        w = snapshot_writers.ShardedWriter(shard_depth=1)
+        with utils.tempdir() as tempd:
+            for i in range(5):
+                target = {'a/x': numpy.arange(3), 'b/y': numpy.full(2, i)}
+                w('snapshot', tempd, target)
+            # The shard of the unchanged array and the latest one of the
+            # changed array
+            self.assertEqual(len(self._shard_files(tempd)), 2)
+
+    def test_removed_snapshot_frees_shards(self):
+        w = snapshot_writers.ShardedWriter(shard_depth=1)
+        with utils.tempdir() as tempd:
+            w('snapshot_1', tempd,
+              {'a/x': numpy.arange(3), 'b/y': numpy.ones(2)})
+            w('snapshot_2', tempd,
+              {'a/x': numpy.arange(3), 'b/y': numpy.zeros(2)})
+            self.assertEqual(len(self._shard_files(tempd)), 3)
+
+            os.remove(os.path.join(tempd, 'snapshot_1'))
+            w('snapshot_3', tempd,
+              {'a/x': numpy.arange(3), 'b/y': numpy.zeros(2)})
+            shards = self._shard_files(tempd)
+            self.assertEqual(len(shards), 2)
+            # The shard of snapshot_1 is still referred to by the others.
+            self.assertTrue(any(name.startswith('snapshot_1.')
+                                for name in shards))
+
+    def test_resume(self):
+        target = {'a/x': numpy.arange(3), 'b/y': numpy.ones(2)}
+        with utils.tempdir() as tempd:
+            snapshot_writers.ShardedWriter(shard_depth=1)(
+                'snapshot_1', tempd, target)
+            shards = self._shard_files(tempd)
+
+            target['b/y'] = numpy.zeros(2)
+            snapshot_writers.ShardedWriter(shard_depth=1)(
+                'snapshot_2', tempd, target)
+            new_shards = self._shard_files(tempd) - shards
+            self.assertEqual(len(new_shards), 1)
+            self.assertTrue(new_shards.pop().startswith('snapshot_2.'))
+
+
 testing.run_module(__name__, __file__)
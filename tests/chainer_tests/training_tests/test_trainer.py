@@ -1,9 +1,13 @@
+import json
+import os
+import sys
 import time
 import traceback
 import unittest
 
 from chainer import testing
 from chainer import training
+from chainer import utils
 
 
 class DummyExtension(training.extension.Extension):
@@ -245,4 +249,72 @@ class TestTrainer(unittest.TestCase):
         self.assertTrue(dummy_extension.is_finalized)
 
 
+class TestTrainerProfile(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = utils.tempdir()
+        self.out = self.tempdir.__enter__()
+        updater = testing.get_trainer_with_mock_updater().updater
+        updater.update_core = lambda: time.sleep(0.001)
+        updater.iterator_wait_time = 0.0005
+        self.updater = updater
+
+    def tearDown(self):
+        self.tempdir.__exit__(*sys.exc_info())
+
+    def _run(self, **kwargs):
+        trainer = training.Trainer(
+            self.updater, (10, 'iteration'), out=self.out, **kwargs)
+        observations = []
+
+        @training.make_extension(trigger=(1, 'iteration'), priority=0)
+        def observe(trainer):
+            observations.append(dict(trainer.observation))
+
+        @training.make_extension(trigger=(5, 'iteration'))
+        def sleep(trainer):
+            time.sleep(0.002)
+
+        trainer.extend(observe)
+        trainer.extend(sleep)
+        trainer.run()
+        return trainer, observations
+
+    def test_histograms(self):
+        trainer, observations = self._run(profile=True)
+        histograms = trainer.time_histograms
+        self.assertEqual(histograms['time/update'].count, 10)
+        self.assertEqual(histograms['time/iterator'].count, 10)
+        self.assertEqual(histograms['time/triggers'].count, 10)
+        self.assertEqual(histograms['time/extensions/observe'].count, 10)
+        self.assertEqual(histograms['time/extensions/sleep'].count, 2)
+        self.assertGreater(histograms['time/extensions/sleep'].mean, 0.002)
+        self.assertGreaterEqual(histograms['time/update'].max, 0.001)
+        self.assertEqual(sum(histograms['time/update'].counts), 10)
+
+        self.assertIn('time/update', observations[0])
+        self.assertEqual(observations[0]['time/iterator'], 0.0005)
+        self.assertNotIn('time/extensions/sleep', observations[4])
+        # The time of an extension is reported in the next iteration.
+        self.assertIn('time/extensions/sleep', observations[5])
+        self.assertIn('time/triggers', observations[5])
+
+    def test_trace_file(self):
+        trainer, _ = self._run(trace_file='trace.json')
+        with open(os.path.join(self.out, 'trace.json')) as f:
+            events = json.load(f)
+        names = [event['name'] for event in events]
+        self.assertEqual(names.count('time/update'), 10)
+        self.assertEqual(names.count('time/extensions/sleep'), 2)
+        for event in events:
+            self.assertEqual(event['ph'], 'X')
+            self.assertGreaterEqual(event['ts'], 0)
+            self.assertGreaterEqual(event['dur'], 0)
+
+    def test_no_profile(self):
+        trainer, observations = self._run()
+        self.assertIsNone(trainer.time_histograms)
+        self.assertNotIn('time/update', observations[0])
+
+
 testing.run_module(__name__, __file__)
@@ -7,6 +7,7 @@ import chainer
 from chainer.backends import _cpu
 from chainer.backends import cuda
 from chainer import dataset
+from chainer.dataset import convert
 from chainer import testing
 from chainer.testing import attr
 from chainer import training
@@ -416,4 +417,177 @@ class TestUpdaterCustomConverter(unittest.TestCase):
         self.assertIs(v1, converter_out)
 
 
+class TestUpdaterPrefetch(unittest.TestCase):
+
+    def setUp(self):
+        self.dataset = [numpy.array(i) for i in range(6)]
+
+    def _run(self, prefetch):
+        target = chainer.Link()
+        optimizer = DummyOptimizer()
+        optimizer.setup(target)
+        iterator = chainer.iterators.SerialIterator(
+            self.dataset, 2, shuffle=False)
+        updater = training.updaters.StandardUpdater(
+            iterator, optimizer, prefetch=prefetch)
+
+        epochs = []
+        for _ in range(5):
+            updater.update()
+            epochs.append((updater.epoch, updater.epoch_detail,
+                           updater.previous_epoch_detail,
+                           updater.is_new_epoch))
+        batches = [args[1].tolist()
+                   for args, _ in optimizer.update.call_args_list]
+        updater.finalize()
+        return batches, epochs, optimizer.epoch
+
+    def test_prefetch(self):
+        batches, epochs, epoch = self._run(True)
+        self.assertEqual(
+            batches, [[0, 1], [2, 3], [4, 5], [0, 1], [2, 3]])
+        self.assertEqual((batches, epochs, epoch), self._run(False))
+
+    def test_report_stall(self):
+        target = chainer.Link()
+        optimizer = DummyOptimizer()
+        optimizer.setup(target)
+        iterator = chainer.iterators.SerialIterator(self.dataset, 2)
+        updater = training.updaters.StandardUpdater(
+            iterator, optimizer, prefetch=True)
+
+        observation = {}
+        with chainer.Reporter().scope(observation):
+            updater.update()
+        self.assertIn('prefetch_stall', observation)
+        self.assertGreaterEqual(observation['prefetch_stall'], 0)
+        self.assertEqual(
+            updater.iterator_wait_time, observation['prefetch_stall'])
+        updater.finalize()
+
+    def test_iterator_wait_time(self):
+        target = chainer.Link()
+        optimizer = DummyOptimizer()
+        optimizer.setup(target)
+        iterator = chainer.iterators.SerialIterator(self.dataset, 2)
+        updater = training.updaters.StandardUpdater(iterator, optimizer)
+        self.assertIsNone(updater.iterator_wait_time)
+        updater.update()
+        self.assertGreaterEqual(updater.iterator_wait_time, 0)
+
+    def _create_updater(self, converter=convert.concat_examples,
+                        prefetch=True):
+        target = chainer.Link()
+        optimizer = DummyOptimizer()
+        optimizer.setup(target)
+        iterator = chainer.iterators.SerialIterator(
+            self.dataset, 2, shuffle=False)
+        updater = training.updaters.StandardUpdater(
+            iterator, optimizer, converter=converter, prefetch=prefetch)
+        return updater, optimizer
+
+    def _batches(self, optimizer):
+        return [args[1].tolist()
+                for args, _ in optimizer.update.call_args_list]
+
+    def check_resume(self, n_before, n_after, strict, resume_prefetch=True):
+        updater, optimizer = self._create_updater()
+        for _ in range(n_before + n_after):
+            updater.update()
+        expect = self._batches(optimizer)
+        updater.finalize()
+
+        updater, optimizer = self._create_updater()
+        for _ in range(n_before):
+            updater.update()
+        saved = {}
+        updater.serialize(chainer.serializers.DictionarySerializer(saved))
+        updater.finalize()
+
+        resumed, resumed_optimizer = self._create_updater(
+            prefetch=resume_prefetch)
+        resumed.serialize(
+            chainer.serializers.NpzDeserializer(saved, strict=strict))
+        self.assertEqual(resumed.iteration, n_before)
+        self.assertEqual(resumed.epoch_detail, updater.epoch_detail)
+        for _ in range(n_after):
+            resumed.update()
+        resumed.finalize()
+        self.assertEqual(
+            self._batches(optimizer) + self._batches(resumed_optimizer),
+            expect)
+
+    def test_resume(self):
+        for n_before in range(4):
+            self.check_resume(n_before, 4, True)
+
+    def test_resume_non_strict(self):
+        self.check_resume(2, 4, False)
+
+    def test_resume_without_prefetch(self):
+        for n_before in range(4):
+            self.check_resume(n_before, 4, True, resume_prefetch=False)
+
+    def test_serialize_without_prefetch(self):
+        updater, _ = self._create_updater(prefetch=False)
+        updater.update()
+        saved = {}
+        updater.serialize(chainer.serializers.DictionarySerializer(saved))
+        updater.finalize()
+        self.assertFalse(
+            [key for key in saved if key.startswith('prefetched/')])
+
+    def test_serialize_restored_batch_without_prefetch(self):
+        updater, optimizer = self._create_updater()
+        updater.update()
+        saved = {}
+        updater.serialize(chainer.serializers.DictionarySerializer(saved))
+        updater.finalize()
+
+        # The restored batch is kept until it is consumed.
+        resumed, _ = self._create_updater(prefetch=False)
+        resumed.serialize(chainer.serializers.NpzDeserializer(saved))
+        saved = {}
+        resumed.serialize(chainer.serializers.DictionarySerializer(saved))
+        resumed.finalize()
+
+        resumed, optimizer = self._create_updater(prefetch=False)
+        resumed.serialize(chainer.serializers.NpzDeserializer(saved))
+        resumed.update()
+        resumed.finalize()
+        self.assertEqual(self._batches(optimizer), [[2, 3]])
+
+    def test_resume_dict_batch(self):
+        def converter(batch, device):
+            return {'x': convert.concat_examples(batch, device)}
+
+        updater, _ = self._create_updater(converter)
+        updater.update()
+        saved = {}
+        updater.serialize(chainer.serializers.DictionarySerializer(saved))
+        updater.finalize()
+
+        resumed, optimizer = self._create_updater(converter)
+        resumed.serialize(chainer.serializers.NpzDeserializer(saved))
+        resumed.update()
+        resumed.finalize()
+        _, kwargs = optimizer.update.call_args
+        self.assertEqual(kwargs['x'].tolist(), [2, 3])
+
+    def test_batch_memory_reused_by_iterator(self):
+        # The converter returns views of a buffer reused for every batch, as
+        # with zero-copy iterators.
+        buf = numpy.empty(2, numpy.int64)
+
+        def converter(batch, device):
+            buf[:] = [int(x) for x in batch]
+            return buf[:]
+
+        updater, optimizer = self._create_updater(converter)
+        for _ in range(3):
+            updater.update()
+        updater.finalize()
+        self.assertEqual(
+            self._batches(optimizer), [[0, 1], [2, 3], [4, 5]])
+
 testing.run_module(__name__, __file__)